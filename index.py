@@ -1,185 +1,434 @@
 # ============================================================
 # 🚀 Job Applicant Matching System | AI-Powered Skill Matching
 # ============================================================
+#
+# Library usage:
+#     from index import ApplicantRecommender
+#     rec = ApplicantRecommender("datasets.csv")
+#     rec.recommend(0, top_n=5, method='bert')
+#
+# CLI usage:
+#     python index.py demo
+#     python index.py export -o recs.csv --top-n 10 --method bert
+#     python index.py export -o recs.parquet --select-role "Data Analyst"
 
 # ── Step 1: Import Libraries ─────────────────────────────────
+import argparse
+import hashlib
+import os
+import sys
+import time
+import warnings
+from functools import cached_property
+
 import numpy as np
 import pandas as pd
+from scipy import sparse
 from sklearn.feature_extraction.text import TfidfVectorizer, CountVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-import warnings
+from sklearn.preprocessing import normalize
 warnings.filterwarnings('ignore')
 
-# ── Step 2: Load Dataset ─────────────────────────────────────
-df = pd.read_csv("datasets.csv")
-
-# ── Step 3: Prepare Data ──────────────────────────────────────
-# Clean and prepare the dataset
-df['Resume'] = df['Resume'].fillna('')
-df['Job Roles'] = df['Job Roles'].fillna('')
-df['Job Description'] = df['Job Description'].fillna('')
-
-# ── Step 4: Build Hybrid Text Field ──────────────────────────
-# Combine resume, job roles, and job description for matching
-df['hybrid_text'] = (
-    df['Resume'] + ' ' +
-    df['Job Roles'] + ' ' +
-    df['Job Description']
-)
-
-sampled_df = df  # Use full dataset
-
-# ── Step 6: TF-IDF Similarity Matrix ─────────────────────────
-hybrid_vectorizer = TfidfVectorizer(stop_words='english')
-hybrid_matrix     = hybrid_vectorizer.fit_transform(sampled_df['hybrid_text'])
-hybrid_sim_matrix = cosine_similarity(hybrid_matrix, hybrid_matrix)
+DATASET_PATH    = 'datasets.csv'
+BERT_MODEL_NAME = 'all-MiniLM-L6-v2'
+BERT_CACHE_DIR  = 'bert_cache'
+METHODS         = ('tfidf', 'count', 'bert')
+
+
+# ── Step 2: BERT Embedding Cache ─────────────────────────────
+# Embeddings are cached on disk keyed by a hash of each row's hybrid text, so
+# only new or edited rows go through the model. Vectors are stored L2-normalized,
+# which makes a plain dot product equal to cosine similarity.
+def _row_hashes(texts):
+    return np.array([hashlib.sha1(t.encode('utf-8')).hexdigest() for t in texts], dtype='U40')
+
+
+def load_bert_embeddings(texts, model_name=BERT_MODEL_NAME, cache_dir=BERT_CACHE_DIR):
+    """Return a read-only memmap of normalized embeddings, encoding only uncached rows."""
+    os.makedirs(cache_dir, exist_ok=True)
+    prefix    = os.path.join(cache_dir, model_name.replace('/', '_'))
+    keys_path = prefix + '.keys.npy'
+    vecs_path = prefix + '.vecs.npy'
+    hashes    = _row_hashes(texts)
+
+    cached_keys, cached_vecs = np.array([], dtype='U40'), None
+    if os.path.exists(keys_path) and os.path.exists(vecs_path):
+        cached_keys = np.load(keys_path)
+        cached_vecs = np.load(vecs_path, mmap_mode='r')
+        if np.array_equal(cached_keys, hashes):
+            return cached_vecs
+
+    cached_rows = {key: row for row, key in enumerate(cached_keys)}
+    missing     = [i for i, key in enumerate(hashes) if key not in cached_rows]
+    print(f"BERT cache: {len(hashes) - len(missing)} cached, {len(missing)} to encode", file=sys.stderr)
+
+    new_vecs = None
+    if missing:
+        from sentence_transformers import SentenceTransformer
+        model    = SentenceTransformer(model_name)
+        new_vecs = model.encode([texts[i] for i in missing], show_progress_bar=True,
+                                normalize_embeddings=True).astype(np.float32)
+    if new_vecs is None and cached_vecs is None:
+        return np.empty((0, 0), dtype=np.float32)  # No rows and nothing cached
+    dim = new_vecs.shape[1] if new_vecs is not None else cached_vecs.shape[1]
+
+    tmp_path = prefix + '.vecs.tmp.npy'
+    out = np.lib.format.open_memmap(tmp_path, mode='w+', dtype=np.float32, shape=(len(hashes), dim))
+    new_rows = {i: j for j, i in enumerate(missing)}
+    for i, key in enumerate(hashes):
+        out[i] = new_vecs[new_rows[i]] if i in new_rows else cached_vecs[cached_rows[key]]
+    out.flush()
+    del out, cached_vecs
+
+    os.replace(tmp_path, vecs_path)
+    np.save(keys_path, hashes)
+    return np.load(vecs_path, mmap_mode='r')
+
+
+# ── Step 3: Top-N Selection ──────────────────────────────────
+def select_top_n(scores, candidates, top_n):
+    """Top-n (index, score) pairs among candidate row indices, best first."""
+    if len(candidates) > top_n:
+        candidates = candidates[np.argpartition(-scores[candidates], top_n - 1)[:top_n]]
+    candidates = candidates[np.argsort(-scores[candidates], kind='stable')]
+    return [(idx, scores[idx]) for idx in candidates]
+
+
+def _top_n_block(matrix, rows, top_n, candidate_mask=None):
+    """Top-n neighbours for a block of rows in one matrix product.
+
+    Returns (indices, scores), both shaped (len(rows), top_n) and sorted best
+    first. Excluded slots (self, filtered-out rows) carry a score of -inf.
+    """
+    sims = matrix[rows] @ matrix.T
+    sims = np.asarray(sims.toarray() if sparse.issparse(sims) else sims, dtype=np.float32)
+    if candidate_mask is not None:
+        sims[:, ~candidate_mask] = -np.inf
+    sims[np.arange(len(rows)), rows] = -np.inf
+
+    k   = min(top_n, sims.shape[1])
+    top = np.argpartition(-sims, k - 1, axis=1)[:, :k]
+    top_scores = np.take_along_axis(sims, top, axis=1)
+    order = np.argsort(-top_scores, axis=1, kind='stable')
+    return np.take_along_axis(top, order, axis=1), np.take_along_axis(top_scores, order, axis=1)
+
+
+# ── Step 4: Recommender ──────────────────────────────────────
+class ApplicantRecommender:
+    """
+    Applicant-to-applicant recommender over a resume dataset.
+
+    Nothing is loaded or fitted until first use: the CSV, the TF-IDF/count
+    matrices and the BERT embeddings are each built lazily on first access.
+    Similarities are computed per query row against L2-normalized matrices,
+    so no dense N×N similarity matrix is ever materialized.
+    """
+
+    def __init__(self, csv_path=DATASET_PATH, cache_dir=BERT_CACHE_DIR, model_name=BERT_MODEL_NAME):
+        self.csv_path   = csv_path
+        self.cache_dir  = cache_dir
+        self.model_name = model_name
+
+    @cached_property
+    def df(self):
+        df = pd.read_csv(self.csv_path)
+        # Clean and prepare the dataset
+        df['Resume'] = df['Resume'].fillna('')
+        df['Job Roles'] = df['Job Roles'].fillna('')
+        df['Job Description'] = df['Job Description'].fillna('')
+        # Combine resume, job roles, and job description for matching
+        df['hybrid_text'] = (
+            df['Resume'] + ' ' +
+            df['Job Roles'] + ' ' +
+            df['Job Description']
+        )
+        return df.reset_index(drop=True)
+
+    @cached_property
+    def tfidf_matrix(self):
+        # TfidfVectorizer rows are already L2-normalized
+        return TfidfVectorizer(stop_words='english').fit_transform(self.df['hybrid_text']).tocsr()
+
+    @cached_property
+    def count_matrix(self):
+        return normalize(CountVectorizer().fit_transform(self.df['hybrid_text'])).tocsr()
+
+    @cached_property
+    def bert_embeddings(self):
+        return load_bert_embeddings(self.df['hybrid_text'].tolist(), self.model_name, self.cache_dir)
+
+    def matrix(self, method='tfidf'):
+        if method not in METHODS:
+            raise ValueError(f"method must be one of {METHODS}, got {method!r}")
+        return {'tfidf': lambda: self.tfidf_matrix,
+                'count': lambda: self.count_matrix,
+                'bert':  lambda: self.bert_embeddings}[method]()
+
+    def similarities(self, applicant_index, method='tfidf'):
+        """Cosine similarity of one applicant against every row."""
+        matrix = self.matrix(method)
+        sims = matrix @ matrix[applicant_index].T
+        return np.asarray(sims.toarray() if sparse.issparse(sims) else sims).ravel()
+
+    def filter_mask(self, gender=None, age_range=None, job_role=None):
+        """Boolean mask over rows that satisfy every given filter."""
+        df   = self.df
+        mask = np.ones(len(df), dtype=bool)
+        if gender:
+            mask &= df['Gender'].astype(str).str.lower().str.contains(gender.lower(), regex=False).to_numpy()
+        if age_range:
+            min_age, max_age = age_range
+            mask &= df['Age'].between(min_age, max_age).to_numpy()
+        if job_role:
+            mask &= df['Job Roles'].astype(str).str.lower().str.contains(job_role.lower(), regex=False).to_numpy()
+        return mask
+
+    def find_by_role(self, role_keyword):
+        """Index of the first applicant whose role contains the keyword, or None."""
+        matches = np.flatnonzero(self.filter_mask(job_role=role_keyword))
+        return int(matches[0]) if len(matches) else None
+
+    def recommend(self, applicant_index, top_n=5, method='tfidf',
+                  gender=None, age_range=None, job_role=None):
+        """Top-n (index, score) pairs for one applicant, optionally filtered."""
+        mask = self.filter_mask(gender, age_range, job_role)
+        mask[applicant_index] = False
+        return select_top_n(self.similarities(applicant_index, method), np.flatnonzero(mask), top_n)
+
+    def iter_batch_recommendations(self, indices=None, top_n=5, method='tfidf',
+                                   chunk_size=256, n_jobs=-1, candidate_mask=None):
+        """
+        Yield recommendation DataFrames for many applicants, one per chunk.
+
+        Each chunk is scored with a single matrix product; chunks are spread
+        across worker processes and yielded in input order so callers can
+        stream them straight to disk.
+        """
+        from joblib import Parallel, delayed
+
+        matrix  = self.matrix(method)
+        indices = np.arange(len(self.df)) if indices is None else np.asarray(indices, dtype=np.int64)
+        chunks  = [indices[i:i + chunk_size] for i in range(0, len(indices), chunk_size)]
+
+        names = self.df['Job Applicant Name'].to_numpy()
+        info  = self.df[['Job Applicant Name', 'Age', 'Gender', 'Job Roles']]
+        results = Parallel(n_jobs=n_jobs, return_as='generator')(
+            delayed(_top_n_block)(matrix, rows, top_n, candidate_mask) for rows in chunks
+        )
+        for rows, (top, scores) in zip(chunks, results):
+            valid = np.isfinite(scores)
+            applicant = np.repeat(rows, top.shape[1]).reshape(top.shape)[valid]
+            matched   = top[valid]
+            out = info.iloc[matched].reset_index(drop=True).rename(columns={
+                'Job Applicant Name': 'Match Name', 'Job Roles': 'Job Role'})
+            out.insert(0, 'Applicant Index', applicant)
+            out.insert(1, 'Applicant Name', names[applicant])
+            out.insert(2, 'Rank', np.tile(np.arange(1, top.shape[1] + 1), (len(rows), 1))[valid])
+            out.insert(3, 'Match Index', matched)
+            out['Similarity Score'] = np.round(scores[valid], 4)
+            yield rows, out
+
+
+# ── Step 5: Batch Export ─────────────────────────────────────
+def export_recommendations(recommender, output, indices=None, top_n=5, method='tfidf',
+                           chunk_size=256, n_jobs=-1, candidate_mask=None, benchmark=False):
+    """Stream batch recommendations to CSV or Parquet (benchmark=True reports throughput)."""
+    parquet_writer = None
+    if output.endswith('.parquet'):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+    total = len(recommender.df) if indices is None else len(indices)
+    done, written = 0, 0
+    start = time.perf_counter()
+    try:
+        for rows, frame in recommender.iter_batch_recommendations(
+                indices, top_n, method, chunk_size, n_jobs, candidate_mask):
+            if output.endswith('.parquet'):
+                table = pa.Table.from_pandas(frame, preserve_index=False)
+                if parquet_writer is None:
+                    parquet_writer = pq.ParquetWriter(output, table.schema)
+                parquet_writer.write_table(table)
+            else:
+                frame.to_csv(output, mode='w' if done == 0 else 'a', header=done == 0, index=False)
+            done    += len(rows)
+            written += len(frame)
+            if benchmark:
+                elapsed = time.perf_counter() - start
+                print(f"\r{done}/{total} applicants | {done / elapsed:,.0f} rows/sec", end='', file=sys.stderr)
+    finally:
+        if parquet_writer is not None:
+            parquet_writer.close()
+
+    if benchmark:
+        elapsed = time.perf_counter() - start
+        print(f"\nWrote {written} recommendations for {done} applicants to {output} "
+              f"in {elapsed:.2f}s ({done / max(elapsed, 1e-9):,.0f} rows/sec)", file=sys.stderr)
+    else:
+        print(f"Wrote {written} recommendations for {done} applicants to {output}")
+
+
+# ── Step 6: Printing Helpers ─────────────────────────────────
+_default_recommender = None
+
+
+def get_recommender():
+    """Get or create the module-level recommender over DATASET_PATH"""
+    global _default_recommender
+    if _default_recommender is None:
+        _default_recommender = ApplicantRecommender(DATASET_PATH)
+    return _default_recommender
+
+
+def _print_matches(rec, matches, show_gender=False):
+    df = rec.df
+    for idx, score in matches:
+        print(f"Name:       {df.iloc[idx]['Job Applicant Name']}")
+        print(f"Age:        {df.iloc[idx]['Age']}")
+        if show_gender:
+            print(f"Gender:     {df.iloc[idx]['Gender']}")
+        print(f"Job Role:   {df.iloc[idx]['Job Roles']}")
+        print(f"Resume:     {df.iloc[idx]['Resume'][:100]}...")
+        print(f"Similarity: {score:.4f}\n")
 
-# ── Step 7: Count Vectorizer Similarity Matrix ───────────────
-alt_vectorizer = CountVectorizer()
-alt_matrix     = alt_vectorizer.fit_transform(sampled_df['hybrid_text'])
-alt_sim_matrix = cosine_similarity(alt_matrix, alt_matrix)
 
-# ── Step 8: Core Recommendation Functions ────────────────────
 def recommend_by_hybrid(applicant_index, top_n=5, method='tfidf'):
-    sim_matrix  = hybrid_sim_matrix if method == 'tfidf' else alt_sim_matrix
-    sim_scores  = sorted(enumerate(sim_matrix[applicant_index]), key=lambda x: x[1], reverse=True)
-    top_matches = sim_scores[1:top_n + 1]
-
-    print(f"Applicants similar to: {sampled_df.iloc[applicant_index]['Job Applicant Name']} ({method}-based)\n")
-    for idx, score in top_matches:
-        print(f"Name:       {sampled_df.iloc[idx]['Job Applicant Name']}")
-        print(f"Age:        {sampled_df.iloc[idx]['Age']}")
-        print(f"Job Role:   {sampled_df.iloc[idx]['Job Roles']}")
-        print(f"Resume:     {sampled_df.iloc[idx]['Resume'][:100]}...")
-        print(f"Similarity: {score:.4f}\n")
+    rec = get_recommender()
+    print(f"Applicants similar to: {rec.df.iloc[applicant_index]['Job Applicant Name']} ({method}-based)\n")
+    _print_matches(rec, rec.recommend(applicant_index, top_n, method))
 
 
 def recommend_by_job_role(role_keyword, top_n=5, method='tfidf'):
-    matches = sampled_df[sampled_df['Job Roles'].str.lower().str.contains(role_keyword.lower())]
-    if matches.empty:
+    rec = get_recommender()
+    applicant_index = rec.find_by_role(role_keyword)
+    if applicant_index is None:
         print("No matching job role found.")
         return
-    applicant_index = matches.index[0]
-    print(f"Found match: {sampled_df.iloc[applicant_index]['Job Applicant Name']} - {sampled_df.iloc[applicant_index]['Job Roles']} (Index: {applicant_index})\n")
+    print(f"Found match: {rec.df.iloc[applicant_index]['Job Applicant Name']} - {rec.df.iloc[applicant_index]['Job Roles']} (Index: {applicant_index})\n")
     recommend_by_hybrid(applicant_index, top_n, method)
 
 
-# ── Step 9: Filtered Recommendation Functions ────────────────
 def recommend_with_filters(applicant_index, top_n=5, method='tfidf',
                             gender=None, age_range=None, job_role=None):
-    sim_matrix   = hybrid_sim_matrix if method == 'tfidf' else alt_sim_matrix
-    sim_scores   = sorted(enumerate(sim_matrix[applicant_index]), key=lambda x: x[1], reverse=True)
-    filtered_applicants = []
-
-    for idx, score in sim_scores[1:]:
-        row = sampled_df.iloc[idx]
-        if gender and gender.lower() not in str(row['Gender']).lower():
-            continue
-        if age_range:
-            min_age, max_age = age_range
-            if not (min_age <= row['Age'] <= max_age):
-                continue
-        if job_role and job_role.lower() not in str(row['Job Roles']).lower():
-            continue
-        filtered_applicants.append((idx, score))
-        if len(filtered_applicants) == top_n:
-            break
+    rec = get_recommender()
+    filtered_applicants = rec.recommend(applicant_index, top_n, method, gender, age_range, job_role)
 
     if not filtered_applicants:
         print("No applicants found matching your filters.")
         return
 
-    print(f"Applicants similar to: {sampled_df.iloc[applicant_index]['Job Applicant Name']} ({method}-based) with filters\n")
-    for idx, score in filtered_applicants:
-        print(f"Name:       {sampled_df.iloc[idx]['Job Applicant Name']}")
-        print(f"Age:        {sampled_df.iloc[idx]['Age']}")
-        print(f"Gender:     {sampled_df.iloc[idx]['Gender']}")
-        print(f"Job Role:   {sampled_df.iloc[idx]['Job Roles']}")
-        print(f"Resume:     {sampled_df.iloc[idx]['Resume'][:100]}...")
-        print(f"Similarity: {score:.4f}\n")
+    print(f"Applicants similar to: {rec.df.iloc[applicant_index]['Job Applicant Name']} ({method}-based) with filters\n")
+    _print_matches(rec, filtered_applicants, show_gender=True)
 
 
 def recommend_with_filters_by_role(job_role, top_n=5, method='tfidf',
                                      gender=None, age_range=None, filter_role=None):
-    matches = sampled_df[sampled_df['Job Roles'].str.lower().str.contains(job_role.lower())]
-    if matches.empty:
+    rec = get_recommender()
+    applicant_index = rec.find_by_role(job_role)
+    if applicant_index is None:
         print("No matching job role found.")
         return
-    applicant_index = matches.index[0]
-    print(f"Found match: {sampled_df.iloc[applicant_index]['Job Applicant Name']} (Index: {applicant_index})\n")
+    print(f"Found match: {rec.df.iloc[applicant_index]['Job Applicant Name']} (Index: {applicant_index})\n")
     recommend_with_filters(applicant_index, top_n, method, gender, age_range, filter_role)
 
 
-# ── Step 10: Export Recommendations ──────────────────────────
 def save_recommendations_to_csv(applicant_index, top_n=5, method='tfidf',
                                   filename='recommended_applicants.csv'):
-    sim_matrix = hybrid_sim_matrix if method == 'tfidf' else alt_sim_matrix
-    sim_scores = sorted(enumerate(sim_matrix[applicant_index]), key=lambda x: x[1], reverse=True)
-    top_matches = sim_scores[1:top_n + 1]
-
+    rec = get_recommender()
+    df  = rec.df
     recs = [{
-        'Name':             sampled_df.iloc[idx]['Job Applicant Name'],
-        'Age':              sampled_df.iloc[idx]['Age'],
-        'Gender':           sampled_df.iloc[idx]['Gender'],
-        'Job Role':         sampled_df.iloc[idx]['Job Roles'],
-        'Resume':           sampled_df.iloc[idx]['Resume'],
-        'Similarity Score': round(score, 4)
-    } for idx, score in top_matches]
+        'Name':             df.iloc[idx]['Job Applicant Name'],
+        'Age':              df.iloc[idx]['Age'],
+        'Gender':           df.iloc[idx]['Gender'],
+        'Job Role':         df.iloc[idx]['Job Roles'],
+        'Resume':           df.iloc[idx]['Resume'],
+        'Similarity Score': round(float(score), 4)
+    } for idx, score in rec.recommend(applicant_index, top_n, method)]
 
     pd.DataFrame(recs).to_csv(filename, index=False)
     print(f"Top {top_n} recommendations saved to {filename}")
 
 
-# ── Step 11: BERT Semantic Recommender ───────────────────────
-from sentence_transformers import SentenceTransformer
-
-bert_model       = SentenceTransformer('all-MiniLM-L6-v2')
-bert_embeddings  = bert_model.encode(sampled_df['hybrid_text'].tolist(), show_progress_bar=True)
-bert_sim_matrix  = cosine_similarity(bert_embeddings, bert_embeddings)
-
-
 def recommend_by_bert(applicant_index, top_n=5):
-    sim_scores = sorted(enumerate(bert_sim_matrix[applicant_index]), key=lambda x: x[1], reverse=True)
-    top_matches = sim_scores[1:top_n + 1]
-
-    print(f"Applicants similar to: {sampled_df.iloc[applicant_index]['Job Applicant Name']} (BERT-based)\n")
-    for idx, score in top_matches:
-        print(f"Name:       {sampled_df.iloc[idx]['Job Applicant Name']}")
-        print(f"Age:        {sampled_df.iloc[idx]['Age']}")
-        print(f"Job Role:   {sampled_df.iloc[idx]['Job Roles']}")
-        print(f"Resume:     {sampled_df.iloc[idx]['Resume'][:100]}...")
-        print(f"Similarity: {score:.4f}\n")
+    recommend_by_hybrid(applicant_index, top_n, method='bert')
 
 
 def recommend_by_bert_role(role_keyword, top_n=5):
-    matches = sampled_df[sampled_df['Job Roles'].str.lower().str.contains(role_keyword.lower())]
-    if matches.empty:
-        print("No matching job role found.")
+    recommend_by_job_role(role_keyword, top_n, method='bert')
+
+
+# ── Step 7: Demo Calls ───────────────────────────────────────
+def run_demo():
+    print("=" * 60)
+    print("Job Applicant Matching System")
+    print("=" * 60)
+
+    # Example 1: Find similar applicants to a Software Engineer
+    recommend_by_job_role("Software Engineer", top_n=5, method='tfidf')
+
+    # Example 2: Find similar applicants using Count Vectorizer
+    recommend_by_job_role("Data Analyst", top_n=5, method='count')
+
+    # Example 3: Find similar applicants with filters
+    recommend_with_filters_by_role(
+        job_role="Manager", top_n=5, method='tfidf',
+        gender="Female", age_range=(30, 50)
+    )
+
+    # Example 4: BERT-based recommendations
+    recommend_by_bert_role("Cybersecurity Analyst", top_n=5)
+
+    # Example 5: Save recommendations to CSV
+    # save_recommendations_to_csv(0, top_n=5, method='tfidf')
+
+
+# ── Step 8: Command Line Interface ───────────────────────────
+def main(argv=None):
+    global DATASET_PATH
+
+    parser = argparse.ArgumentParser(description="Job applicant matching system")
+    parser.add_argument('--dataset', default=DATASET_PATH, help="Path to the applicants CSV")
+    sub = parser.add_subparsers(dest='command')
+    sub.add_parser('demo', help="Print the example recommendations (default)")
+
+    export = sub.add_parser('export', help="Compute top-n for many applicants and stream to CSV/Parquet")
+    export.add_argument('-o', '--output', required=True, help="Output file (.csv or .parquet)")
+    export.add_argument('--top-n', type=int, default=5)
+    export.add_argument('--method', choices=METHODS, default='tfidf')
+    export.add_argument('--indices', help="Comma-separated applicant indices (default: all)")
+    export.add_argument('--select-role', help="Only export applicants whose role contains this keyword")
+    export.add_argument('--gender', help="Only recommend applicants of this gender")
+    export.add_argument('--min-age', type=int)
+    export.add_argument('--max-age', type=int)
+    export.add_argument('--role', help="Only recommend applicants whose role contains this keyword")
+    export.add_argument('--chunk-size', type=int, default=256, help="Applicants scored per matrix product")
+    export.add_argument('-j', '--jobs', type=int, default=-1, help="Worker processes (default: all cores)")
+    export.add_argument('--benchmark', action='store_true', help="Report progress and rows/sec on stderr")
+    args = parser.parse_args(argv)
+
+    DATASET_PATH = args.dataset
+    if args.command != 'export':
+        run_demo()
         return
-    applicant_index = matches.index[0]
-    print(f"Found match: {sampled_df.iloc[applicant_index]['Job Applicant Name']} (Index: {applicant_index})\n")
-    recommend_by_bert(applicant_index, top_n)
-
-
-# ── Step 12: Demo Calls ───────────────────────────────────────
-print("=" * 60)
-print("Job Applicant Matching System")
-print("=" * 60)
 
-# Example 1: Find similar applicants to a Software Engineer
-recommend_by_job_role("Software Engineer", top_n=5, method='tfidf')
+    rec = ApplicantRecommender(args.dataset)
+    indices = None
+    if args.indices:
+        indices = [int(i) for i in args.indices.split(',') if i.strip()]
+    if args.select_role:
+        selected = np.flatnonzero(rec.filter_mask(job_role=args.select_role))
+        indices = selected if indices is None else np.intersect1d(indices, selected)
 
-# Example 2: Find similar applicants using Count Vectorizer
-recommend_by_job_role("Data Analyst", top_n=5, method='count')
+    age_range = None
+    if args.min_age is not None or args.max_age is not None:
+        age_range = (args.min_age if args.min_age is not None else -np.inf,
+                     args.max_age if args.max_age is not None else np.inf)
+    candidate_mask = None
+    if args.gender or age_range or args.role:
+        candidate_mask = rec.filter_mask(args.gender, age_range, args.role)
 
-# Example 3: Find similar applicants with filters
-recommend_with_filters_by_role(
-    job_role="Manager", top_n=5, method='tfidf',
-    gender="Female", age_range=(30, 50)
-)
+    export_recommendations(rec, args.output, indices, args.top_n, args.method,
+                           args.chunk_size, args.jobs, candidate_mask, args.benchmark)
 
-# Example 4: BERT-based recommendations
-recommend_by_bert_role("Cybersecurity Analyst", top_n=5)
 
-# Example 5: Save recommendations to CSV
-# save_recommendations_to_csv(0, top_n=5, method='tfidf')
+if __name__ == '__main__':
+    main()
@@ -2,6 +2,7 @@
 Configuration settings for ILEAP API
 Handles environment variables and path configuration
 """
+import multiprocessing
 import os
 from pathlib import Path
 from dotenv import load_dotenv
@@ -40,6 +41,21 @@ DATABASE_URL = os.getenv("DATABASE_URL")
 if not DATABASE_URL:
     raise ValueError("DATABASE_URL environment variable is required")
 
+# Gunicorn worker processes (gunicorn.conf.py); also used for the connection budget
+# reported by /health/db-pool
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+
+# Connection pool (per process and per engine - with gunicorn, each worker has its own
+# sync and async pools, so Postgres sees up to
+# WEB_CONCURRENCY * 2 * (DB_POOL_SIZE + DB_MAX_OVERFLOW) connections)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))  # Seconds to wait for a free connection
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))  # Seconds before a connection is replaced
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "True").lower() == "true"
+DB_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "30000"))  # 0 disables
+DB_APPLICATION_NAME = os.getenv("DB_APPLICATION_NAME", "ileap-fastapi")
+
 # JWT configuration
 JWT_SECRET_KEY = os.getenv("JWT_SECRET") or os.getenv("SECRET_KEY")
 if not JWT_SECRET_KEY:
@@ -75,6 +91,38 @@ API_HOST = os.getenv("API_HOST", "0.0.0.0")
 API_PORT = int(os.getenv("PORT", os.getenv("API_PORT", "3000")))
 DEBUG = os.getenv("DEBUG", "False").lower() == "true"
 
+# Sentence model inference backend: "torch" (default) or "onnx"
+# "onnx" runs an int8-quantized export with ONNX Runtime and falls back to
+# PyTorch if onnxruntime is not installed. Check accuracy with:
+#   python -m ml_models.onnx_encoder --check
+SENTENCE_BACKEND = os.getenv("SENTENCE_BACKEND", "torch").lower()
+
+# Sentence model micro-batching
+# Concurrent encode() calls are merged into one forward pass of up to
+# ENCODE_BATCH_MAX_SIZE texts, waiting at most ENCODE_BATCH_MAX_WAIT_MS.
+# Off by default: it only pays off under concurrent load, and every request
+# waits up to ENCODE_BATCH_MAX_WAIT_MS for others to join it
+ENCODE_MICRO_BATCHING = os.getenv("ENCODE_MICRO_BATCHING", "False").lower() == "true"
+ENCODE_BATCH_MAX_SIZE = int(os.getenv("ENCODE_BATCH_MAX_SIZE", "64"))
+ENCODE_BATCH_MAX_WAIT_MS = float(os.getenv("ENCODE_BATCH_MAX_WAIT_MS", "5"))
+
+# Two-stage matching cascade
+# When enabled, internships are pre-ranked by skill overlap + TF-IDF and only the
+# top MATCH_CANDIDATE_POOL_SIZE go through the sentence model
+MATCH_CASCADE = os.getenv("MATCH_CASCADE", "False").lower() == "true"
+MATCH_CANDIDATE_POOL_SIZE = int(os.getenv("MATCH_CANDIDATE_POOL_SIZE", "300"))
+
+# Dashboard rollups (see utils/dashboard_rollups.py)
+# One worker (the holder of the refresher advisory lock) refreshes the rollups every
+# DASHBOARD_ROLLUP_REFRESH_SECONDS (0 disables the loop, e.g. when a cron job runs
+# `python -m utils.dashboard_rollups` instead);
+# at most every DASHBOARD_ROLLUP_FULL_REFRESH_SECONDS the refresh rebuilds everything
+DASHBOARD_ROLLUP_REFRESH_SECONDS = float(os.getenv("DASHBOARD_ROLLUP_REFRESH_SECONDS", "60"))
+DASHBOARD_ROLLUP_FULL_REFRESH_SECONDS = float(os.getenv("DASHBOARD_ROLLUP_FULL_REFRESH_SECONDS", "3600"))
+
+# Job Placement dashboard statistics are cached per industry filter for this long (0 disables)
+JP_DASHBOARD_CACHE_SECONDS = float(os.getenv("JP_DASHBOARD_CACHE_SECONDS", "30"))
+
 def get_upload_path(category: str, *parts) -> Path:
     """
     Get upload path for a specific category
@@ -1,16 +1,15 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import func, case, and_, or_, extract
+from sqlalchemy import func, select
 from models import (
-    Student, InternshipApplication, Internship, Employer, 
-    Industry, Campus, Program, Department, Class, ClassEnrollment,
-    TraineeSupervisor, StudentSupervisorAssignment
+    InternshipApplication, Internship, Employer, Industry, Campus, Program,
+    DashboardApplicationRollup, DashboardProgramRollup
 )
+from utils.dashboard_rollups import ensure_dashboard_rollups
 from typing import Optional
 from datetime import datetime
 
 
-def get_dashboard_statistics(
-    db: Session,
+def _rollup_filters(
     campus_id: Optional[int] = None,
     program_id: Optional[int] = None,
     industry_id: Optional[int] = None,
@@ -19,207 +18,91 @@ def get_dashboard_statistics(
     company_id: Optional[int] = None,
     location: Optional[str] = None
 ):
-    """Get comprehensive dashboard statistics with filters"""
-    
-    # Base query for applications
-    base_query = db.query(InternshipApplication).join(
-        Student, InternshipApplication.student_id == Student.student_id
-    ).join(
-        Internship, InternshipApplication.internship_id == Internship.internship_id
-    ).join(
-        Employer, Internship.employer_id == Employer.employer_id
-    )
-    
-    # Apply filters
+    """Conditions on DashboardApplicationRollup for the given filters"""
     filters = []
-    
     if campus_id:
-        filters.append(
-            Student.student_id.in_(
-                db.query(Student.student_id)
-                .join(ClassEnrollment, Student.student_id == ClassEnrollment.student_id)
-                .join(Class, ClassEnrollment.class_id == Class.class_id)
-                .join(Program, Class.program_id == Program.program_id)
-                .join(Department, Program.department_id == Department.department_id)
-                .filter(Department.campus_id == campus_id)
-                .subquery()
-            )
-        )
-    
+        filters.append(DashboardApplicationRollup.campus_id == campus_id)
     if program_id:
-        filters.append(
-            Student.student_id.in_(
-                db.query(Student.student_id)
-                .join(ClassEnrollment, Student.student_id == ClassEnrollment.student_id)
-                .join(Class, ClassEnrollment.class_id == Class.class_id)
-                .filter(Class.program_id == program_id)
-                .subquery()
-            )
-        )
-    
+        filters.append(DashboardApplicationRollup.program_id == program_id)
     if industry_id:
-        filters.append(Employer.industry_id == industry_id)
-    
+        filters.append(DashboardApplicationRollup.industry_id == industry_id)
     if company_id:
-        filters.append(Employer.employer_id == company_id)
-    
+        filters.append(DashboardApplicationRollup.employer_id == company_id)
     if location:
-        filters.append(Employer.address.ilike(f"%{location}%"))
-    
+        filters.append(DashboardApplicationRollup.employer_id.in_(
+            select(Employer.employer_id).where(Employer.address.ilike(f"%{location}%"))
+        ))
     if semester:
-        filters.append(InternshipApplication.semester == semester)
-    
+        filters.append(DashboardApplicationRollup.semester == semester)
     if school_year:
-        filters.append(InternshipApplication.school_year == school_year)
-    
-    if filters:
-        base_query = base_query.filter(and_(*filters))
-    
-    # Define valid enrolled statuses (all possible variations)
-    enrolled_statuses = [
-        "accepted", "hired", "ongoing", "on_hold", "on hold",
-        "Accepted", "Hired", "Ongoing", "On Hold", "On_Hold"
-    ]
-    
-    # Total interns (accepted or hired applications - exclude pending/rejected)
-    total_interns = base_query.filter(
-        InternshipApplication.status.in_(enrolled_statuses)
-    ).count()
-    
-    # Total companies with accepted interns
-    total_companies = db.query(func.count(func.distinct(Employer.employer_id))).select_from(
-        InternshipApplication
-    ).join(
-        Internship, InternshipApplication.internship_id == Internship.internship_id
-    ).join(
-        Employer, Internship.employer_id == Employer.employer_id
-    ).filter(
-        InternshipApplication.status.in_(enrolled_statuses)
-    )
-    
-    if filters:
-        query_temp = db.query(Employer.employer_id).join(
-            Internship, Employer.employer_id == Internship.employer_id
-        ).join(
-            InternshipApplication, Internship.internship_id == InternshipApplication.internship_id
-        ).join(
-            Student, InternshipApplication.student_id == Student.student_id
-        )
-        
-        if filters:
-            query_temp = query_temp.filter(and_(*filters))
-        
-        query_temp = query_temp.filter(InternshipApplication.status.in_(enrolled_statuses))
-        total_companies = query_temp.distinct().count()
-    else:
-        total_companies = total_companies.scalar()
-    
-    # Evaluated interns (check if evaluation/completion tracking exists)
-    # For now, we can use ojt_start_date and a time-based completion estimate
-    # or check for specific evaluation records if they exist
-    try:
-        from models import StudentEvaluation
-        evaluated_query = base_query.join(
-            StudentEvaluation, 
-            InternshipApplication.student_id == StudentEvaluation.student_id
-        ).filter(
-            InternshipApplication.status.in_(enrolled_statuses),
-            StudentEvaluation.evaluation_status == "completed"
-        )
-        evaluated_interns = evaluated_query.count()
-    except:
-        # If StudentEvaluation doesn't exist, count based on completion status
-        # Assume students with ojt_start_date older than 6 months are evaluated
-        evaluated_interns = 0
-    
-    # Pending evaluations
+        filters.append(DashboardApplicationRollup.school_year == school_year)
+    return filters
+
+
+def get_dashboard_statistics(
+    db: Session,
+    campus_id: Optional[int] = None,
+    program_id: Optional[int] = None,
+    industry_id: Optional[int] = None,
+    semester: Optional[str] = None,
+    school_year: Optional[str] = None,
+    company_id: Optional[int] = None,
+    location: Optional[str] = None
+):
+    """
+    Get comprehensive dashboard statistics with filters
+
+    Application counts come from the dashboard rollup tables (see
+    utils/dashboard_rollups.py), so they can lag behind by one refresh
+    interval; "refreshed_at" in the response says how current they are.
+    """
+    refreshed_at = ensure_dashboard_rollups(db)
+
+    rollup = DashboardApplicationRollup
+    interns = func.coalesce(func.sum(rollup.application_count), 0)
+
+    # Totals with every filter applied
+    total_interns, total_companies = db.query(
+        interns,
+        func.count(func.distinct(rollup.employer_id))
+    ).filter(*_rollup_filters(
+        campus_id, program_id, industry_id, semester, school_year, company_id, location
+    )).one()
+    
+    # Evaluations are not tracked yet, so every intern is pending evaluation
+    evaluated_interns = 0
     pending_evaluations = total_interns - evaluated_interns
     
     # Interns by campus
-    campus_stats_query = db.query(
+    campus_stats = db.query(
         Campus.campus_name,
-        func.count(InternshipApplication.application_id).label('count')
-    ).select_from(Student).outerjoin(
-        ClassEnrollment, Student.student_id == ClassEnrollment.student_id
-    ).outerjoin(
-        Class, ClassEnrollment.class_id == Class.class_id
-    ).outerjoin(
-        Program, Class.program_id == Program.program_id
-    ).outerjoin(
-        Department, Program.department_id == Department.department_id
-    ).outerjoin(
-        Campus, Department.campus_id == Campus.campus_id
-    ).join(
-        InternshipApplication, Student.student_id == InternshipApplication.student_id
-    ).filter(
-        InternshipApplication.status.in_(enrolled_statuses)
-    )
-    
-    if semester:
-        campus_stats_query = campus_stats_query.filter(InternshipApplication.semester == semester)
-    if school_year:
-        campus_stats_query = campus_stats_query.filter(InternshipApplication.school_year == school_year)
-    if program_id:
-        campus_stats_query = campus_stats_query.filter(Program.program_id == program_id)
-    
-    campus_stats = campus_stats_query.group_by(Campus.campus_name).all()
+        interns
+    ).select_from(rollup).outerjoin(
+        Campus, rollup.campus_id == Campus.campus_id
+    ).filter(*_rollup_filters(
+        program_id=program_id, semester=semester, school_year=school_year
+    )).group_by(Campus.campus_name).all()
     
     # Interns by program
-    program_stats_query = db.query(
+    program_stats = db.query(
         Program.program_name,
-        func.count(InternshipApplication.application_id).label('count')
-    ).select_from(Student).outerjoin(
-        ClassEnrollment, Student.student_id == ClassEnrollment.student_id
-    ).outerjoin(
-        Class, ClassEnrollment.class_id == Class.class_id
-    ).outerjoin(
-        Program, Class.program_id == Program.program_id
-    ).join(
-        InternshipApplication, Student.student_id == InternshipApplication.student_id
-    ).filter(
-        InternshipApplication.status.in_(enrolled_statuses)
-    )
-    
-    if campus_id:
-        program_stats_query = program_stats_query.join(
-            Department, Program.department_id == Department.department_id
-        ).filter(Department.campus_id == campus_id)
-    
-    if semester:
-        program_stats_query = program_stats_query.filter(InternshipApplication.semester == semester)
-    if school_year:
-        program_stats_query = program_stats_query.filter(InternshipApplication.school_year == school_year)
-    
-    program_stats = program_stats_query.group_by(Program.program_name).all()
-    
-    # OJT completion by program (based on current data)
-    completion_stats_query = db.query(
+        interns
+    ).select_from(rollup).outerjoin(
+        Program, rollup.program_id == Program.program_id
+    ).filter(*_rollup_filters(
+        campus_id=campus_id, semester=semester, school_year=school_year
+    )).group_by(Program.program_name).all()
+    
+    # OJT completion by program (interns with a start date)
+    started = func.sum(rollup.started_count)
+    completion_stats = db.query(
         Program.program_name,
-        func.count(InternshipApplication.application_id).label('total')
-    ).select_from(Student).join(
-        ClassEnrollment, Student.student_id == ClassEnrollment.student_id
-    ).join(
-        Class, ClassEnrollment.class_id == Class.class_id
-    ).join(
-        Program, Class.program_id == Program.program_id
-    ).join(
-        InternshipApplication, Student.student_id == InternshipApplication.student_id
-    ).filter(
-        InternshipApplication.status.in_(enrolled_statuses),
-        InternshipApplication.ojt_start_date.isnot(None)
-    )
-    
-    if campus_id:
-        completion_stats_query = completion_stats_query.join(
-            Department, Program.department_id == Department.department_id
-        ).filter(Department.campus_id == campus_id)
-    
-    if semester:
-        completion_stats_query = completion_stats_query.filter(InternshipApplication.semester == semester)
-    if school_year:
-        completion_stats_query = completion_stats_query.filter(InternshipApplication.school_year == school_year)
-    
-    completion_stats = completion_stats_query.group_by(Program.program_name).all()
+        started
+    ).select_from(rollup).join(
+        Program, rollup.program_id == Program.program_id
+    ).filter(*_rollup_filters(
+        campus_id=campus_id, semester=semester, school_year=school_year
+    )).group_by(Program.program_name).having(started > 0).all()
     
     # Internship listings by industry
     industry_stats = db.query(
@@ -232,121 +115,39 @@ def get_dashboard_statistics(
     ).group_by(Industry.industry_name).all()
     
     # Top companies with most interns
-    top_companies_query = db.query(
+    top_companies = db.query(
         Employer.company_name,
-        func.count(InternshipApplication.application_id).label('count')
-    ).join(
-        Internship, Employer.employer_id == Internship.employer_id
-    ).join(
-        InternshipApplication, Internship.internship_id == InternshipApplication.internship_id
-    ).filter(
-        InternshipApplication.status.in_(enrolled_statuses)
-    )
-    
-    if campus_id or program_id or semester or school_year:
-        top_companies_query = top_companies_query.join(
-            Student, InternshipApplication.student_id == Student.student_id
-        )
-        
-        if campus_id:
-            top_companies_query = top_companies_query.join(
-                ClassEnrollment, Student.student_id == ClassEnrollment.student_id
-            ).join(
-                Class, ClassEnrollment.class_id == Class.class_id
-            ).join(
-                Program, Class.program_id == Program.program_id
-            ).join(
-                Department, Program.department_id == Department.department_id
-            ).filter(Department.campus_id == campus_id)
-        
-        if semester:
-            top_companies_query = top_companies_query.filter(InternshipApplication.semester == semester)
-        if school_year:
-            top_companies_query = top_companies_query.filter(InternshipApplication.school_year == school_year)
-    
-    top_companies = top_companies_query.group_by(
+        interns
+    ).select_from(rollup).join(
+        Employer, rollup.employer_id == Employer.employer_id
+    ).filter(*_rollup_filters(
+        campus_id=campus_id, semester=semester, school_year=school_year
+    )).group_by(
         Employer.company_name
     ).order_by(
-        func.count(InternshipApplication.application_id).desc()
+        interns.desc()
     ).limit(5).all()
     
     # Program opportunity mismatch (students vs opportunities)
     program_mismatch_query = db.query(
         Program.program_name,
-        func.count(func.distinct(Student.student_id)).label('student_count'),
-        func.count(func.distinct(Internship.internship_id)).label('opportunity_count')
-    ).select_from(Program).outerjoin(
-        Class, Program.program_id == Class.program_id
-    ).outerjoin(
-        ClassEnrollment, Class.class_id == ClassEnrollment.class_id
-    ).outerjoin(
-        Student, ClassEnrollment.student_id == Student.student_id
-    ).outerjoin(
-        InternshipApplication, Student.student_id == InternshipApplication.student_id
-    ).outerjoin(
-        Internship, InternshipApplication.internship_id == Internship.internship_id
+        func.sum(DashboardProgramRollup.student_count),
+        func.sum(DashboardProgramRollup.opportunity_count)
+    ).join(
+        DashboardProgramRollup, Program.program_id == DashboardProgramRollup.program_id
     )
-    
     if campus_id:
-        program_mismatch_query = program_mismatch_query.join(
-            Department, Program.department_id == Department.department_id
-        ).filter(Department.campus_id == campus_id)
-    
+        program_mismatch_query = program_mismatch_query.filter(DashboardProgramRollup.campus_id == campus_id)
     program_mismatch = program_mismatch_query.group_by(Program.program_name).all()
     
-    # Monthly OJT engagement (applications over months)
-    monthly_engagement_query = db.query(
-        extract('month', InternshipApplication.created_at).label('month'),
-        func.count(InternshipApplication.application_id).label('count')
-    ).join(
-        Student, InternshipApplication.student_id == Student.student_id
-    ).join(
-        Internship, InternshipApplication.internship_id == Internship.internship_id
-    ).join(
-        Employer, Internship.employer_id == Employer.employer_id
+    # Monthly OJT engagement (applications over months of this year)
+    monthly_data = db.query(
+        rollup.created_month,
+        interns
     ).filter(
-        InternshipApplication.status.in_(enrolled_statuses),
-        extract('year', InternshipApplication.created_at) == datetime.now().year
-    )
-    
-    # Apply the same filters as base_query
-    if campus_id:
-        monthly_engagement_query = monthly_engagement_query.join(
-            ClassEnrollment, Student.student_id == ClassEnrollment.student_id
-        ).join(
-            Class, ClassEnrollment.class_id == Class.class_id
-        ).join(
-            Program, Class.program_id == Program.program_id
-        ).join(
-            Department, Program.department_id == Department.department_id
-        ).filter(Department.campus_id == campus_id)
-    
-    if program_id:
-        if not campus_id:  # Only join if not already joined
-            monthly_engagement_query = monthly_engagement_query.join(
-                ClassEnrollment, Student.student_id == ClassEnrollment.student_id
-            ).join(
-                Class, ClassEnrollment.class_id == Class.class_id
-            )
-        monthly_engagement_query = monthly_engagement_query.filter(Class.program_id == program_id)
-    
-    if industry_id:
-        monthly_engagement_query = monthly_engagement_query.filter(Employer.industry_id == industry_id)
-    
-    if company_id:
-        monthly_engagement_query = monthly_engagement_query.filter(Employer.employer_id == company_id)
-    
-    if location:
-        monthly_engagement_query = monthly_engagement_query.filter(Employer.address.ilike(f"%{location}%"))
-    
-    if semester:
-        monthly_engagement_query = monthly_engagement_query.filter(InternshipApplication.semester == semester)
-    if school_year:
-        monthly_engagement_query = monthly_engagement_query.filter(InternshipApplication.school_year == school_year)
-    
-    monthly_data = monthly_engagement_query.group_by(
-        extract('month', InternshipApplication.created_at)
-    ).all()
+        rollup.created_year == datetime.now().year,
+        *_rollup_filters(campus_id, program_id, industry_id, semester, school_year, company_id, location)
+    ).group_by(rollup.created_month).all()
     
     return {
         "status": "SUCCESS",
@@ -393,7 +194,8 @@ def get_dashboard_statistics(
             "monthly_engagement": [
                 {"month": int(month), "count": count}
                 for month, count in monthly_data
-            ]
+            ],
+            "refreshed_at": refreshed_at.isoformat() if refreshed_at else None
         },
         "message": "Dashboard statistics fetched successfully"
     }
@@ -1,20 +1,159 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-import os
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+import threading
+import time
 from dotenv import load_dotenv
+from config import (
+    DATABASE_URL, DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_TIMEOUT, DB_POOL_RECYCLE,
+    DB_POOL_PRE_PING, DB_STATEMENT_TIMEOUT_MS, DB_APPLICATION_NAME
+)
+from utils.metrics import Histogram
 
 load_dotenv()
 
-# Database URL - use DATABASE_URL from .env directly (includes SSL params)
-DATABASE_URL = os.getenv('DATABASE_URL')
+# Checkout wait histogram bucket upper bounds (milliseconds)
+CHECKOUT_WAIT_MS_BUCKETS = (0.1, 0.5, 1, 5, 10, 50, 100, 500, 1000, 5000)
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that records checkout wait time, overflow and timeouts"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkout_wait_histogram = Histogram(CHECKOUT_WAIT_MS_BUCKETS)
+        self.overflow_checkouts = 0  # Checkouts served by an overflow connection
+        self.checkout_timeouts = 0
+        self.peak_checked_out = 0
+        self._stats_lock = threading.Lock()
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            with self._stats_lock:
+                self.checkout_timeouts += 1
+            raise
+        self.checkout_wait_histogram.observe((time.perf_counter() - started) * 1000.0)
+        with self._stats_lock:
+            if self.overflow() > 0:
+                self.overflow_checkouts += 1
+            self.peak_checked_out = max(self.peak_checked_out, self.checkedout())
+        return connection
+
+    def recreate(self):
+        # Keep counters when the pool is recreated (e.g. engine.dispose())
+        new_pool = super().recreate()
+        new_pool.checkout_wait_histogram = self.checkout_wait_histogram
+        new_pool.overflow_checkouts = self.overflow_checkouts
+        new_pool.checkout_timeouts = self.checkout_timeouts
+        new_pool.peak_checked_out = self.peak_checked_out
+        return new_pool
+
+
+class InstrumentedAsyncQueuePool(InstrumentedQueuePool, AsyncAdaptedQueuePool):
+    """InstrumentedQueuePool for the asyncio engine"""
+
+
+def create_db_engine(url: str = DATABASE_URL):
+    """Create the engine with pool settings, statement timeout and application_name from config"""
+    if url.startswith("sqlite"):
+        return create_engine(url)
+
+    options = []
+    if DB_STATEMENT_TIMEOUT_MS > 0:
+        options.append(f"-c statement_timeout={DB_STATEMENT_TIMEOUT_MS}")
+
+    connect_args = {"application_name": DB_APPLICATION_NAME}
+    if options:
+        connect_args["options"] = " ".join(options)
+
+    return create_engine(
+        url,
+        poolclass=InstrumentedQueuePool,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_pre_ping=DB_POOL_PRE_PING,
+        connect_args=connect_args
+    )
+
+
+def create_async_db_engine(url: str = DATABASE_URL):
+    """
+    Async counterpart of create_db_engine (asyncpg driver, same pool settings)
+
+    postgresql:// URLs are switched to postgresql+asyncpg://. asyncpg does not
+    understand libpq's sslmode query parameter, so it is passed as ssl instead.
+    """
+    url = make_url(url)
+    if url.get_backend_name() == "sqlite":
+        return create_async_engine(url.set(drivername="sqlite+aiosqlite"))
+
+    connect_args = {"server_settings": {"application_name": DB_APPLICATION_NAME}}
+    if DB_STATEMENT_TIMEOUT_MS > 0:
+        connect_args["server_settings"]["statement_timeout"] = str(DB_STATEMENT_TIMEOUT_MS)
+    sslmode = url.query.get("sslmode")
+    if sslmode:
+        connect_args["ssl"] = sslmode
+        url = url.difference_update_query(["sslmode"])
+
+    return create_async_engine(
+        url.set(drivername="postgresql+asyncpg"),
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_pre_ping=DB_POOL_PRE_PING,
+        connect_args=connect_args
+    )
+
+
+def pool_stats(engine) -> dict:
+    """Current pool usage and checkout telemetry for engine (sync or async)"""
+    pool = getattr(engine, "sync_engine", engine).pool
+    stats = {
+        "pool_class": type(pool).__name__,
+        "status": pool.status()
+    }
+    if isinstance(pool, QueuePool):
+        stats.update({
+            "pool_size": pool.size(),
+            "max_overflow": pool._max_overflow,
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            "overflow": max(0, pool.overflow()),
+            "timeout_seconds": pool.timeout()
+        })
+    if isinstance(pool, InstrumentedQueuePool):
+        stats.update({
+            "peak_checked_out": pool.peak_checked_out,
+            "overflow_checkouts": pool.overflow_checkouts,
+            "checkout_timeouts": pool.checkout_timeouts,
+            "checkout_wait_ms": pool.checkout_wait_histogram.snapshot()
+        })
+    return stats
+
 
 # Create engine
-engine = create_engine(DATABASE_URL)
+engine = create_db_engine()
 
 # Create session
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine and session for async def routes
+# expire_on_commit stays on so sync controllers run through run_sync() see the
+# same reload-after-commit behaviour as with SessionLocal
+async_engine = create_async_db_engine()
+AsyncSessionLocal = async_sessionmaker(async_engine, class_=AsyncSession, autoflush=False)
+
 # Base class for models
 Base = declarative_base()
 
@@ -25,3 +164,11 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+# Dependency to get an async DB session
+# Existing sync controllers can run on it through `await db.run_sync(...)`;
+# their queries then go through asyncpg and yield to the event loop.
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -0,0 +1,41 @@
+"""
+Migration: Index daily time log lookups by student and log
+Date: 2026-10-19
+
+The student log history reads one student's daily_time_logs and the first
+daily_accomplishments entry of each of those logs; without these indexes
+both are full table scans.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from sqlalchemy import text
+from database import engine
+
+INDEXES = (
+    ("ix_daily_time_logs_student_id", "daily_time_logs", "student_id"),
+    ("ix_daily_accomplishments_log_id", "daily_accomplishments", "log_id"),
+)
+
+def upgrade():
+    """Create the student_id and log_id indexes"""
+    with engine.connect() as conn:
+        for name, table, column in INDEXES:
+            conn.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({column})"))
+        conn.commit()
+        print("✅ Added daily log indexes")
+
+def downgrade():
+    """Drop the indexes"""
+    with engine.connect() as conn:
+        for name, _, _ in INDEXES:
+            conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+        conn.commit()
+        print("✅ Removed daily log indexes")
+
+if __name__ == "__main__":
+    print("Running migration: Index daily time logs and accomplishments")
+    upgrade()
+    print("Migration completed successfully!")
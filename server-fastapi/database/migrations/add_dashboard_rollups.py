@@ -0,0 +1,50 @@
+"""
+Migration: Add dashboard rollup tables
+Date: 2026-10-19
+
+Creates the tables read by the dashboard statistics
+(dashboard_application_rollups, dashboard_program_rollups and
+dashboard_rollup_state), the dashboard_stale_school_years queue read by the
+incremental refresh, and fills them with a full refresh.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from sqlalchemy import text
+from database import engine, SessionLocal
+from models import (
+    DashboardApplicationRollup, DashboardProgramRollup, DashboardRollupState, DashboardStaleSchoolYear
+)
+from utils.dashboard_rollups import refresh_dashboard_rollups
+
+ROLLUP_TABLES = (
+    DashboardApplicationRollup, DashboardProgramRollup, DashboardRollupState, DashboardStaleSchoolYear
+)
+
+def upgrade():
+    """Create the rollup tables and build them"""
+    for model in ROLLUP_TABLES:
+        model.__table__.create(bind=engine, checkfirst=True)
+
+    db = SessionLocal()
+    try:
+        refresh_dashboard_rollups(db, full=True)
+        rows = db.query(DashboardApplicationRollup).count()
+    finally:
+        db.close()
+    print(f"✅ Added dashboard rollup tables ({rows} application rollup rows)")
+
+def downgrade():
+    """Drop the rollup tables"""
+    with engine.connect() as conn:
+        for model in ROLLUP_TABLES:
+            conn.execute(text(f"DROP TABLE IF EXISTS {model.__tablename__}"))
+        conn.commit()
+        print("✅ Removed dashboard rollup tables")
+
+if __name__ == "__main__":
+    print("Running migration: Add dashboard rollup tables")
+    upgrade()
+    print("Migration completed successfully!")
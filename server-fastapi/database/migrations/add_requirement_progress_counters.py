@@ -0,0 +1,57 @@
+"""
+Migration: Add requirement progress counters to class_enrollments
+Date: 2026-10-19
+
+Adds the per-enrollment counters maintained by models._refresh_requirement_progress
+and backfills them from the existing requirement submissions.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from sqlalchemy import text
+from database import engine
+from models import ClassEnrollment, requirement_progress_values
+
+COUNTER_COLUMNS = (
+    "requirements_submitted",
+    "requirements_validated",
+    "requirements_returned",
+    "pre_ojt_submitted",
+    "post_ojt_validated",
+)
+
+def upgrade():
+    """Add the counter columns and fill them from requirement_submissions"""
+    with engine.connect() as conn:
+        for column in COUNTER_COLUMNS:
+            conn.execute(text(f"""
+                ALTER TABLE class_enrollments
+                ADD COLUMN IF NOT EXISTS {column} INTEGER NOT NULL DEFAULT 0
+            """))
+
+        enrollments = ClassEnrollment.__table__
+        result = conn.execute(
+            enrollments.update().values(
+                requirement_progress_values(enrollments.c.student_id, enrollments.c.class_id)
+            )
+        )
+        conn.commit()
+        print(f"✅ Added requirement progress counters ({result.rowcount} enrollments backfilled)")
+
+def downgrade():
+    """Remove the counter columns from class_enrollments"""
+    with engine.connect() as conn:
+        for column in COUNTER_COLUMNS:
+            conn.execute(text(f"""
+                ALTER TABLE class_enrollments
+                DROP COLUMN IF EXISTS {column}
+            """))
+        conn.commit()
+        print("✅ Removed requirement progress counters from class_enrollments")
+
+if __name__ == "__main__":
+    print("Running migration: Add requirement progress counters to class_enrollments")
+    upgrade()
+    print("Migration completed successfully!")
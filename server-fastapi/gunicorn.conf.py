@@ -0,0 +1,96 @@
+"""
+Gunicorn configuration for production
+
+Pre-fork launcher: the master process imports main:app, loads the sentence
+model, the skill and internship embedding matrices and the search index
+once, then forks the workers. Workers share those
+pages copy-on-write instead of each loading its own copy of PyTorch, the
+model and sklearn, so per-worker RSS and startup time stay small.
+
+Usage (from server-fastapi/):
+    gunicorn main:app
+
+Development keeps using `python main.py` (single process, auto-reload).
+"""
+import gc
+import multiprocessing
+import os
+import sys
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from config import WEB_CONCURRENCY
+
+# Server socket
+bind = f"{os.getenv('API_HOST', '0.0.0.0')}:{os.getenv('PORT', os.getenv('API_PORT', '3000'))}"
+
+# Workers
+worker_class = "uvicorn.workers.UvicornWorker"
+workers = WEB_CONCURRENCY
+preload_app = True  # import the app (and load models) once in the master
+
+# Recycle workers after N requests (jitter avoids all restarting at once)
+max_requests = int(os.getenv("MAX_REQUESTS", "1000"))
+max_requests_jitter = int(os.getenv("MAX_REQUESTS_JITTER", "100"))
+
+# Graceful drain: on SIGTERM/HUP workers finish in-flight requests for up to
+# GRACEFUL_TIMEOUT seconds before being killed
+graceful_timeout = int(os.getenv("GRACEFUL_TIMEOUT", "30"))
+timeout = int(os.getenv("WORKER_TIMEOUT", "120"))
+keepalive = int(os.getenv("KEEPALIVE", "5"))
+
+# Threads per worker for PyTorch intra-op parallelism (default: split the cores)
+torch_threads = int(os.getenv("TORCH_THREADS_PER_WORKER", max(1, multiprocessing.cpu_count() // max(1, workers))))
+
+accesslog = "-"
+errorlog = "-"
+loglevel = os.getenv("LOG_LEVEL", "info")
+
+
+def when_ready(server):
+    """Load shared model state in the master before any worker is forked"""
+    from database import SessionLocal
+    from ml_models.enhanced_matcher import get_matcher
+    from ml_models.internship_search import get_search_index
+
+    matcher = get_matcher()
+
+    # No threads may exist at fork time: encode with the raw model (no
+    # micro-batcher thread) and keep torch on a single thread (no intra-op
+    # pool); post_fork sets each worker's thread count
+    torch = sys.modules.get("torch")
+    if torch is not None:
+        torch.set_num_threads(1)
+
+    db = SessionLocal()
+    try:
+        with matcher.direct_encoding():
+            if matcher.skill_embeddings is not None:
+                matcher.skill_embeddings.load(db)
+            embedded = matcher.preload_internship_embeddings(db)
+            # Reuses the vectors embedded above
+            get_search_index().refresh(db)
+        server.log.info("Preloaded %s internship embeddings", embedded)
+    except Exception as e:
+        server.log.warning("Embeddings not preloaded: %s", e)
+    finally:
+        db.close()
+    server.log.info("Matcher preloaded in master (pid %s)", os.getpid())
+
+    # Move everything allocated so far out of the GC's reach so collections in
+    # the workers don't touch (and un-share) those pages
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    """Per-worker setup right after fork"""
+    # Connections opened by the master (create_all on import) must not be
+    # shared across processes; give each worker a fresh pool
+    from database import engine
+    engine.dispose(close=False)
+
+    torch = sys.modules.get("torch")
+    if torch is not None:
+        torch.set_num_threads(torch_threads)
@@ -1,3 +1,6 @@
+from contextlib import asynccontextmanager
+import asyncio
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
@@ -5,14 +8,15 @@ from dotenv import load_dotenv
 import os
 
 # Import configuration (this sets timezone)
-from config import CORS_ORIGINS, UPLOAD_BASE_DIR, TIMEZONE
+from config import CORS_ORIGINS, UPLOAD_BASE_DIR, TIMEZONE, DASHBOARD_ROLLUP_REFRESH_SECONDS, WEB_CONCURRENCY
 
 # Set timezone for the application
 os.environ['TZ'] = TIMEZONE
 
 # Import database
-from database import engine
+from database import engine, async_engine, pool_stats
 from models import Base
+from utils.dashboard_rollups import run_refresh_loop
 #sa
 # Import routes
 from routes import auth, campus, department, program, section, ojt_head, ojt_head_portal, ojt_coordinator, employer, industry, class_routes, internship, supervisor, student, student_trainee_portal, requirements, ojt_assignments, ojt_daily_records, oeams, dashboard, dropdown, requirement_templates, superadmin, jp_employer, ml_matching, bulk_upload, enhanced_matching
@@ -22,10 +26,23 @@ load_dotenv()
 # Create tables
 Base.metadata.create_all(bind=engine)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Keep the dashboard rollups fresh (in one worker at a time, see run_refresh_loop)"""
+    refresh_task = None
+    if DASHBOARD_ROLLUP_REFRESH_SECONDS > 0:
+        refresh_task = asyncio.create_task(run_refresh_loop(DASHBOARD_ROLLUP_REFRESH_SECONDS))
+    yield
+    if refresh_task:
+        refresh_task.cancel()
+
+
 app = FastAPI(
     title="ILEAP API",
     description="API for ILEAP Internship Management System",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS configuration - now uses config.py
@@ -91,6 +108,30 @@ def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/health/db-pool")
+def db_pool_metrics():
+    """
+    Connection pool telemetry for this worker process
+    
+    Postgres sees up to workers * (pool_size + max_overflow) connections per
+    engine (sync and async) from this service; compare that budget with the
+    server's max_connections.
+    """
+    stats = pool_stats(engine)
+    stats["async_pool"] = pool_stats(async_engine)
+    if "pool_size" in stats:
+        per_worker = sum(
+            pool["pool_size"] + pool["max_overflow"]
+            for pool in (stats, stats["async_pool"]) if "pool_size" in pool
+        )
+        stats["workers"] = WEB_CONCURRENCY
+        stats["max_connections_budget"] = WEB_CONCURRENCY * per_worker
+    stats["pid"] = os.getpid()
+    return stats
+
+
+# Development server (single process, auto-reload).
+# In production run `gunicorn main:app` instead (see gunicorn.conf.py).
 if __name__ == "__main__":
     import uvicorn
     import os
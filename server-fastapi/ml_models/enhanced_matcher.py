@@ -14,6 +14,10 @@ Version: 2.1.1
 
 import json
 import re
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import lru_cache
 import numpy as np
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
@@ -31,6 +35,14 @@ except ImportError:
     print("Warning: sentence-transformers not installed. Using TF-IDF fallback.")
     print("Install with: pip install sentence-transformers")
 
+# Sentence model used for semantic similarity
+SENTENCE_MODEL_NAME = 'all-MiniLM-L6-v2'
+
+# Match history rows written per INSERT ... ON CONFLICT statement
+STORE_MATCHES_CHUNK_SIZE = 1000
+
+# Internship vectors kept per embedding cache (least recently used are evicted)
+EMBEDDING_CACHE_SIZE = 10000
 
 # Custom stop words for job matching
 CUSTOM_STOP_WORDS = ENGLISH_STOP_WORDS.union({
@@ -90,6 +102,92 @@ PROGRAM_KEYWORDS = {
     'multimedia': ['graphic design', 'video editing', 'animation', 'photoshop', 'illustrator', 'premiere', 'after effects', 'ui', 'ux', 'designer'],
 }
 
+# Job title variations, expanded by normalize_job_title
+JOB_TITLE_SYNONYMS = {
+    'engineer': 'engineer developer',
+    'developer': 'developer engineer',
+    'dev': 'developer engineer',
+    'programmer': 'programmer developer engineer',
+    'frontend': 'frontend front-end front end',
+    'backend': 'backend back-end back end',
+    'fullstack': 'fullstack full-stack full stack',
+    'full stack': 'fullstack full-stack full stack',
+    'jr': 'junior jr',
+    'sr': 'senior sr',
+    'intern': 'intern internship trainee',
+    'internship': 'intern internship trainee',
+}
+
+
+def _compile_alternation(terms) -> re.Pattern:
+    """One whole-word regex matching any of terms (longest alternative first)"""
+    ordered = sorted(set(terms), key=lambda t: (-len(t), t))
+    return re.compile(r'\b(?:' + '|'.join(re.escape(t) for t in ordered) + r')\b')
+
+
+PROGRAM_NAME_PATTERN = _compile_alternation(PROGRAM_KEYWORDS)
+JOB_TITLE_PATTERN = _compile_alternation(JOB_TITLE_SYNONYMS)
+
+# A match consumes the longest keyword at its position, so also credit the
+# keywords it contains ("business analyst" -> business, analyst)
+_ALL_PROGRAM_KEYWORDS = {k for keywords in PROGRAM_KEYWORDS.values() for k in keywords}
+_KEYWORDS_WITHIN = {
+    keyword: frozenset(k for k in _ALL_PROGRAM_KEYWORDS if re.search(r'\b' + re.escape(k) + r'\b', keyword))
+    for keyword in _ALL_PROGRAM_KEYWORDS
+}
+PROGRAM_KEYWORD_PATTERN = _compile_alternation(_ALL_PROGRAM_KEYWORDS)
+
+
+@lru_cache(maxsize=4096)
+def _program_keywords(student_field: str) -> frozenset:
+    """Relevance keywords of every program named in a student's program/major"""
+    return frozenset(
+        keyword
+        for program in PROGRAM_NAME_PATTERN.findall(student_field)
+        for keyword in PROGRAM_KEYWORDS[program]
+    )
+
+
+@lru_cache(maxsize=8192)
+def _job_keywords(job_text: str) -> frozenset:
+    """Program keywords present in an internship's title/description (memoized per posting)"""
+    return frozenset().union(*(_KEYWORDS_WITHIN[m] for m in PROGRAM_KEYWORD_PATTERN.findall(job_text)))
+
+
+@lru_cache(maxsize=8192)
+def _normalize_job_title(title: str) -> str:
+    return JOB_TITLE_PATTERN.sub(lambda m: JOB_TITLE_SYNONYMS[m.group(0)], title.lower())
+
+
+class _EmbeddingCache:
+    """Thread-safe LRU map of (internship_id, text hash) -> normalized vector"""
+    
+    def __init__(self, max_entries: int = EMBEDDING_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._vectors = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return len(self._vectors)
+    
+    def lookup(self, keys: List) -> List[Optional[np.ndarray]]:
+        """Cached vector of each key (None if missing), marking hits as recently used"""
+        with self._lock:
+            for key in keys:
+                if key in self._vectors:
+                    self._vectors.move_to_end(key)
+            return [self._vectors.get(key) for key in keys]
+    
+    def store(self, items: List[Tuple], keep: int = 0):
+        """Add (key, vector) pairs, evicting least recently used entries beyond
+        max(max_entries, keep) - keep covers every key of the current call"""
+        with self._lock:
+            for key, vector in items:
+                self._vectors[key] = vector
+                self._vectors.move_to_end(key)
+            while len(self._vectors) > max(self.max_entries, keep):
+                self._vectors.popitem(last=False)
+
 
 class EnhancedInternshipMatcher:
     """
@@ -103,7 +201,13 @@ class EnhancedInternshipMatcher:
         semantic_weight: float = 0.25,
         historical_weight: float = 0.10,
         use_simple_cosine: bool = True,
-        use_sentence_transformers: bool = True
+        use_sentence_transformers: bool = True,
+        backend: str = 'torch',
+        micro_batching: bool = False,
+        batch_max_size: int = 64,
+        batch_max_wait_ms: float = 5.0,
+        cascade: bool = False,
+        candidate_pool_size: int = 300
     ):
         """
         Initialize matcher with configurable weights
@@ -115,6 +219,12 @@ class EnhancedInternshipMatcher:
             historical_weight: Weight for historical success patterns (default 10%)
             use_simple_cosine: If True, use only cosine similarity on merged text (default True)
             use_sentence_transformers: If True, use Sentence Transformers instead of TF-IDF (default True)
+            backend: Sentence model runtime, 'torch' or 'onnx' (int8, falls back to torch) (default 'torch')
+            micro_batching: If True, coalesce concurrent encode() calls into batched forward passes
+            batch_max_size: Max texts per micro-batched forward pass (default 64)
+            batch_max_wait_ms: Max time an encode() call waits for others to join its batch (default 5ms)
+            cascade: If True, pre-rank internships with skill bitsets + TF-IDF and only fully score the top pool
+            candidate_pool_size: Number of internships kept by the cascade's first stage (default 300)
         """
         self.skill_weight = skill_weight
         self.program_weight = program_weight
@@ -122,25 +232,70 @@ class EnhancedInternshipMatcher:
         self.historical_weight = historical_weight
         self.use_simple_cosine = use_simple_cosine
         self.use_sentence_transformers = use_sentence_transformers and SENTENCE_TRANSFORMERS_AVAILABLE
+        self.cascade = cascade
+        self.candidate_pool_size = candidate_pool_size
+        self._candidate_index = None  # (corpus key, first-stage index) for cascade mode
+        # One vector cache per internship text recipe (embed_internships / _semantic_column)
+        self._internship_embeddings = _EmbeddingCache()
+        self._semantic_embeddings = _EmbeddingCache()
         
         # Initialize Sentence Transformer model if available
         self.sentence_model = None
+        self.encode_batcher = None
         if self.use_sentence_transformers:
             try:
                 # Use a lightweight, fast model optimized for semantic similarity
-                self.sentence_model = SentenceTransformer('all-MiniLM-L6-v2')
-                print("✓ Sentence Transformers loaded successfully")
+                self.sentence_model = self._load_sentence_model(backend)
+                
+                # Share forward passes between concurrent requests
+                if micro_batching:
+                    from ml_models.micro_batcher import MicroBatchEncoder
+                    self.encode_batcher = MicroBatchEncoder(
+                        self.sentence_model,
+                        max_batch_size=batch_max_size,
+                        max_wait_ms=batch_max_wait_ms
+                    )
+                    self.sentence_model = self.encode_batcher
             except Exception as e:
                 print(f"Warning: Failed to load Sentence Transformers: {e}")
                 print("Falling back to TF-IDF")
                 self.use_sentence_transformers = False
         
+        # Canonical-skill vectors, pooled for skill-set similarity
+        self.skill_embeddings = None
+        if self.use_sentence_transformers:
+            from ml_models.skill_embeddings import SkillEmbeddingTable
+            self.skill_embeddings = SkillEmbeddingTable(self.embed_texts, self.normalize_skills)
+        
         # Validate weights sum to 1.0
         total = skill_weight + program_weight + semantic_weight + historical_weight
         if not (0.99 <= total <= 1.01):
             raise ValueError(f"Weights must sum to 1.0, got {total}")
     
     
+    @staticmethod
+    def _load_sentence_model(backend: str):
+        """
+        Load the sentence model for the requested backend
+        
+        'onnx' serves an int8-quantized export through ONNX Runtime and falls
+        back to PyTorch if the runtime or the export is unavailable.
+        """
+        if backend == 'onnx':
+            try:
+                from ml_models.onnx_encoder import load_onnx_encoder
+                model = load_onnx_encoder(SENTENCE_MODEL_NAME)
+                print("✓ ONNX int8 sentence encoder loaded successfully")
+                return model
+            except Exception as e:
+                print(f"Warning: ONNX backend unavailable: {e}")
+                print("Falling back to PyTorch Sentence Transformers")
+        
+        model = SentenceTransformer(SENTENCE_MODEL_NAME)
+        print("✓ Sentence Transformers loaded successfully")
+        return model
+    
+    
     @staticmethod
     def clean_html(text: str) -> str:
         """
@@ -248,30 +403,8 @@ class EnhancedInternshipMatcher:
         if not title:
             return ""
         
-        title_lower = title.lower()
-        
-        # Add common synonyms
-        synonyms = {
-            'engineer': 'engineer developer',
-            'developer': 'developer engineer',
-            'dev': 'developer engineer',
-            'programmer': 'programmer developer engineer',
-            'frontend': 'frontend front-end front end',
-            'backend': 'backend back-end back end',
-            'fullstack': 'fullstack full-stack full stack',
-            'full stack': 'fullstack full-stack full stack',
-            'jr': 'junior jr',
-            'sr': 'senior sr',
-            'intern': 'intern internship trainee',
-            'internship': 'intern internship trainee',
-        }
-        
-        # Apply synonyms
-        for key, value in synonyms.items():
-            if key in title_lower:
-                title_lower = title_lower.replace(key, value)
-        
-        return title_lower
+        # Expand synonyms in one pass over the title (whole words only)
+        return _normalize_job_title(title)
     
     
     @staticmethod
@@ -301,25 +434,17 @@ class EnhancedInternshipMatcher:
             return 1.0  # No penalty if no program info
         
         # Combine program and major for checking
-        student_field = f"{student_program} {student_major}".lower()
-        job_text = f"{job_title} {job_description[:500]}".lower()
+        student_field = f"{student_program or ''} {student_major or ''}".lower()
+        job_text = f"{job_title or ''} {(job_description or '')[:500]}".lower()
         
         # Find relevant keywords for this program
-        relevant_keywords = []
-        for program, keywords in PROGRAM_KEYWORDS.items():
-            if program in student_field:
-                relevant_keywords.extend(keywords)
+        relevant_keywords = _program_keywords(student_field)
         
         if not relevant_keywords:
             return 1.0  # No penalty if program not in mapping
         
-        # Check if any relevant keyword appears in job
-        matches = 0
-        for keyword in relevant_keywords:
-            if keyword in job_text:
-                matches += 1
-        
-        if matches > 0:
+        # Check if any relevant keyword appears in job (whole words)
+        if relevant_keywords & _job_keywords(job_text):
             return 1.0  # Relevant - no penalty
         
         # Not relevant - apply 70% penalty (return 0.3)
@@ -364,23 +489,13 @@ class EnhancedInternshipMatcher:
         
         # Calculate semantic similarity for skills (if enabled and available)
         semantic_similarity = 0.0
-        if (self.use_sentence_transformers and 
-            hasattr(self, 'sentence_model') and 
-            self.sentence_model is not None and 
+        if (self.skill_embeddings is not None and 
             len(student_skills_set) > 0 and 
             len(internship_skills_set) > 0):
             try:
-                # Create skill text
-                student_skill_text = " ".join(student_skills_set)
-                internship_skill_text = " ".join(internship_skills_set)
-                
-                # Calculate semantic similarity
-                embeddings = self.sentence_model.encode([student_skill_text, internship_skill_text])
-                semantic_similarity = cosine_similarity(
-                    embeddings[0].reshape(1, -1),
-                    embeddings[1].reshape(1, -1)
-                )[0][0]
-                semantic_similarity = max(0.0, min(1.0, float(semantic_similarity)))
+                # Pooled canonical-skill vectors (no transformer call per pair)
+                pooled = self.skill_embeddings.pooled([sorted(student_skills_set), sorted(internship_skills_set)])
+                semantic_similarity = max(0.0, min(1.0, float(pooled[0] @ pooled[1])))
             except Exception as e:
                 print(f"Warning: Skill semantic similarity failed: {e}")
                 semantic_similarity = 0.0
@@ -655,54 +770,53 @@ class EnhancedInternshipMatcher:
         if self.use_simple_cosine:
             return self._calculate_simple_cosine_match(student_data, internship_data)
         
-        # Extract data
-        student_skills = student_data.get('skills', [])
-        internship_skills = internship_data.get('skills', [])
-        
-        # 1. Skill Score
-        skill_metrics = self.calculate_skill_score(student_skills, internship_skills)
-        # Use weighted average of jaccard and coverage
-        skill_score = (skill_metrics['jaccard'] * 0.6 + skill_metrics['coverage'] * 0.4)
+        return self.calculate_match_scores(db, student_data, [internship_data])[0]
+    
+    
+    def calculate_match_scores(
+        self,
+        db: Session,
+        student_data: Dict,
+        internship_data_list: List[Dict]
+    ) -> List[Dict]:
+        """
+        Calculate match scores for one student against many internships
         
-        # 2. Program Score
-        program_metrics = self.calculate_program_score(
-            student_data.get('program', ''),
-            student_data.get('major', ''),
-            student_data.get('department', ''),
-            internship_data.get('title', ''),
-            internship_data.get('description', ''),
-            internship_data.get('industry', '')
-        )
-        program_score = (program_metrics['program_match'] * 0.6 + program_metrics['major_match'] * 0.4)
+        Simple cosine mode scores every internship with one matrix product.
+        Weighted mode computes each component (skill, program, semantic,
+        historical) as a NumPy column over all internships and combines the
+        columns with the configured weights in one expression.
         
-        # 3. Semantic Score
-        student_text = " ".join([
-            " ".join(student_skills),
-            student_data.get('program', ''),
-            student_data.get('major', ''),
-            student_data.get('department', ''),
-            student_data.get('about', '')[:200]
-        ])
+        Returns:
+            List of match dicts (same shape as calculate_match_score), in input order
+        """
+        if not internship_data_list:
+            return []
         
-        internship_text = " ".join([
-            internship_data.get('title', ''),
-            internship_data.get('description', '')[:500],
-            " ".join(internship_skills),
-            internship_data.get('industry', '')
-        ])
+        if self.use_simple_cosine:
+            scores = self.score_matrix([student_data], internship_data_list)[0]
+            student_set = self._skill_set(student_data.get('skills', []))
+            results = []
+            for score, internship_data in zip(scores, internship_data_list):
+                internship_set = self._skill_set(internship_data.get('skills', []))
+                score = float(score)
+                results.append({
+                    'match_score': round(score, 4),
+                    'match_label': "Recommended" if score >= 0.40 else "Not Recommended",
+                    'is_recommended': score >= 0.40,
+                    'skill_match_count': len(student_set & internship_set),
+                    'total_required_skills': len(internship_set)
+                })
+            return results
         
-        semantic_score = self.calculate_semantic_score(student_text, internship_text)
+        skill = self._skill_columns(student_data.get('skills', []), internship_data_list)
+        program = self._program_columns(student_data, internship_data_list)
+        semantic_score = self._semantic_column(student_data, internship_data_list)
+        historical_score = self._historical_column(db, student_data.get('student_id'), internship_data_list)
         
-        # 4. Historical Score
-        historical_score = self.calculate_historical_score(
-            db,
-            student_data.get('student_id'),
-            internship_data.get('internship_id'),
-            internship_data.get('employer_id'),
-            internship_data.get('industry_id')
-        )
+        skill_score = skill['jaccard'] * 0.6 + skill['coverage'] * 0.4
+        program_score = program['program_match'] * 0.6 + program['major_match'] * 0.4
         
-        # Calculate weighted final score
         final_score = (
             skill_score * self.skill_weight +
             program_score * self.program_weight +
@@ -710,38 +824,271 @@ class EnhancedInternshipMatcher:
             historical_score * self.historical_weight
         )
         
-        # Determine match label
+        results = []
+        for i, score in enumerate(final_score.tolist()):
+            match_label, is_recommended = self._weighted_label(score)
+            results.append({
+                'match_score': round(score, 4),
+                'match_label': match_label,
+                'is_recommended': is_recommended,
+                'components': {
+                    'skill_score': round(float(skill_score[i]), 4),
+                    'program_score': round(float(program_score[i]), 4),
+                    'semantic_score': round(float(semantic_score[i]), 4),
+                    'historical_score': round(float(historical_score[i]), 4)
+                },
+                'skill_metrics': {
+                    'jaccard': float(skill['jaccard'][i]),
+                    'coverage': float(skill['coverage'][i]),
+                    'match_count': int(skill['match_count'][i]),
+                    'total_required': int(skill['total_required'][i])
+                },
+                'program_metrics': {
+                    'program_match': float(program['program_match'][i]),
+                    'major_match': float(program['major_match'][i])
+                },
+                'skill_match_count': int(skill['match_count'][i]),
+                'total_required_skills': int(skill['total_required'][i])
+            })
+        return results
+    
+    
+    @staticmethod
+    def _weighted_label(final_score: float) -> Tuple[str, bool]:
+        """Match label and recommendation flag for a weighted-mode score"""
         if final_score >= 0.75:
-            match_label = "Excellent Match"
-            is_recommended = True
+            return "Excellent Match", True
         elif final_score >= 0.60:
-            match_label = "Strong Match"
-            is_recommended = True
+            return "Strong Match", True
         elif final_score >= 0.45:
-            match_label = "Good Match"
-            is_recommended = True
+            return "Good Match", True
         elif final_score >= 0.30:
-            match_label = "Fair Match"
-            is_recommended = False
-        else:
-            match_label = "Weak Match"
-            is_recommended = False
+            return "Fair Match", False
+        return "Weak Match", False
+    
+    
+    def _skill_set(self, skills: List[str]) -> set:
+        return {s.lower().strip() for s in self.normalize_skills(skills) if s}
+    
+    
+    def _skill_columns(self, student_skills: List[str], internship_data_list: List[Dict]) -> Dict[str, np.ndarray]:
+        """
+        calculate_skill_score for every internship at once
         
+        Exact overlap comes from a sparse internship × skill incidence matrix
+        times the student's skill vector; the semantic part embeds each
+        distinct skill set once (cached) and takes one matrix-vector product.
+        """
+        from scipy.sparse import csr_matrix
+        
+        n = len(internship_data_list)
+        student_set = self._skill_set(student_skills)
+        internship_sets = [self._skill_set(d.get('skills', [])) for d in internship_data_list]
+        total_required = np.array([len(s) for s in internship_sets], dtype=np.float64)
+        
+        vocabulary = {}
+        indices = [vocabulary.setdefault(skill, len(vocabulary)) for skills in internship_sets for skill in skills]
+        indptr = np.cumsum([0] + [len(s) for s in internship_sets])
+        incidence = csr_matrix(
+            (np.ones(len(indices)), indices, indptr),
+            shape=(n, max(1, len(vocabulary)))
+        )
+        student_vector = np.zeros(incidence.shape[1])
+        for skill in student_set:
+            if skill in vocabulary:
+                student_vector[vocabulary[skill]] = 1.0
+        
+        match_count = incidence @ student_vector
+        union = len(student_set) + total_required - match_count
+        both = (total_required > 0) & bool(student_set)
+        exact_jaccard = np.divide(match_count, union, out=np.zeros(n), where=both)
+        exact_coverage = np.divide(match_count, total_required, out=np.zeros(n), where=both)
+        
+        # Semantic similarity of the skill sets (only where both sides have skills)
+        semantic = np.zeros(n)
+        if self.skill_embeddings is not None and both.any():
+            try:
+                rows = np.flatnonzero(both)
+                pooled = self.skill_embeddings.pooled([sorted(student_set)] + [sorted(internship_sets[i]) for i in rows])
+                semantic[rows] = np.clip(pooled[1:] @ pooled[0], 0.0, 1.0)
+            except Exception as e:
+                print(f"Warning: Skill semantic similarity failed: {e}")
+                semantic[:] = 0.0
+        
+        # 80% exact, 20% semantic where semantic similarity is available
+        has_semantic = semantic > 0
         return {
-            'match_score': round(final_score, 4),
-            'match_label': match_label,
-            'is_recommended': is_recommended,
-            'components': {
-                'skill_score': round(skill_score, 4),
-                'program_score': round(program_score, 4),
-                'semantic_score': round(semantic_score, 4),
-                'historical_score': round(historical_score, 4)
-            },
-            'skill_metrics': skill_metrics,
-            'program_metrics': program_metrics
+            'jaccard': np.where(has_semantic, exact_jaccard * 0.80 + semantic * 0.20, exact_jaccard),
+            'coverage': np.where(has_semantic, exact_coverage * 0.80 + semantic * 0.20, exact_coverage),
+            'match_count': match_count.astype(int),
+            'total_required': total_required.astype(int)
         }
     
     
+    @staticmethod
+    def _program_columns(student_data: Dict, internship_data_list: List[Dict]) -> Dict[str, np.ndarray]:
+        """calculate_program_score for every internship at once (vectorized substring checks)"""
+        n = len(internship_data_list)
+        student_program = (student_data.get('program') or "").lower()
+        student_major = (student_data.get('major') or "").lower()
+        
+        titles = np.array([(d.get('title') or "").lower() for d in internship_data_list] or [""], dtype=str)
+        descriptions = np.array([(d.get('description') or "").lower()[:500] for d in internship_data_list] or [""], dtype=str)
+        industries = np.array([(d.get('industry') or "").lower() for d in internship_data_list] or [""], dtype=str)
+        
+        def contains(column: np.ndarray, needle: str) -> np.ndarray:
+            return (np.char.find(column, needle) >= 0)[:n].astype(np.float64)
+        
+        program_score = np.zeros(n)
+        if student_program:
+            program_score = (
+                contains(titles, student_program) * 1.0 +
+                contains(descriptions, student_program) * 0.5 +
+                contains(industries, student_program) * 0.3
+            )
+        
+        major_score = np.zeros(n)
+        if student_major:
+            major_score = contains(titles, student_major) * 1.0 + contains(descriptions, student_major) * 0.5
+        
+        # Normalize scores (max possible: program=1.8, major=1.5)
+        return {
+            'program_match': np.minimum(program_score / 1.8, 1.0),
+            'major_match': np.minimum(major_score / 1.5, 1.0)
+        }
+    
+    
+    def _semantic_column(self, student_data: Dict, internship_data_list: List[Dict]) -> np.ndarray:
+        """calculate_semantic_score for every internship at once"""
+        n = len(internship_data_list)
+        student_skills = student_data.get('skills', [])
+        student_text = self.clean_text(" ".join([
+            " ".join(student_skills),
+            student_data.get('program', ''),
+            student_data.get('major', ''),
+            student_data.get('department', ''),
+            student_data.get('about', '')[:200]
+        ]))
+        internship_texts = [
+            self.clean_text(" ".join([
+                d.get('title', ''),
+                d.get('description', '')[:500],
+                " ".join(d.get('skills', [])),
+                d.get('industry', '')
+            ]))
+            for d in internship_data_list
+        ]
+        
+        scores = np.zeros(n)
+        rows = np.array([i for i, text in enumerate(internship_texts) if text], dtype=int)
+        if not student_text or len(rows) == 0:
+            return scores
+        
+        try:
+            if self.use_sentence_transformers and self.sentence_model:
+                vectors = self._embed_cached(
+                    self._semantic_embeddings,
+                    [internship_data_list[i].get('internship_id') for i in rows],
+                    [internship_texts[i] for i in rows]
+                )
+                scores[rows] = vectors @ self.embed_texts([student_text])[0]
+            else:
+                vectorizer = TfidfVectorizer(
+                    max_features=1000,
+                    stop_words=list(CUSTOM_STOP_WORDS),
+                    ngram_range=(1, 2)
+                )
+                matrix = vectorizer.fit_transform([student_text] + [internship_texts[i] for i in rows])
+                scores[rows] = (matrix[1:] @ matrix[0].T).toarray().ravel()
+        except Exception as e:
+            print(f"Warning: Semantic similarity calculation failed: {e}")
+            return np.zeros(n)
+        
+        return np.clip(scores, 0.0, 1.0)
+    
+    
+    def _historical_column(self, db: Session, student_id: int, internship_data_list: List[Dict]) -> np.ndarray:
+        """
+        calculate_historical_score for every internship at once
+        
+        One grouped query returns the student's applied/accepted counts per
+        (employer, industry); employer, industry and overall success rates are
+        then looked up per internship.
+        """
+        from models import StudentInternshipMatch, Internship, Employer
+        from sqlalchemy import func
+        
+        n = len(internship_data_list)
+        try:
+            rows = db.query(
+                Internship.employer_id,
+                Employer.industry_id,
+                StudentInternshipMatch.accepted,
+                func.count(StudentInternshipMatch.match_id)
+            ).join(
+                Internship, StudentInternshipMatch.internship_id == Internship.internship_id
+            ).outerjoin(
+                Employer, Internship.employer_id == Employer.employer_id
+            ).filter(
+                and_(
+                    StudentInternshipMatch.student_id == student_id,
+                    StudentInternshipMatch.applied == True
+                )
+            ).group_by(
+                Internship.employer_id, Employer.industry_id, StudentInternshipMatch.accepted
+            ).all()
+        except Exception as e:
+            print(f"Warning: Historical score calculation failed: {e}")
+            return np.full(n, 0.5)  # Neutral score if no history
+        
+        employer_counts, industry_counts = {}, {}
+        applied_total, accepted_total = 0, 0
+        for employer_id, industry_id, accepted, count in rows:
+            accepted_count = count if accepted else 0
+            for counts, key in ((employer_counts, employer_id), (industry_counts, industry_id)):
+                applied, accepted_so_far = counts.get(key, (0, 0))
+                counts[key] = (applied + count, accepted_so_far + accepted_count)
+            applied_total += count
+            accepted_total += accepted_count
+        
+        def rate(counts: Dict, key) -> float:
+            applied, accepted = counts.get(key, (0, 0))
+            return accepted / applied if applied else 0.0
+        
+        employer_rate = np.array([rate(employer_counts, d.get('employer_id')) for d in internship_data_list])
+        industry_rate = np.array([
+            rate(industry_counts, d.get('industry_id')) if d.get('industry_id') else 0.0
+            for d in internship_data_list
+        ])
+        overall_rate = accepted_total / applied_total if applied_total else 0.0
+        
+        # Weighted combination
+        return employer_rate * 0.5 + industry_rate * 0.3 + overall_rate * 0.2
+    
+    
+    def _student_text(self, student_data: Dict) -> str:
+        """Concatenate ALL student information into ONE string"""
+        return " ".join(filter(None, [
+            " ".join(self.normalize_skills(student_data.get('skills', []))),
+            student_data.get('program', ''),
+            student_data.get('major', ''),
+            student_data.get('department', ''),
+            self.clean_html(student_data.get('about', '')),
+        ]))
+    
+    
+    def _internship_text(self, internship_data: Dict) -> str:
+        """Concatenate ALL internship information into ONE string"""
+        return " ".join(filter(None, [
+            self.normalize_job_title(internship_data.get('title', '')),
+            self.clean_html(internship_data.get('description', '')),
+            " ".join(self.normalize_skills(internship_data.get('skills', []))),
+            internship_data.get('industry', ''),
+            internship_data.get('company_name', ''),
+            internship_data.get('address', '')
+        ]))
+    
+    
     def _calculate_simple_cosine_match(
         self,
         student_data: Dict,
@@ -762,28 +1109,10 @@ class EnhancedInternshipMatcher:
         Returns:
             dict with match_score, match_label, and is_recommended only
         """
-        # Concatenate ALL student information into ONE string
-        student_skills = student_data.get('skills', [])
-        student_skills_normalized = self.normalize_skills(student_skills)
-        student_text = " ".join(filter(None, [
-            " ".join(student_skills_normalized),
-            student_data.get('program', ''),
-            student_data.get('major', ''),
-            student_data.get('department', ''),
-            self.clean_html(student_data.get('about', '')),
-        ]))
-        
-        # Concatenate ALL internship information into ONE string
-        internship_skills = internship_data.get('skills', [])
-        internship_skills_normalized = self.normalize_skills(internship_skills)
-        internship_text = " ".join(filter(None, [
-            self.normalize_job_title(internship_data.get('title', '')),
-            self.clean_html(internship_data.get('description', '')),
-            " ".join(internship_skills_normalized),
-            internship_data.get('industry', ''),
-            internship_data.get('company_name', ''),
-            internship_data.get('address', '')
-        ]))
+        student_skills_normalized = self.normalize_skills(student_data.get('skills', []))
+        internship_skills_normalized = self.normalize_skills(internship_data.get('skills', []))
+        student_text = self._student_text(student_data)
+        internship_text = self._internship_text(internship_data)
         
         # Feed both strings to Sentence Transformers → Get ONE cosine similarity score
         cosine_similarity = self.calculate_semantic_score(student_text, internship_text)
@@ -812,30 +1141,248 @@ class EnhancedInternshipMatcher:
         }
     
     
-    def get_top_matches(
+    def embed_texts(self, texts: List[str]) -> np.ndarray:
+        """
+        Encode texts in one batched call and L2-normalize the rows
+        
+        Returns:
+            (len(texts), dim) float32 array; dot products are cosine similarities
+        """
+        embeddings = np.asarray(self.sentence_model.encode(list(texts)), dtype=np.float32)
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        return embeddings / np.clip(norms, 1e-12, None)
+    
+    
+    def embed_internships(self, internship_data_list: List[Dict]) -> np.ndarray:
+        """
+        Normalized embeddings of internship texts, reusing previously computed vectors
+        
+        Vectors are cached per (internship_id, text hash), so only new or
+        edited postings go through the sentence model.
+        """
+        texts = [self.clean_text(self._internship_text(d)) for d in internship_data_list]
+        return self._embed_cached(
+            self._internship_embeddings, [d.get('internship_id') for d in internship_data_list], texts
+        )
+    
+    
+    def preload_internship_embeddings(self, db: Session) -> int:
+        """
+        Embed every matchable posting into the vector cache
+        
+        Called in the gunicorn master so workers inherit the vectors instead of
+        each encoding the corpus on its first request.
+        
+        Returns:
+            Number of postings embedded
+        """
+        from models import Internship
+        from ml_models.match_service import with_match_loading
+        
+        if not (self.use_sentence_transformers and self.sentence_model):
+            return 0
+        internships = with_match_loading(
+            db.query(Internship).filter(Internship.status.in_(['approved', 'open']))
+        ).all()
+        if internships:
+            self.embed_internships([self._internship_to_data(i) for i in internships])
+        return len(internships)
+    
+    
+    @contextmanager
+    def direct_encoding(self):
+        """Encode with the wrapped model, bypassing the micro-batcher (no batcher thread is started)"""
+        if self.encode_batcher is None:
+            yield
+            return
+        self.sentence_model = self.encode_batcher.model
+        try:
+            yield
+        finally:
+            self.sentence_model = self.encode_batcher
+    
+    
+    def _embed_cached(self, cache: _EmbeddingCache, ids: List, texts: List[str]) -> np.ndarray:
+        """Normalized embeddings of texts, cached per (id, text hash) in cache"""
+        keys = [(item_id, hash(text)) for item_id, text in zip(ids, texts)]
+        
+        vectors = cache.lookup(keys)
+        missing = [i for i, vector in enumerate(vectors) if vector is None]
+        if missing:
+            for i, vector in zip(missing, self.embed_texts([texts[i] for i in missing])):
+                vectors[i] = vector
+            # Vectors of edited/removed postings age out as least recently used
+            cache.store([(keys[i], vectors[i]) for i in missing], keep=len(keys))
+        
+        return np.vstack(vectors)
+    
+    
+    def score_matrix(self, student_data_list: List[Dict], internship_data_list: List[Dict]) -> np.ndarray:
+        """
+        Dual-encoder match scores for every student × internship pair at once
+        
+        Same texts as _calculate_simple_cosine_match, but all students and all
+        internships are encoded in batches and scored with one matrix product.
+        Falls back to a TF-IDF model fitted on the combined corpus when
+        Sentence Transformers is unavailable.
+        
+        Returns:
+            (n_students, n_internships) array of scores in [0, 1]
+        """
+        if not student_data_list or not internship_data_list:
+            return np.zeros((len(student_data_list), len(internship_data_list)), dtype=np.float32)
+        
+        student_texts = [self.clean_text(self._student_text(d)) for d in student_data_list]
+        
+        if self.use_sentence_transformers and self.sentence_model:
+            scores = self.embed_texts(student_texts) @ self.embed_internships(internship_data_list).T
+        else:
+            internship_texts = [self.clean_text(self._internship_text(d)) for d in internship_data_list]
+            try:
+                vectorizer = TfidfVectorizer(stop_words=list(CUSTOM_STOP_WORDS), ngram_range=(1, 2))
+                matrix = vectorizer.fit_transform(student_texts + internship_texts)
+                scores = (matrix[:len(student_texts)] @ matrix[len(student_texts):].T).toarray()
+            except ValueError:
+                scores = np.zeros((len(student_texts), len(internship_texts)))  # Empty vocabulary
+        
+        return np.clip(scores, 0.0, 1.0)
+    
+    
+    def _get_candidate_index(self, internship_data_list: List[Dict]) -> Dict:
+        """
+        Build (or reuse) the cascade's first-stage index over a set of internships
+        
+        The index holds one skill bitset per internship and a TF-IDF matrix of
+        the internship texts. It is cached and rebuilt only when the set of
+        internships or their text changes.
+        """
+        texts = [self.clean_text(self._internship_text(d)) for d in internship_data_list]
+        key = tuple((d.get('internship_id'), hash(text)) for d, text in zip(internship_data_list, texts))
+        
+        cached = self._candidate_index
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        
+        # Skill vocabulary -> bit position
+        skill_bits = {}
+        bitsets, skill_totals = [], []
+        for d in internship_data_list:
+            bits = 0
+            skills = {s for s in self.normalize_skills(d.get('skills', [])) if s}
+            for skill in skills:
+                bits |= 1 << skill_bits.setdefault(skill, len(skill_bits))
+            bitsets.append(bits)
+            skill_totals.append(len(skills))
+        
+        # Sublinear TF approximates BM25's term-frequency saturation
+        vectorizer = TfidfVectorizer(
+            stop_words=list(CUSTOM_STOP_WORDS),
+            ngram_range=(1, 2),
+            sublinear_tf=True
+        )
+        try:
+            matrix = vectorizer.fit_transform(texts)
+        except ValueError:
+            vectorizer, matrix = None, None  # Empty vocabulary
+        
+        index = {
+            'skill_bits': skill_bits,
+            'bitsets': bitsets,
+            'skill_totals': np.array(skill_totals, dtype=np.float64),
+            'vectorizer': vectorizer,
+            'matrix': matrix
+        }
+        self._candidate_index = (key, index)
+        return index
+    
+    
+    def select_candidates(
+        self,
+        student_data: Dict,
+        internship_data_list: List[Dict],
+        pool_size: Optional[int] = None
+    ) -> List[int]:
+        """
+        First cascade stage: cheap lexical pre-ranking of internships
+        
+        Scores every internship by skill coverage (bitset popcount) and TF-IDF
+        cosine against the student text, and keeps the best pool_size for
+        full scoring.
+        
+        Returns:
+            Indices into internship_data_list, best candidate first
+        """
+        pool_size = pool_size or self.candidate_pool_size
+        n = len(internship_data_list)
+        if n <= pool_size:
+            return list(range(n))
+        
+        index = self._get_candidate_index(internship_data_list)
+        
+        student_bits = 0
+        for skill in self.normalize_skills(student_data.get('skills', [])):
+            bit = index['skill_bits'].get(skill)
+            if bit is not None:
+                student_bits |= 1 << bit
+        overlap = np.array([(student_bits & bits).bit_count() for bits in index['bitsets']], dtype=np.float64)
+        coverage = np.divide(overlap, index['skill_totals'], out=np.zeros(n), where=index['skill_totals'] > 0)
+        
+        lexical = np.zeros(n)
+        if index['vectorizer'] is not None:
+            query = index['vectorizer'].transform([self.clean_text(self._student_text(student_data))])
+            lexical = (index['matrix'] @ query.T).toarray().ravel()
+        
+        cheap_score = 0.5 * coverage + 0.5 * lexical
+        top = np.argpartition(-cheap_score, pool_size - 1)[:pool_size]
+        return top[np.argsort(-cheap_score[top], kind='stable')].tolist()
+    
+    
+    @staticmethod
+    def _internship_to_data(internship) -> Dict:
+        """Flatten an Internship row into the dict used by calculate_match_score"""
+        employer = internship.employer
+        return {
+            'internship_id': internship.internship_id,
+            'employer_id': internship.employer_id,
+            'industry_id': employer.industry_id if employer else None,
+            'skills': [skill.skill_name for skill in internship.skills] if internship.skills else [],
+            'title': internship.title or "",
+            'description': internship.full_description or "",
+            'posting_type': internship.posting_type or "internship",
+            'industry': employer.industry.industry_name if (employer and employer.industry) else "",
+            'company_name': employer.company_name if employer else "",
+            'address': employer.address if employer else ""
+        }
+    
+    
+    def iter_match_batches(
         self,
         db: Session,
         student_id: int,
-        limit: int = 10,
         posting_type: Optional[str] = None,
         min_score: float = 0.30,
-        store_matches: bool = True
-    ) -> List[Dict]:
+        batch_size: int = 25,
+        cascade: Optional[bool] = None,
+        pool_size: Optional[int] = None
+    ):
         """
-        Get top N internship matches for a student
+        Score open internships for a student in batches, yielding as each completes
         
         Args:
             db: Database session
             student_id: Student ID
-            limit: Number of top matches to return
             posting_type: Filter by 'internship' or 'job_placement'
             min_score: Minimum match score threshold
-            store_matches: Whether to store matches in database
+            batch_size: Internships scored per yielded batch
+            cascade: Override the matcher's cascade setting for this call
+            pool_size: Override candidate_pool_size for this call
         
-        Returns:
-            List of match dictionaries sorted by score
+        Yields:
+            (matches, scored, total) - the batch's matches above min_score
+            (sorted by score), internships scored so far, and internships to score
         """
-        from models import Student, Internship, Skill
+        from models import Student, Internship
+        from ml_models.match_service import with_match_loading, build_student_data
         
         # Get student
         student = db.query(Student).filter(Student.student_id == student_id).first()
@@ -850,57 +1397,96 @@ class EnhancedInternshipMatcher:
         if posting_type:
             query = query.filter(Internship.posting_type == posting_type)
         
-        internships = query.all()
+        internships = with_match_loading(query).all()
         
         if not internships:
-            return []
+            return
         
-        # Prepare student data
-        student_data = {
-            'student_id': student.student_id,
-            'skills': [skill.skill_name for skill in student.skills] if student.skills else [],
-            'program': student.program or "",
-            'major': student.major or "",
-            'department': student.department or "",
-            'about': student.about or ""
-        }
+        student_data = build_student_data(db, student)
+        
+        internship_data_list = [self._internship_to_data(internship) for internship in internships]
+        
+        # Cascade: only the first stage's top pool goes through full scoring
+        use_cascade = self.cascade if cascade is None else cascade
+        if use_cascade:
+            candidates = self.select_candidates(student_data, internship_data_list, pool_size)
+        else:
+            candidates = list(range(len(internships)))
         
         # Calculate matches
-        matches = []
-        for internship in internships:
-            internship_data = {
-                'internship_id': internship.internship_id,
-                'employer_id': internship.employer_id,
-                'industry_id': internship.employer.industry_id if internship.employer else None,
-                'skills': [skill.skill_name for skill in internship.skills] if internship.skills else [],
-                'title': internship.title or "",
-                'description': internship.full_description or "",
-                'posting_type': internship.posting_type or "internship",
-                'industry': internship.employer.industry.industry_name if (internship.employer and internship.employer.industry) else "",
-                'company_name': internship.employer.company_name if internship.employer else ""
-            }
-            
-            # Calculate match score
-            match_result = self.calculate_match_score(db, student_data, internship_data)
+        batch_size = max(1, batch_size)
+        for start in range(0, len(candidates), batch_size):
+            matches = []
+            batch = candidates[start:start + batch_size]
+            batch_results = self.calculate_match_scores(db, student_data, [internship_data_list[i] for i in batch])
+            for i, match_result in zip(batch, batch_results):
+                internship = internships[i]
+                internship_data = internship_data_list[i]
+                
+                # Filter by minimum score
+                if match_result['match_score'] >= min_score:
+                    matches.append({
+                        'internship_id': internship.internship_id,
+                        'internship_title': internship.title,
+                        'company_name': internship_data['company_name'],
+                        'industry': internship_data['industry'],
+                        'posting_type': internship.posting_type,
+                        'match_score': match_result['match_score'],
+                        'match_label': match_result['match_label'],
+                        'is_recommended': match_result['is_recommended'],
+                        'skill_match_count': match_result.get('skill_match_count', 0),
+                        'total_required_skills': match_result.get('total_required_skills', 0)
+                    })
             
-            # Filter by minimum score
-            if match_result['match_score'] >= min_score:
-                matches.append({
-                    'internship_id': internship.internship_id,
-                    'internship_title': internship.title,
-                    'company_name': internship_data['company_name'],
-                    'industry': internship_data['industry'],
-                    'posting_type': internship.posting_type,
-                    'match_score': match_result['match_score'],
-                    'match_label': match_result['match_label'],
-                    'is_recommended': match_result['is_recommended'],
-                    'skill_match_count': match_result.get('skill_match_count', 0),
-                    'total_required_skills': match_result.get('total_required_skills', 0)
-                })
+            matches.sort(key=lambda x: x['match_score'], reverse=True)
+            yield matches, min(start + batch_size, len(candidates)), len(candidates)
+    
+    
+    def get_top_matches(
+        self,
+        db: Session,
+        student_id: int,
+        limit: int = 10,
+        posting_type: Optional[str] = None,
+        min_score: float = 0.30,
+        store_matches: bool = True,
+        cascade: Optional[bool] = None,
+        pool_size: Optional[int] = None,
+        collapse_duplicates: bool = False
+    ) -> List[Dict]:
+        """
+        Get top N internship matches for a student
+        
+        Args:
+            db: Database session
+            student_id: Student ID
+            limit: Number of top matches to return
+            posting_type: Filter by 'internship' or 'job_placement'
+            min_score: Minimum match score threshold
+            store_matches: Whether to store matches in database
+            cascade: Override the matcher's cascade setting for this call
+            pool_size: Override candidate_pool_size for this call
+            collapse_duplicates: Keep only the best-scoring posting of each near-duplicate group
+        
+        Returns:
+            List of match dictionaries sorted by score
+        """
+        matches = []
+        for batch, _, _ in self.iter_match_batches(
+            db, student_id, posting_type, min_score,
+            batch_size=100, cascade=cascade, pool_size=pool_size
+        ):
+            matches.extend(batch)
         
         # Sort by match score (descending)
         matches.sort(key=lambda x: x['match_score'], reverse=True)
         
+        if collapse_duplicates:
+            from ml_models.near_duplicates import get_duplicate_index
+            duplicate_index = get_duplicate_index()
+            duplicate_index.sync_ids(db, [m['internship_id'] for m in matches])
+            matches = duplicate_index.collapse(matches)
+        
         # Store top matches in database if requested
         if store_matches and matches:
             self._store_matches(db, student_id, matches[:limit])
@@ -908,6 +1494,48 @@ class EnhancedInternshipMatcher:
         return matches[:limit]
     
     
+    def evaluate_cascade_recall(
+        self,
+        db: Session,
+        student_id: int,
+        k: int = 10,
+        posting_type: Optional[str] = None,
+        pool_size: Optional[int] = None
+    ) -> Dict:
+        """
+        Measure how much of the full ranking's top-k the cascade keeps
+        
+        Runs the full ranking and the cascade ranking for one student (without
+        storing matches) and reports recall@k = |cascade top-k ∩ full top-k| / k
+        together with the time each ranking took.
+        """
+        import time
+        
+        start = time.perf_counter()
+        full = self.get_top_matches(db, student_id, limit=k, posting_type=posting_type,
+                                    min_score=0.0, store_matches=False, cascade=False)
+        full_seconds = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        cascaded = self.get_top_matches(db, student_id, limit=k, posting_type=posting_type,
+                                        min_score=0.0, store_matches=False, cascade=True, pool_size=pool_size)
+        cascade_seconds = time.perf_counter() - start
+        
+        full_ids = {m['internship_id'] for m in full}
+        cascade_ids = {m['internship_id'] for m in cascaded}
+        recall = len(full_ids & cascade_ids) / len(full_ids) if full_ids else 1.0
+        
+        return {
+            'student_id': student_id,
+            'k': k,
+            'candidate_pool_size': pool_size or self.candidate_pool_size,
+            'recall_at_k': round(recall, 4),
+            'full_seconds': round(full_seconds, 4),
+            'cascade_seconds': round(cascade_seconds, 4),
+            'missed_internship_ids': sorted(full_ids - cascade_ids)
+        }
+    
+    
     def _store_matches(self, db: Session, student_id: int, matches: List[Dict]):
         """
         Store match scores in database for historical tracking
@@ -920,26 +1548,34 @@ class EnhancedInternshipMatcher:
         from models import StudentInternshipMatch
         from sqlalchemy.dialects.postgresql import insert
         
+        if not matches:
+            return
+        
         try:
-            for match in matches:
-                # Prepare feature values as JSON (simplified - just skill counts)
-                feature_values = json.dumps({
-                    'skill_match_count': match.get('skill_match_count', 0),
-                    'total_required_skills': match.get('total_required_skills', 0)
-                })
-                
-                # Use upsert to update if exists
-                stmt = insert(StudentInternshipMatch).values(
-                    student_id=student_id,
-                    internship_id=match['internship_id'],
-                    match_score=match['match_score'],
-                    match_label=match['match_label'],
-                    is_recommended=match['is_recommended'],
-                    recommended_at=datetime.utcnow(),
-                    feature_values=feature_values
-                )
-                
-                # On conflict, update the match score and timestamp
+            recommended_at = datetime.utcnow()
+            rows = [
+                {
+                    'student_id': student_id,
+                    'internship_id': match['internship_id'],
+                    'match_score': match['match_score'],
+                    'match_label': match['match_label'],
+                    'is_recommended': match['is_recommended'],
+                    'recommended_at': recommended_at,
+                    # Feature values as JSON (simplified - just skill counts)
+                    'feature_values': json.dumps({
+                        'skill_match_count': match.get('skill_match_count', 0),
+                        'total_required_skills': match.get('total_required_skills', 0)
+                    })
+                }
+                for match in matches
+            ]
+            
+            # Multi-row upserts of at most STORE_MATCHES_CHUNK_SIZE rows (7 bind
+            # parameters each; Postgres allows 65,535 per statement), in one
+            # transaction; on conflict, update the match score and timestamp
+            updated_at = datetime.utcnow()
+            for start in range(0, len(rows), STORE_MATCHES_CHUNK_SIZE):
+                stmt = insert(StudentInternshipMatch).values(rows[start:start + STORE_MATCHES_CHUNK_SIZE])
                 stmt = stmt.on_conflict_do_update(
                     constraint='unique_student_internship_match',
                     set_={
@@ -948,10 +1584,9 @@ class EnhancedInternshipMatcher:
                         'is_recommended': stmt.excluded.is_recommended,
                         'recommended_at': stmt.excluded.recommended_at,
                         'feature_values': stmt.excluded.feature_values,
-                        'updated_at': datetime.utcnow()
+                        'updated_at': updated_at
                     }
                 )
-                
                 db.execute(stmt)
             
             db.commit()
@@ -1023,7 +1658,22 @@ def get_matcher() -> EnhancedInternshipMatcher:
     global _matcher_instance
     
     if _matcher_instance is None:
-        _matcher_instance = EnhancedInternshipMatcher()
+        from config import (
+            SENTENCE_BACKEND, ENCODE_MICRO_BATCHING, ENCODE_BATCH_MAX_SIZE, ENCODE_BATCH_MAX_WAIT_MS,
+            MATCH_CASCADE, MATCH_CANDIDATE_POOL_SIZE
+        )
+        _matcher_instance = EnhancedInternshipMatcher(
+            backend=SENTENCE_BACKEND,
+            micro_batching=ENCODE_MICRO_BATCHING,
+            batch_max_size=ENCODE_BATCH_MAX_SIZE,
+            batch_max_wait_ms=ENCODE_BATCH_MAX_WAIT_MS,
+            cascade=MATCH_CASCADE,
+            candidate_pool_size=MATCH_CANDIDATE_POOL_SIZE
+        )
+        
+        if _matcher_instance.skill_embeddings is not None:
+            from ml_models.skill_embeddings import register_skill_listener
+            register_skill_listener(_matcher_instance.skill_embeddings)
     
     return _matcher_instance
 
@@ -0,0 +1,241 @@
+"""
+Semantic internship search
+
+Free-text search over open postings. The index keeps one normalized
+embedding per posting (reusing the matcher's cached vectors) together with
+the filter columns (industry, employer, posting type) as NumPy arrays, so a
+query is one encode call, one matrix-vector product and an argpartition.
+
+The index is rebuilt only when the open postings, their skills or their
+employers change, detected with a single aggregate query. Each rebuild
+produces a new immutable snapshot that replaces the old one in a single
+assignment, so a concurrent search always sees one consistent version.
+Without Sentence Transformers it falls back to a TF-IDF index over the
+same texts.
+
+Author: ILEAP Development Team
+Version: 1.0.0
+"""
+
+import threading
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+from sqlalchemy import func, select, true
+from sqlalchemy.orm import Session
+
+from ml_models.enhanced_matcher import CUSTOM_STOP_WORDS, EnhancedInternshipMatcher, get_matcher
+
+
+# Statuses a posting must have to be searchable (same as the listing endpoints)
+SEARCHABLE_STATUSES = ('open',)
+
+# Weight of query-term overlap when hybrid reranking is on
+HYBRID_KEYWORD_WEIGHT = 0.2
+
+
+class _IndexSnapshot(NamedTuple):
+    """One built version of the index; never modified after construction"""
+    internship_ids: np.ndarray
+    industry_ids: np.ndarray
+    employer_ids: np.ndarray
+    posting_types: np.ndarray
+    texts: List[str]
+    matrix: Any
+    vectorizer: Any  # TF-IDF fallback only
+
+
+_EMPTY_SNAPSHOT = _IndexSnapshot(
+    np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64),
+    np.zeros(0, dtype=object), [], None, None
+)
+
+
+class InternshipSearchIndex:
+    """
+    In-memory search index over open internships
+    """
+
+    def __init__(self, matcher: Optional[EnhancedInternshipMatcher] = None):
+        self.matcher = matcher or get_matcher()
+        self._signature = None
+        self._lock = threading.Lock()  # Serializes rebuilds; searches never take it
+        self._snapshot = _EMPTY_SNAPSHOT
+
+    def __len__(self) -> int:
+        return len(self._snapshot.internship_ids)
+
+    @staticmethod
+    def _signature_of(db: Session):
+        """
+        Cheap fingerprint of everything the indexed texts are built from
+
+        Covers the searchable postings (count, ids, last update), their skill
+        links (count, skill ids) and their employers (count, industries, last
+        update).
+        """
+        from models import Employer, Internship, internship_skills
+
+        searchable = Internship.status.in_(SEARCHABLE_STATUSES)
+        searchable_ids = select(Internship.internship_id).where(searchable)
+        searchable_employer_ids = select(Internship.employer_id).where(searchable)
+
+        skill_links = select(
+            func.count(),
+            func.sum(internship_skills.c.skill_id)
+        ).where(internship_skills.c.internship_id.in_(searchable_ids)).subquery()
+        employers = select(
+            func.count(Employer.employer_id),
+            func.sum(Employer.industry_id),
+            func.max(Employer.updated_at)
+        ).where(Employer.employer_id.in_(searchable_employer_ids)).subquery()
+        postings = select(
+            func.count(Internship.internship_id),
+            func.sum(Internship.internship_id),
+            func.max(Internship.updated_at)
+        ).where(searchable).subquery()
+
+        # Three one-row aggregates side by side
+        return tuple(db.execute(
+            select(postings, skill_links, employers).select_from(
+                postings.join(skill_links, true()).join(employers, true())
+            )
+        ).one())
+
+    def refresh(self, db: Session, force: bool = False) -> bool:
+        """
+        Rebuild the index if the searchable postings changed
+
+        Returns:
+            True if the index was rebuilt
+        """
+        from models import Internship
+        from ml_models.match_service import with_match_loading
+
+        signature = self._signature_of(db)
+        if not force and signature == self._signature:
+            return False
+
+        with self._lock:
+            if not force and signature == self._signature:
+                return False
+
+            internships = with_match_loading(
+                db.query(Internship).filter(Internship.status.in_(SEARCHABLE_STATUSES))
+            ).order_by(Internship.internship_id).all()
+            data = [EnhancedInternshipMatcher._internship_to_data(i) for i in internships]
+            texts = [self.matcher.clean_text(self.matcher._internship_text(d)) for d in data]
+
+            matrix, vectorizer = None, None
+            if data and self.matcher.use_sentence_transformers and self.matcher.sentence_model:
+                matrix = self.matcher.embed_internships(data)
+            elif data:
+                from sklearn.feature_extraction.text import TfidfVectorizer
+                vectorizer = TfidfVectorizer(stop_words=list(CUSTOM_STOP_WORDS), ngram_range=(1, 2), sublinear_tf=True)
+                try:
+                    matrix = vectorizer.fit_transform(texts)
+                except ValueError:
+                    vectorizer = None  # Empty vocabulary
+
+            # Publish the new version with one reference swap
+            self._snapshot = _IndexSnapshot(
+                internship_ids=np.array([d['internship_id'] for d in data], dtype=np.int64),
+                industry_ids=np.array([d['industry_id'] or 0 for d in data], dtype=np.int64),
+                employer_ids=np.array([d['employer_id'] or 0 for d in data], dtype=np.int64),
+                posting_types=np.array([d['posting_type'] for d in data], dtype=object),
+                texts=texts,
+                matrix=matrix,
+                vectorizer=vectorizer
+            )
+            self._signature = signature
+            return True
+
+    def _query_scores(self, snapshot: _IndexSnapshot, query_text: str) -> np.ndarray:
+        if snapshot.matrix is None:
+            return np.zeros(len(snapshot.internship_ids))
+        if snapshot.vectorizer is not None:
+            return (snapshot.matrix @ snapshot.vectorizer.transform([query_text]).T).toarray().ravel()
+        return snapshot.matrix @ self.matcher.embed_texts([query_text])[0]
+
+    def search(
+        self,
+        query: str,
+        limit: int = 20,
+        industry_ids: Optional[Sequence[int]] = None,
+        employer_ids: Optional[Sequence[int]] = None,
+        posting_type: Optional[str] = None,
+        hybrid: bool = False,
+        min_score: float = 0.0
+    ) -> List[Dict]:
+        """
+        Rank postings by similarity to a free-text query
+
+        Args:
+            query: Free-text query
+            limit: Number of results
+            industry_ids: Keep only postings of these industries
+            employer_ids: Keep only postings of these employers
+            posting_type: Keep only 'internship' or 'job_placement'
+            hybrid: Rerank the top candidates with query-term overlap
+            min_score: Drop results scoring below this
+
+        Returns:
+            List of {'internship_id', 'score', 'semantic_score', 'keyword_score'}, best first
+        """
+        query_text = self.matcher.clean_text(self.matcher.normalize_job_title(query))
+        snapshot = self._snapshot  # Read once: a concurrent refresh swaps in a new one
+        if not query_text or len(snapshot.internship_ids) == 0:
+            return []
+
+        mask = np.ones(len(snapshot.internship_ids), dtype=bool)
+        if industry_ids:
+            mask &= np.isin(snapshot.industry_ids, list(industry_ids))
+        if employer_ids:
+            mask &= np.isin(snapshot.employer_ids, list(employer_ids))
+        if posting_type:
+            mask &= snapshot.posting_types == posting_type
+
+        candidates = np.flatnonzero(mask)
+        if len(candidates) == 0:
+            return []
+
+        semantic = np.clip(self._query_scores(snapshot, query_text)[candidates], 0.0, 1.0)
+
+        # Rerank a few times more candidates than requested
+        pool = min(len(candidates), max(limit * 5, 50) if hybrid else limit)
+        top = np.argpartition(-semantic, pool - 1)[:pool]
+
+        keyword = np.zeros(len(top))
+        if hybrid:
+            terms = set(query_text.split())
+            keyword = np.array([
+                len(terms.intersection(snapshot.texts[candidates[i]].split())) / len(terms)
+                for i in top
+            ])
+        scores = (1 - HYBRID_KEYWORD_WEIGHT) * semantic[top] + HYBRID_KEYWORD_WEIGHT * keyword if hybrid else semantic[top]
+
+        order = np.argsort(-scores, kind='stable')[:limit]
+        return [
+            {
+                'internship_id': int(snapshot.internship_ids[candidates[top[i]]]),
+                'score': round(float(scores[i]), 4),
+                'semantic_score': round(float(semantic[top[i]]), 4),
+                'keyword_score': round(float(keyword[i]), 4)
+            }
+            for i in order
+            if scores[i] >= min_score
+        ]
+
+
+# Global index instance
+_search_index = None
+
+
+def get_search_index() -> InternshipSearchIndex:
+    """Get or create the global search index"""
+    global _search_index
+
+    if _search_index is None:
+        _search_index = InternshipSearchIndex()
+
+    return _search_index
@@ -0,0 +1,128 @@
+"""
+Batched internship scoring service
+
+One entry point for "score these internships for this student", shared by the
+internship listing endpoints and EnhancedInternshipMatcher.get_top_matches:
+
+- employer, industry and skills are eager-loaded with the internships
+  (utils.loader_options.INTERNSHIP_LISTING)
+- the student's program/department come from their active class enrollment
+  (falling back to the student profile)
+- all internships are scored in one calculate_match_scores() call
+- matches are stored with one multi-row upsert
+
+Author: ILEAP Development Team
+Version: 1.0.0
+"""
+
+from typing import Dict, List, NamedTuple, Optional
+
+from sqlalchemy.orm import Query, Session, joinedload
+
+from schemas.internship import MatchResult
+
+
+class ScoredInternship(NamedTuple):
+    internship: object  # models.Internship (employer, industry and skills loaded)
+    data: Dict  # Matcher input dict (see EnhancedInternshipMatcher._internship_to_data)
+    match: Optional[MatchResult]  # None when the internship was not scored
+
+
+def with_match_loading(query: Query) -> Query:
+    """Eager-load everything the matcher and the listing responses read"""
+    from utils.loader_options import INTERNSHIP_LISTING
+
+    return query.options(*INTERNSHIP_LISTING)
+
+
+def build_student_data(db: Session, student) -> Dict:
+    """
+    Matcher input dict for a student
+
+    Program and department come from the class of the student's active
+    enrollment; without one, the student profile fields are used.
+    """
+    from models import ClassEnrollment, Class, Program
+
+    program_text = student.program or ""
+    department_text = student.department or ""
+
+    class_info = db.query(Class).options(
+        joinedload(Class.program).joinedload(Program.department)
+    ).join(
+        ClassEnrollment, ClassEnrollment.class_id == Class.class_id
+    ).filter(
+        ClassEnrollment.student_id == student.student_id,
+        ClassEnrollment.status == "active"
+    ).first()
+
+    if class_info is not None:
+        program_text, department_text = "", ""
+        if class_info.program:
+            program_text = class_info.program.program_name or ""
+            if class_info.program.department:
+                department_text = class_info.program.department.department_name or ""
+
+    return {
+        'student_id': student.student_id,
+        'skills': [skill.skill_name for skill in student.skills] if student.skills else [],
+        'program': program_text,
+        'major': student.major or "",
+        'department': department_text,
+        'about': student.about or ""
+    }
+
+
+def score_internships(
+    db: Session,
+    student,
+    query: Query,
+    store_matches: bool = True,
+    matcher=None
+) -> List[ScoredInternship]:
+    """
+    Load the internships selected by query and score them for student
+
+    Args:
+        db: Database session
+        student: Student row, or None to load the internships unscored
+        query: Internship query (filters, ordering and pagination already applied)
+        store_matches: Upsert the scores into student_internship_matches
+        matcher: Matcher to use (default: shared get_matcher() instance)
+
+    Returns:
+        One ScoredInternship per internship, in query order
+    """
+    from ml_models.enhanced_matcher import EnhancedInternshipMatcher, get_matcher
+
+    internships = with_match_loading(query).all()
+    internship_data_list = [EnhancedInternshipMatcher._internship_to_data(i) for i in internships]
+
+    if student is None or not internships:
+        return [ScoredInternship(i, d, None) for i, d in zip(internships, internship_data_list)]
+
+    matcher = matcher or get_matcher()
+    try:
+        student_data = build_student_data(db, student)
+        results = matcher.calculate_match_scores(db, student_data, internship_data_list)
+    except Exception as e:
+        print(f"Error in enhanced matching: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return [ScoredInternship(i, d, None) for i, d in zip(internships, internship_data_list)]
+
+    if store_matches:
+        # Keep the loaded internships usable after the commit (no per-row reloads)
+        expire_on_commit, db.expire_on_commit = db.expire_on_commit, False
+        try:
+            matcher._store_matches(db, student.student_id, [
+                {'internship_id': d['internship_id'], **result}
+                for d, result in zip(internship_data_list, results)
+            ])
+        finally:
+            db.expire_on_commit = expire_on_commit
+
+    return [
+        ScoredInternship(i, d, MatchResult(**result))
+        for i, d, result in zip(internships, internship_data_list, results)
+    ]
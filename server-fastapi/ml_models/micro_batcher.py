@@ -0,0 +1,162 @@
+"""
+Micro-batching front-end for the sentence model
+
+Concurrent requests each call encode() on a couple of sentences, which leaves
+most of the transformer's batch throughput unused. MicroBatchEncoder collects
+those calls for a few milliseconds (or until enough texts are queued), runs a
+single batched forward pass and hands each caller back its own rows.
+
+It keeps the SentenceTransformer encode() interface, so the matcher can use it
+as a drop-in replacement for the model.
+
+Author: ILEAP Development Team
+Version: 1.0.0
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from utils.metrics import Histogram
+
+
+# Histogram bucket upper bounds
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+QUEUE_TIME_MS_BUCKETS = (0.5, 1, 2, 5, 10, 20, 50, 100, 250)
+
+
+class _EncodeRequest:
+    __slots__ = ('texts', 'kwargs', 'key', 'future', 'enqueued_at')
+
+    def __init__(self, texts: List[str], kwargs: Dict):
+        self.texts = texts
+        self.kwargs = kwargs
+        self.key = tuple(sorted(kwargs.items()))
+        self.future = Future()
+        self.enqueued_at = time.perf_counter()
+
+
+class MicroBatchEncoder:
+    """
+    Coalesce concurrent encode() calls into batched forward passes
+
+    A background thread waits for the first queued request, then keeps
+    collecting until either max_batch_size texts are queued or the oldest
+    request has waited max_wait_ms. Requests are only merged when their
+    encode() keyword arguments match. Calls with max_batch_size texts or more
+    bypass the queue and are encoded directly.
+    """
+
+    def __init__(self, model, max_batch_size: int = 64, max_wait_ms: float = 5.0):
+        """
+        Args:
+            model: Object with a SentenceTransformer-compatible encode()
+            max_batch_size: Upper bound on texts per forward pass
+            max_wait_ms: Longest time a request waits for others to join it
+        """
+        self.model = model
+        self.max_batch_size = max(1, int(max_batch_size))
+        self.max_wait = max(0.0, float(max_wait_ms)) / 1000.0
+
+        self.batch_size_histogram = Histogram(BATCH_SIZE_BUCKETS)
+        self.queue_time_histogram = Histogram(QUEUE_TIME_MS_BUCKETS)
+
+        self._queue: deque = deque()
+        self._queued_texts = 0
+        self._cond = threading.Condition()
+        self._worker: Optional[threading.Thread] = None
+
+    def __getattr__(self, name):
+        # Anything other than encode() goes straight to the wrapped model
+        return getattr(self.model, name)
+
+    def encode(self, sentences, **kwargs) -> np.ndarray:
+        """Encode sentences through the shared batch queue (blocking)"""
+        if isinstance(sentences, str):
+            return self.encode([sentences], **kwargs)[0]
+
+        texts = list(sentences)
+        if not texts or len(texts) >= self.max_batch_size:
+            # Bulk loads (embedding tables, index builds) already fill batches on
+            # their own: run them directly with the caller's batch size
+            return self.model.encode(texts, **kwargs)
+
+        kwargs.pop('batch_size', None)
+        request = _EncodeRequest(texts, kwargs)
+        with self._cond:
+            self._ensure_worker()
+            self._queue.append(request)
+            self._queued_texts += len(texts)
+            self._cond.notify()
+        return request.future.result()
+
+    def stats(self) -> Dict:
+        """Current configuration, queue depth and histograms"""
+        with self._cond:
+            queued_requests, queued_texts = len(self._queue), self._queued_texts
+        return {
+            'max_batch_size': self.max_batch_size,
+            'max_wait_ms': self.max_wait * 1000.0,
+            'queued_requests': queued_requests,
+            'queued_texts': queued_texts,
+            'batch_size': self.batch_size_histogram.snapshot(),
+            'queue_time_ms': self.queue_time_histogram.snapshot()
+        }
+
+    def _ensure_worker(self):
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._run, name="encode-micro-batcher", daemon=True)
+            self._worker.start()
+
+    def _next_batch(self) -> List[_EncodeRequest]:
+        """Block until a batch is ready, then pop compatible requests from the queue"""
+        with self._cond:
+            while not self._queue:
+                self._cond.wait()
+
+            deadline = self._queue[0].enqueued_at + self.max_wait
+            while self._queued_texts < self.max_batch_size:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+
+            head = self._queue.popleft()
+            batch, size = [head], len(head.texts)
+            skipped = deque()
+            while self._queue and size < self.max_batch_size:
+                request = self._queue.popleft()
+                if request.key == head.key and size + len(request.texts) <= self.max_batch_size:
+                    batch.append(request)
+                    size += len(request.texts)
+                else:
+                    skipped.append(request)
+            skipped.extend(self._queue)
+            self._queue = skipped
+            self._queued_texts -= size
+            return batch
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            started = time.perf_counter()
+            for request in batch:
+                self.queue_time_histogram.observe((started - request.enqueued_at) * 1000.0)
+
+            texts = [text for request in batch for text in request.texts]
+            self.batch_size_histogram.observe(len(texts))
+            try:
+                embeddings = self.model.encode(texts, batch_size=len(texts), **batch[0].kwargs)
+            except Exception as e:
+                for request in batch:
+                    request.future.set_exception(e)
+                continue
+
+            offset = 0
+            for request in batch:
+                request.future.set_result(embeddings[offset:offset + len(request.texts)])
+                offset += len(request.texts)
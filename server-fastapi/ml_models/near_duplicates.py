@@ -0,0 +1,361 @@
+"""
+Near-duplicate internship detection (MinHash + LSH)
+
+Each posting's cleaned title + description is cut into word shingles and
+summarized by a MinHash signature. Signatures are split into bands; postings
+that share any band land in the same LSH bucket and become candidates, and
+only candidates are compared (estimated Jaccard from the signatures). A new
+posting is therefore checked against a handful of buckets instead of every
+other posting.
+
+Only postings of the same employer can be duplicates: different companies
+often share boilerplate text but are distinct openings.
+
+The index lives in memory. A new posting is hashed on its own (add); sync()
+reconciles the whole table (a single aggregate query detects changes, and
+only new or edited postings are re-hashed) and sync_ids() just the given
+postings.
+
+Author: ILEAP Development Team
+Version: 1.0.0
+"""
+
+import threading
+import zlib
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set
+
+import numpy as np
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from ml_models.enhanced_matcher import EnhancedInternshipMatcher
+
+
+SHINGLE_SIZE = 3  # Words per shingle
+NUM_PERMUTATIONS = 128
+NUM_BANDS = 16  # 16 bands x 8 rows: candidate threshold ~0.7 Jaccard
+DUPLICATE_THRESHOLD = 0.8  # Estimated Jaccard to call two postings duplicates
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+
+
+def posting_text(title: str, description: str) -> str:
+    """Cleaned text a posting is shingled from"""
+    return EnhancedInternshipMatcher.clean_text(
+        f"{title or ''} {EnhancedInternshipMatcher.clean_html(description or '')}"
+    )
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> Set[str]:
+    """Word shingles of a cleaned text (the whole text if it is shorter than size)"""
+    words = text.split()
+    if len(words) <= size:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+class MinHasher:
+    """MinHash signatures with fixed universal hash permutations"""
+
+    def __init__(self, num_permutations: int = NUM_PERMUTATIONS, seed: int = 1):
+        rng = np.random.RandomState(seed)
+        # a < 2^31 and x, b < 2^32 keep a * x + b inside uint64 before the modulo
+        self.a = rng.randint(1, 1 << 31, size=num_permutations, dtype=np.uint64)
+        self.b = rng.randint(0, 1 << 32, size=num_permutations, dtype=np.uint64)
+
+    def signature(self, shingle_set: Iterable[str]) -> np.ndarray:
+        hashes = np.fromiter(
+            (zlib.crc32(s.encode('utf-8')) for s in shingle_set),
+            dtype=np.uint64
+        )
+        if len(hashes) == 0:
+            return np.full(len(self.a), _MAX_HASH, dtype=np.uint64)
+        permuted = (np.outer(self.a, hashes) + self.b[:, None]) % _MERSENNE_PRIME & _MAX_HASH
+        return permuted.min(axis=1)
+
+
+class NearDuplicateIndex:
+    """
+    LSH index of posting signatures with incremental DB sync
+    """
+
+    def __init__(
+        self,
+        num_permutations: int = NUM_PERMUTATIONS,
+        num_bands: int = NUM_BANDS,
+        threshold: float = DUPLICATE_THRESHOLD
+    ):
+        if num_permutations % num_bands:
+            raise ValueError("num_permutations must be a multiple of num_bands")
+        self.hasher = MinHasher(num_permutations)
+        self.num_bands = num_bands
+        self.rows = num_permutations // num_bands
+        self.threshold = threshold
+
+        self._signatures: Dict[int, np.ndarray] = {}
+        self._versions: Dict[int, object] = {}  # internship_id -> updated_at at hashing time
+        self._employers: Dict[int, Optional[int]] = {}  # internship_id -> employer_id
+        self._buckets: List[Dict[bytes, Set[int]]] = [defaultdict(set) for _ in range(num_bands)]
+        self._fingerprint = None
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    @property
+    def synced(self) -> bool:
+        """Whether the index has been filled from the database at least once"""
+        return self._fingerprint is not None
+
+    def _bands(self, signature: np.ndarray) -> List[bytes]:
+        return [signature[i * self.rows:(i + 1) * self.rows].tobytes() for i in range(self.num_bands)]
+
+    def add(self, internship_id: int, text: str, version=None, employer_id: Optional[int] = None):
+        """Index (or re-index) one posting"""
+        signature = self.hasher.signature(shingles(text))
+        with self._lock:
+            self.remove(internship_id)
+            self._signatures[internship_id] = signature
+            self._versions[internship_id] = version
+            self._employers[internship_id] = employer_id
+            for bucket, band in zip(self._buckets, self._bands(signature)):
+                bucket[band].add(internship_id)
+
+    def remove(self, internship_id: int):
+        with self._lock:
+            signature = self._signatures.pop(internship_id, None)
+            self._versions.pop(internship_id, None)
+            self._employers.pop(internship_id, None)
+            if signature is None:
+                return
+            for bucket, band in zip(self._buckets, self._bands(signature)):
+                members = bucket.get(band)
+                if members:
+                    members.discard(internship_id)
+                    if not members:
+                        del bucket[band]
+
+    def similar_to(
+        self,
+        signature: np.ndarray,
+        employer_id: Optional[int],
+        exclude: Optional[int] = None
+    ) -> List[Dict]:
+        """Indexed postings of employer_id whose estimated Jaccard with signature reaches the threshold"""
+        with self._lock:
+            candidates = set()
+            for bucket, band in zip(self._buckets, self._bands(signature)):
+                candidates |= bucket.get(band, set())
+            candidates.discard(exclude)
+
+            matches = []
+            for candidate in candidates:
+                if self._employers.get(candidate) != employer_id:
+                    continue
+                similarity = float(np.mean(self._signatures[candidate] == signature))
+                if similarity >= self.threshold:
+                    matches.append({'internship_id': candidate, 'similarity': round(similarity, 4)})
+
+        matches.sort(key=lambda m: m['similarity'], reverse=True)
+        return matches
+
+    def find_duplicates(
+        self,
+        title: str,
+        description: str,
+        employer_id: Optional[int],
+        exclude: Optional[int] = None
+    ) -> List[Dict]:
+        """Near-duplicates of a (possibly unsaved) posting among the employer's postings"""
+        signature = self.hasher.signature(shingles(posting_text(title, description)))
+        return self.similar_to(signature, employer_id, exclude)
+
+    def _rehash(self, db: Session, internship_ids: List[int]) -> None:
+        from models import Internship
+
+        for start in range(0, len(internship_ids), 1000):
+            rows = db.query(
+                Internship.internship_id, Internship.title, Internship.full_description,
+                Internship.updated_at, Internship.employer_id
+            ).filter(Internship.internship_id.in_(internship_ids[start:start + 1000])).all()
+            for internship_id, title, description, updated_at, employer_id in rows:
+                self.add(internship_id, posting_text(title, description), updated_at, employer_id)
+
+    def sync(self, db: Session, force: bool = False) -> int:
+        """
+        Bring the index in line with the internships table
+
+        Returns:
+            Number of postings (re-)hashed
+        """
+        from models import Internship
+
+        fingerprint = tuple(db.query(
+            func.count(Internship.internship_id),
+            func.sum(Internship.internship_id),
+            func.max(Internship.updated_at)
+        ).one())
+        if not force and fingerprint == self._fingerprint:
+            return 0
+
+        with self._lock:
+            versions = dict(db.query(Internship.internship_id, Internship.updated_at).all())
+            for internship_id in set(self._signatures) - set(versions):
+                self.remove(internship_id)
+
+            stale = [
+                internship_id for internship_id, version in versions.items()
+                if force or internship_id not in self._signatures or self._versions.get(internship_id) != version
+            ]
+            self._rehash(db, stale)
+
+            self._fingerprint = fingerprint
+            return len(stale)
+
+    def sync_ids(self, db: Session, internship_ids: Iterable[int]) -> int:
+        """
+        Bring just these postings in line with the table (new, edited or deleted)
+
+        Returns:
+            Number of postings (re-)hashed
+        """
+        from models import Internship
+
+        internship_ids = list(set(internship_ids))
+        if not internship_ids:
+            return 0
+
+        with self._lock:
+            versions = {}
+            for start in range(0, len(internship_ids), 1000):
+                versions.update(db.query(Internship.internship_id, Internship.updated_at).filter(
+                    Internship.internship_id.in_(internship_ids[start:start + 1000])
+                ).all())
+            for internship_id in set(internship_ids) - set(versions):
+                self.remove(internship_id)
+
+            stale = [
+                internship_id for internship_id, version in versions.items()
+                if internship_id not in self._signatures or self._versions.get(internship_id) != version
+            ]
+            self._rehash(db, stale)
+            return len(stale)
+
+    def clusters(self, ids: Optional[Iterable[int]] = None) -> List[List[int]]:
+        """
+        Groups of near-duplicate postings of the same employer (union-find
+        over LSH candidate pairs)
+
+        Args:
+            ids: Restrict to these postings (default: everything indexed)
+
+        Returns:
+            Clusters with two or more members, each sorted by internship_id
+        """
+        with self._lock:
+            members = set(self._signatures) if ids is None else set(ids) & set(self._signatures)
+            parent = {i: i for i in members}
+
+            def find(i):
+                while parent[i] != i:
+                    parent[i] = parent[parent[i]]
+                    i = parent[i]
+                return i
+
+            for bucket in self._buckets:
+                for bucket_ids in bucket.values():
+                    group = [i for i in bucket_ids if i in members]
+                    for i, first in enumerate(group):
+                        for other in group[i + 1:]:
+                            if find(first) == find(other):
+                                continue
+                            if self._employers.get(first) != self._employers.get(other):
+                                continue
+                            similarity = np.mean(self._signatures[first] == self._signatures[other])
+                            if similarity >= self.threshold:
+                                parent[find(other)] = find(first)
+
+        groups = defaultdict(list)
+        for i in members:
+            groups[find(i)].append(i)
+        return sorted((sorted(g) for g in groups.values() if len(g) > 1), key=lambda g: g[0])
+
+    def collapse(self, matches: List[Dict], key: str = 'internship_id') -> List[Dict]:
+        """
+        Keep the first (best-ranked) posting of each near-duplicate cluster
+
+        The kept entry gets 'duplicate_count' (number of hidden copies) and
+        'duplicate_ids'. Input order is preserved.
+        """
+        cluster_of = {}
+        for cluster in self.clusters(m[key] for m in matches):
+            for internship_id in cluster:
+                cluster_of[internship_id] = cluster[0]
+
+        kept, seen = [], {}
+        for match in matches:
+            cluster = cluster_of.get(match[key])
+            if cluster is None:
+                kept.append(match)
+            elif cluster in seen:
+                first = seen[cluster]
+                first['duplicate_count'] += 1
+                first['duplicate_ids'].append(match[key])
+            else:
+                match = {**match, 'duplicate_count': 0, 'duplicate_ids': []}
+                seen[cluster] = match
+                kept.append(match)
+        return kept
+
+
+# Global index instance
+_duplicate_index = None
+
+
+def get_duplicate_index() -> NearDuplicateIndex:
+    """Get or create the global near-duplicate index"""
+    global _duplicate_index
+
+    if _duplicate_index is None:
+        _duplicate_index = NearDuplicateIndex()
+
+    return _duplicate_index
+
+
+def duplicate_report(db: Session) -> List[Dict]:
+    """Near-duplicate clusters over the whole internships table"""
+    from models import Internship, Employer
+    from sqlalchemy.orm import joinedload
+
+    index = get_duplicate_index()
+    index.sync(db)
+    clusters = index.clusters()
+
+    ids = [i for cluster in clusters for i in cluster]
+    internships = {
+        i.internship_id: i
+        for i in db.query(Internship).options(joinedload(Internship.employer)).filter(
+            Internship.internship_id.in_(ids)
+        ).all()
+    } if ids else {}
+
+    report = []
+    for cluster in clusters:
+        postings = [internships[i] for i in cluster if i in internships]
+        report.append({
+            'size': len(postings),
+            'internships': [
+                {
+                    'internship_id': p.internship_id,
+                    'title': p.title,
+                    'employer_id': p.employer_id,
+                    'company_name': p.employer.company_name if p.employer else None,
+                    'status': p.status,
+                    'created_at': p.created_at.isoformat() if p.created_at else None
+                }
+                for p in postings
+            ]
+        })
+    return report
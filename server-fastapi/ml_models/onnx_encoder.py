@@ -0,0 +1,283 @@
+"""
+Quantized ONNX Runtime backend for the sentence model
+
+Exports the transformer behind a SentenceTransformer model to ONNX once,
+applies dynamic int8 quantization to its weights and serves it with ONNX
+Runtime on CPU. OnnxSentenceEncoder keeps the SentenceTransformer encode()
+interface (mean pooling + optional L2 normalization), so the matcher can use
+it in place of the PyTorch model.
+
+Usage:
+    python -m ml_models.onnx_encoder --export     # export + quantize
+    python -m ml_models.onnx_encoder --check      # accuracy vs float model
+
+Requires (optional): onnx, onnxruntime, transformers
+
+Author: ILEAP Development Team
+Version: 1.0.0
+"""
+
+import argparse
+import json
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+
+DEFAULT_MODEL_NAME = 'all-MiniLM-L6-v2'
+DEFAULT_EXPORT_ROOT = Path(__file__).resolve().parent / 'onnx'
+
+FLOAT_MODEL_FILE = 'model.onnx'
+QUANTIZED_MODEL_FILE = 'model.int8.onnx'
+CONFIG_FILE = 'encoder_config.json'
+
+# Sample texts for the accuracy check (mix of student and posting text)
+ACCURACY_SAMPLE_TEXTS = [
+    "python javascript react structured query language computer science software engineering",
+    "software engineering intern looking for a computer science student with web development skills",
+    "autocad solidworks mechanical engineering manufacturing design",
+    "site engineer intern construction structural surveying civil engineering",
+    "digital marketing social media content seo advertising campaign",
+    "accounting bookkeeping audit tax payroll finance",
+    "network administrator helpdesk infrastructure cybersecurity server cloud",
+    "graphic design video editing animation photoshop illustrator premiere",
+    "electrical electronics circuit power automation plc scada instrumentation",
+    "business analyst erp crm project management business intelligence",
+    "technical writer documentation user guides markdown communication",
+    "machine learning artificial intelligence data analysis algorithms",
+]
+
+
+def default_model_dir(model_name: str = DEFAULT_MODEL_NAME) -> Path:
+    """Directory holding the exported model files for model_name"""
+    return DEFAULT_EXPORT_ROOT / model_name.replace('/', '_')
+
+
+def export_quantized_model(model_name: str = DEFAULT_MODEL_NAME, model_dir: Optional[Path] = None) -> Path:
+    """
+    Export a SentenceTransformer's transformer to ONNX and quantize it to int8
+
+    Args:
+        model_name: SentenceTransformer model name
+        model_dir: Output directory (default: ml_models/onnx/<model_name>)
+
+    Returns:
+        Path to the export directory
+    """
+    import torch
+    from sentence_transformers import SentenceTransformer
+    from onnxruntime.quantization import quantize_dynamic, QuantType
+
+    model_dir = Path(model_dir or default_model_dir(model_name))
+    model_dir.mkdir(parents=True, exist_ok=True)
+
+    sentence_model = SentenceTransformer(model_name, device='cpu')
+    transformer = sentence_model[0].auto_model.eval()
+    tokenizer = sentence_model.tokenizer
+
+    class _LastHiddenState(torch.nn.Module):
+        def __init__(self, model):
+            super().__init__()
+            self.model = model
+
+        def forward(self, input_ids, attention_mask, token_type_ids):
+            return self.model(
+                input_ids=input_ids,
+                attention_mask=attention_mask,
+                token_type_ids=token_type_ids
+            ).last_hidden_state
+
+    dummy = tokenizer(["export sample"], return_tensors='pt', padding=True)
+    token_type_ids = dummy.get('token_type_ids', torch.zeros_like(dummy['input_ids']))
+    dynamic_axes = {name: {0: 'batch', 1: 'sequence'} for name in ('input_ids', 'attention_mask', 'token_type_ids')}
+    dynamic_axes['last_hidden_state'] = {0: 'batch', 1: 'sequence'}
+
+    float_path = model_dir / FLOAT_MODEL_FILE
+    with torch.no_grad():
+        torch.onnx.export(
+            _LastHiddenState(transformer),
+            (dummy['input_ids'], dummy['attention_mask'], token_type_ids),
+            str(float_path),
+            input_names=['input_ids', 'attention_mask', 'token_type_ids'],
+            output_names=['last_hidden_state'],
+            dynamic_axes=dynamic_axes,
+            opset_version=14
+        )
+
+    quantize_dynamic(str(float_path), str(model_dir / QUANTIZED_MODEL_FILE), weight_type=QuantType.QInt8)
+
+    tokenizer.save_pretrained(str(model_dir))
+    config = {
+        'model_name': model_name,
+        'max_seq_length': int(sentence_model.max_seq_length or 256),
+        'normalize': any(type(module).__name__ == 'Normalize' for module in sentence_model)
+    }
+    (model_dir / CONFIG_FILE).write_text(json.dumps(config, indent=2))
+
+    print(f"✓ Exported {model_name} to {model_dir} (int8: {QUANTIZED_MODEL_FILE})")
+    return model_dir
+
+
+class OnnxSentenceEncoder:
+    """
+    ONNX Runtime sentence encoder with a SentenceTransformer-style encode()
+    """
+
+    def __init__(self, model_dir: Path, quantized: bool = True, num_threads: Optional[int] = None):
+        """
+        Args:
+            model_dir: Directory produced by export_quantized_model()
+            quantized: Load the int8 model (True) or the float ONNX model (False)
+            num_threads: ONNX Runtime intra-op threads (default: runtime decides)
+        """
+        import onnxruntime as ort
+        from transformers import AutoTokenizer
+
+        model_dir = Path(model_dir)
+        config = json.loads((model_dir / CONFIG_FILE).read_text())
+        self.model_name = config['model_name']
+        self.max_seq_length = config['max_seq_length']
+        self.normalize = config['normalize']
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if num_threads:
+            options.intra_op_num_threads = num_threads
+
+        model_file = QUANTIZED_MODEL_FILE if quantized else FLOAT_MODEL_FILE
+        self.session = ort.InferenceSession(
+            str(model_dir / model_file), options, providers=['CPUExecutionProvider']
+        )
+        self.input_names = {i.name for i in self.session.get_inputs()}
+        self.tokenizer = AutoTokenizer.from_pretrained(str(model_dir))
+
+    def get_sentence_embedding_dimension(self) -> int:
+        return int(self.session.get_outputs()[0].shape[-1])
+
+    def encode(
+        self,
+        sentences,
+        batch_size: int = 32,
+        normalize_embeddings: bool = False,
+        show_progress_bar: bool = False,
+        convert_to_numpy: bool = True,
+        **kwargs
+    ) -> np.ndarray:
+        """
+        Encode sentences into embeddings (mean pooling over token states)
+
+        Returns:
+            float32 array of shape (n, dim), or (dim,) for a single string
+        """
+        if isinstance(sentences, str):
+            return self.encode([sentences], batch_size, normalize_embeddings)[0]
+
+        sentences = list(sentences)
+        if not sentences:
+            return np.zeros((0, self.get_sentence_embedding_dimension()), dtype=np.float32)
+
+        # Sort by length so each batch pads to a similar size
+        order = np.argsort([-len(s) for s in sentences], kind='stable')
+        embeddings = np.empty((len(sentences), self.get_sentence_embedding_dimension()), dtype=np.float32)
+
+        for start in range(0, len(sentences), max(1, batch_size)):
+            idx = order[start:start + batch_size]
+            tokens = self.tokenizer(
+                [sentences[i] for i in idx],
+                padding=True,
+                truncation=True,
+                max_length=self.max_seq_length,
+                return_tensors='np'
+            )
+            feed = {name: tokens[name].astype(np.int64) for name in self.input_names if name in tokens}
+            if 'token_type_ids' in self.input_names and 'token_type_ids' not in feed:
+                feed['token_type_ids'] = np.zeros_like(feed['input_ids'])
+
+            hidden = self.session.run(None, feed)[0]
+            mask = tokens['attention_mask'][..., None].astype(np.float32)
+            pooled = (hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+            embeddings[idx] = pooled
+
+        if self.normalize or normalize_embeddings:
+            embeddings /= np.clip(np.linalg.norm(embeddings, axis=1, keepdims=True), 1e-12, None)
+
+        return embeddings
+
+
+def load_onnx_encoder(
+    model_name: str = DEFAULT_MODEL_NAME,
+    model_dir: Optional[Path] = None,
+    num_threads: Optional[int] = None
+) -> OnnxSentenceEncoder:
+    """Load the int8 encoder, exporting it first if it has not been exported yet"""
+    model_dir = Path(model_dir or default_model_dir(model_name))
+    if not (model_dir / QUANTIZED_MODEL_FILE).exists() or not (model_dir / CONFIG_FILE).exists():
+        export_quantized_model(model_name, model_dir)
+    return OnnxSentenceEncoder(model_dir, quantized=True, num_threads=num_threads)
+
+
+def check_accuracy(
+    model_name: str = DEFAULT_MODEL_NAME,
+    model_dir: Optional[Path] = None,
+    texts: Optional[List[str]] = None,
+    min_cosine: float = 0.98
+) -> Dict:
+    """
+    Compare int8 ONNX embeddings against the float PyTorch model
+
+    Reports per-sentence cosine agreement, the largest change in any pairwise
+    similarity score, and whether the nearest neighbour of each text is the
+    same under both models.
+    """
+    import time
+    from sentence_transformers import SentenceTransformer
+
+    texts = texts or ACCURACY_SAMPLE_TEXTS
+    float_model = SentenceTransformer(model_name, device='cpu')
+    onnx_model = load_onnx_encoder(model_name, model_dir)
+
+    start = time.perf_counter()
+    reference = float_model.encode(texts, normalize_embeddings=True)
+    float_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    quantized = onnx_model.encode(texts, normalize_embeddings=True)
+    onnx_seconds = time.perf_counter() - start
+
+    cosines = np.sum(reference * quantized, axis=1)
+    ref_sims = reference @ reference.T
+    quant_sims = quantized @ quantized.T
+    np.fill_diagonal(ref_sims, -np.inf)
+    np.fill_diagonal(quant_sims, -np.inf)
+    finite = np.isfinite(ref_sims)
+
+    result = {
+        'texts': len(texts),
+        'min_cosine': round(float(cosines.min()), 4),
+        'mean_cosine': round(float(cosines.mean()), 4),
+        'max_similarity_delta': round(float(np.abs(ref_sims[finite] - quant_sims[finite]).max()), 4),
+        'nearest_neighbour_agreement': round(float(np.mean(ref_sims.argmax(1) == quant_sims.argmax(1))), 4),
+        'float_seconds': round(float_seconds, 4),
+        'onnx_seconds': round(onnx_seconds, 4),
+        'passed': bool(cosines.min() >= min_cosine)
+    }
+    return result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export and check the quantized ONNX sentence encoder")
+    parser.add_argument('--model', default=DEFAULT_MODEL_NAME)
+    parser.add_argument('--model-dir', default=None)
+    parser.add_argument('--export', action='store_true', help="(Re-)export and quantize the model")
+    parser.add_argument('--check', action='store_true', help="Compare int8 embeddings with the float model")
+    parser.add_argument('--min-cosine', type=float, default=0.98)
+    args = parser.parse_args()
+
+    if args.export:
+        export_quantized_model(args.model, args.model_dir)
+    if args.check or not args.export:
+        report = check_accuracy(args.model, args.model_dir, min_cosine=args.min_cosine)
+        print(json.dumps(report, indent=2))
+        if not report['passed']:
+            raise SystemExit(1)
@@ -0,0 +1,134 @@
+"""
+Canonical-skill embedding table
+
+Skill sets are compared semantically by pooling per-skill vectors instead of
+encoding a joined skill string for every student/internship pair. The table
+holds one normalized vector per canonical skill name: every row of the
+`skills` table is encoded once (in one batched call) on first use, and skills
+created afterwards are picked up through a SQLAlchemy after_insert hook and
+encoded on the next lookup.
+
+Author: ILEAP Development Team
+Version: 1.0.0
+"""
+
+import threading
+from typing import Callable, Dict, Iterable, List, Optional
+
+import numpy as np
+
+
+class SkillEmbeddingTable:
+    """
+    Per-skill embedding table with mean-pooled skill-set vectors
+    """
+
+    def __init__(self, encode: Callable[[List[str]], np.ndarray], normalize: Callable[[List[str]], List[str]]):
+        """
+        Args:
+            encode: Encodes a list of texts into L2-normalized rows
+            normalize: Maps raw skill names to canonical names (matcher.normalize_skills)
+        """
+        self._encode = encode
+        self._normalize = normalize
+        self._index: Dict[str, int] = {}
+        self._vectors: Optional[np.ndarray] = None
+        self._pending = set()
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def canonical(self, skills: Iterable[str]) -> List[str]:
+        return sorted({s.lower().strip() for s in self._normalize(list(skills)) if s})
+
+    def load(self, db=None):
+        """Encode every skill in the skills table (once per process)"""
+        from models import Skill
+
+        if self._loaded:
+            return
+
+        own_session = db is None
+        if own_session:
+            from database import SessionLocal
+            db = SessionLocal()
+        try:
+            names = [row.skill_name for row in db.query(Skill.skill_name).all()]
+        finally:
+            if own_session:
+                db.close()
+
+        with self._lock:
+            self._add(self.canonical(names))
+            self._loaded = True
+
+    def mark_pending(self, skill_name: str):
+        """Queue a newly created skill; it is encoded on the next lookup"""
+        with self._lock:
+            self._pending.update(self.canonical([skill_name]))
+
+    def vectors(self, names: List[str]) -> np.ndarray:
+        """Rows for canonical skill names, encoding any that are not in the table yet"""
+        if not self._loaded:
+            try:
+                self.load()
+            except Exception as e:
+                print(f"Warning: Failed to load skill embedding table: {e}")
+                self._loaded = True  # Fall back to encoding skills as they are seen
+
+        with self._lock:
+            self._add(list(self._pending) + [n for n in names if n not in self._index])
+            self._pending.clear()
+            return self._vectors[[self._index[n] for n in names]]
+
+    def pooled(self, skill_sets: List[List[str]]) -> np.ndarray:
+        """
+        Mean-pooled, re-normalized vector per canonical skill set
+
+        Empty sets get a zero row.
+        """
+        vocabulary = sorted({name for names in skill_sets for name in names})
+        if not vocabulary:
+            return np.zeros((len(skill_sets), 0), dtype=np.float32)
+
+        from scipy.sparse import csr_matrix
+
+        table = self.vectors(vocabulary)
+        position = {name: i for i, name in enumerate(vocabulary)}
+
+        # Row-normalized set x skill incidence matrix times the table = mean pooling
+        counts = np.array([len(names) for names in skill_sets])
+        weights = np.repeat(1.0 / np.maximum(counts, 1), counts)
+        columns = [position[n] for names in skill_sets for n in names]
+        incidence = csr_matrix(
+            (weights, columns, np.concatenate([[0], np.cumsum(counts)])),
+            shape=(len(skill_sets), len(vocabulary))
+        )
+        pooled = np.asarray(incidence @ table, dtype=np.float32)
+
+        norms = np.linalg.norm(pooled, axis=1, keepdims=True)
+        return pooled / np.clip(norms, 1e-12, None)
+
+    def _add(self, names: List[str]):
+        # Caller holds the lock
+        names = [n for n in dict.fromkeys(names) if n and n not in self._index]
+        if not names:
+            return
+        new_vectors = np.asarray(self._encode(names), dtype=np.float32)
+        self._vectors = new_vectors if self._vectors is None else np.vstack([self._vectors, new_vectors])
+        for name in names:
+            self._index[name] = len(self._index)
+
+
+def register_skill_listener(table: SkillEmbeddingTable):
+    """Refresh the table whenever a Skill row is inserted"""
+    from sqlalchemy import event
+    from models import Skill
+
+    def _after_insert(mapper, connection, target):
+        table.mark_pending(target.skill_name)
+
+    event.listen(Skill, 'after_insert', _after_insert)
+    return _after_insert
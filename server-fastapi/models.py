@@ -1,5 +1,5 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Boolean, Table, Date, Numeric, Time, UniqueConstraint
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Boolean, Table, Date, Numeric, Time, UniqueConstraint, event, func, inspect, select, tuple_
+from sqlalchemy.orm import Session, column_property, relationship
 from datetime import datetime
 from enum import Enum
 from utils.datetime_helper import utcnow as philippine_utcnow
@@ -32,6 +32,13 @@ class ClassEnrollment(Base):
 	class_id = Column(Integer, ForeignKey("classes.class_id", ondelete="CASCADE"), nullable=False)
 	enrollment_date = Column(DateTime, default=datetime.utcnow, nullable=False)
 	status = Column(String(20), default="active", nullable=False)  # active, completed, dropped
+	# Requirement progress counters, kept in sync with requirement_submissions
+	# (see _refresh_requirement_progress below)
+	requirements_submitted = Column(Integer, default=0, server_default="0", nullable=False)  # Not returned
+	requirements_validated = Column(Integer, default=0, server_default="0", nullable=False)
+	requirements_returned = Column(Integer, default=0, server_default="0", nullable=False)
+	pre_ojt_submitted = Column(Integer, default=0, server_default="0", nullable=False)  # Pre-OJT (1-15), not returned
+	post_ojt_validated = Column(Integer, default=0, server_default="0", nullable=False)  # Post-OJT (16-19), validated
 	created_at = Column(DateTime, default=datetime.utcnow)
 	updated_at = Column(DateTime, default=datetime.utcnow)
 
@@ -153,7 +160,7 @@ class Employer(Base):
 	status = Column(String(8), nullable=False, default="pending")
 
 	created_at = Column(DateTime, default=datetime.utcnow)
-	updated_at = Column(DateTime, default=datetime.utcnow)
+	updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
 	user = relationship("User", backref="employer", uselist=False)
 	industry = relationship("Industry")
@@ -184,7 +191,7 @@ class Internship(Base):
 	status = Column(String(20), nullable=False, default="draft")  # 'draft', 'pending', 'approved', 'open', 'closed', 'archived'
 	
 	created_at = Column(DateTime, default=datetime.utcnow)
-	updated_at = Column(DateTime, default=datetime.utcnow)
+	updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
 	employer = relationship("Employer", back_populates="internships")
 	skills = relationship("Skill", secondary=internship_skills, back_populates="internships")
@@ -206,7 +213,8 @@ class InternshipApplication(Base):
 	reviewed_at = Column(DateTime, nullable=True)
 	ojt_start_date = Column(DateTime, nullable=True)  # Date when student starts OJT (set by employer upon acceptance)
 	semester = Column(String(20), nullable=True)  # '1st Semester', '2nd Semester', 'Summer'
-	school_year = Column(String(20), nullable=True)  # '2024-2025', '2025-2026', etc.
+	# active_history: the previous year is loaded on change (see _mark_stale_school_years)
+	school_year = column_property(Column(String(20), nullable=True), active_history=True)  # '2024-2025', '2025-2026', etc.
 	created_at = Column(DateTime, default=datetime.utcnow)
 	updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
@@ -495,6 +503,65 @@ class RequirementSubmission(Base):
 	)
 
 
+# Requirement ID ranges (matching the frontend requirement lists)
+PRE_OJT_REQUIREMENT_MAX_ID = 15
+POST_OJT_REQUIREMENT_IDS = (16, 19)
+
+
+def requirement_progress_values(student_id_column, class_id_column):
+	"""Counter column -> correlated count over requirement_submissions for (student, class)"""
+	submissions = RequirementSubmission.__table__
+
+	def count(*conditions):
+		return select(func.count()).where(
+			submissions.c.student_id == student_id_column,
+			submissions.c.class_id == class_id_column,
+			*conditions
+		).scalar_subquery()
+
+	return {
+		"requirements_submitted": count(submissions.c.returned == False),
+		"requirements_validated": count(submissions.c.validated == True),
+		"requirements_returned": count(submissions.c.returned == True),
+		"pre_ojt_submitted": count(
+			submissions.c.requirement_id <= PRE_OJT_REQUIREMENT_MAX_ID,
+			submissions.c.returned == False
+		),
+		"post_ojt_validated": count(
+			submissions.c.requirement_id.between(*POST_OJT_REQUIREMENT_IDS),
+			submissions.c.validated == True
+		)
+	}
+
+
+@event.listens_for(Session, "after_flush")
+def _refresh_requirement_progress(session, flush_context):
+	"""
+	Recount the progress counters of every enrollment whose submissions were
+	inserted, changed or deleted in this flush, in the same transaction
+	"""
+	pairs = set()
+	for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+		if isinstance(obj, RequirementSubmission):
+			state = inspect(obj)
+			# Include the previous (student, class) if either was changed
+			student_ids = {obj.student_id, *state.attrs.student_id.history.deleted}
+			class_ids = {obj.class_id, *state.attrs.class_id.history.deleted}
+			pairs.update((s, c) for s in student_ids for c in class_ids)
+		elif isinstance(obj, ClassEnrollment) and obj in session.new:
+			pairs.add((obj.student_id, obj.class_id))
+	pairs = [pair for pair in pairs if None not in pair]
+	if not pairs:
+		return
+
+	enrollments = ClassEnrollment.__table__
+	session.connection().execute(
+		enrollments.update().where(
+			tuple_(enrollments.c.student_id, enrollments.c.class_id).in_(pairs)
+		).values(requirement_progress_values(enrollments.c.student_id, enrollments.c.class_id))
+	)
+
+
 class RequirementTemplate(Base):
 	"""Model for OJT requirement templates (managed by OJT Head)"""
 	__tablename__ = "requirement_templates"
@@ -542,7 +609,7 @@ class DailyTimeLog(Base):
 	__tablename__ = "daily_time_logs"
 
 	log_id = Column(Integer, primary_key=True, index=True)
-	student_id = Column(Integer, ForeignKey("students.student_id", ondelete="CASCADE"), nullable=False)
+	student_id = Column(Integer, ForeignKey("students.student_id", ondelete="CASCADE"), nullable=False, index=True)
 	application_id = Column(Integer, ForeignKey("internship_applications.application_id", ondelete="CASCADE"), nullable=False)
 	log_date = Column(Date, nullable=False, default=philippine_utcnow)
 	time_in = Column(DateTime, nullable=True)
@@ -619,7 +686,7 @@ class DailyAccomplishment(Base):
 	__tablename__ = "daily_accomplishments"
 
 	accomplishment_id = Column(Integer, primary_key=True, index=True)
-	log_id = Column(Integer, ForeignKey("daily_time_logs.log_id", ondelete="CASCADE"), nullable=False)
+	log_id = Column(Integer, ForeignKey("daily_time_logs.log_id", ondelete="CASCADE"), nullable=False, index=True)
 	student_id = Column(Integer, ForeignKey("students.student_id", ondelete="CASCADE"), nullable=False)
 	log_date = Column(Date, nullable=False, default=datetime.utcnow)
 	tasks = Column(Text, nullable=True)
@@ -665,3 +732,72 @@ class StudentInternshipMatch(Base):
 		UniqueConstraint('student_id', 'internship_id', name='unique_student_internship_match'),
 	)
 
+
+
+class DashboardApplicationRollup(Base):
+	"""
+	Enrolled internship applications counted per dashboard filter combination
+	(rebuilt by utils/dashboard_rollups.py; read by the dashboard statistics)
+	"""
+	__tablename__ = "dashboard_application_rollups"
+
+	rollup_id = Column(Integer, primary_key=True, index=True)
+	campus_id = Column(Integer, nullable=True)  # Campus of the student's latest enrollment
+	program_id = Column(Integer, nullable=True)
+	industry_id = Column(Integer, nullable=True)
+	employer_id = Column(Integer, nullable=True)
+	semester = Column(String(20), nullable=True)
+	school_year = Column(String(20), nullable=True, index=True)
+	created_year = Column(Integer, nullable=True)
+	created_month = Column(Integer, nullable=True)
+	application_count = Column(Integer, default=0, nullable=False)
+	started_count = Column(Integer, default=0, nullable=False)  # With an ojt_start_date
+
+
+class DashboardProgramRollup(Base):
+	"""Enrolled students and internships applied to, per program"""
+	__tablename__ = "dashboard_program_rollups"
+
+	program_id = Column(Integer, primary_key=True)
+	campus_id = Column(Integer, nullable=True, index=True)
+	student_count = Column(Integer, default=0, nullable=False)
+	opportunity_count = Column(Integer, default=0, nullable=False)
+
+
+class DashboardRollupState(Base):
+	"""Single row recording when the dashboard rollups were last refreshed"""
+	__tablename__ = "dashboard_rollup_state"
+
+	state_id = Column(Integer, primary_key=True)
+	refreshed_at = Column(DateTime, nullable=True)  # Last refresh (incremental or full)
+	full_refreshed_at = Column(DateTime, nullable=True)
+
+
+class DashboardStaleSchoolYear(Base):
+	"""
+	School year an application left (moved to another year or deleted), so the
+	next incremental dashboard refresh rebuilds it as well
+	"""
+	__tablename__ = "dashboard_stale_school_years"
+
+	stale_id = Column(Integer, primary_key=True, index=True)
+	school_year = Column(String(20), nullable=True)
+	marked_at = Column(DateTime, default=datetime.utcnow)
+
+
+@event.listens_for(Session, "before_flush")
+def _mark_stale_school_years(session, flush_context, instances):
+	"""
+	Record the previous school year of applications whose school_year changes
+	or that are deleted in this flush; the rollup rows of their new year are
+	found through updated_at
+	"""
+	school_years = set()
+	for obj in session.dirty:
+		if isinstance(obj, InternshipApplication):
+			school_years.update(inspect(obj).attrs.school_year.history.deleted)
+	for obj in session.deleted:
+		if isinstance(obj, InternshipApplication):
+			school_years.add(obj.school_year)
+	for school_year in school_years:
+		session.add(DashboardStaleSchoolYear(school_year=school_year))
@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends, status, Header
 from sqlalchemy.orm import Session
-from database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from database import get_db, get_async_db
 from schemas.auth import SuperAdminCreate, LoginRequest, LoginResponse, ForgotPasswordRequest, ResetPasswordRequest, ChangePasswordRequest
 from schemas.common import Response
 from controllers import auth_controller
@@ -10,49 +11,49 @@ router = APIRouter(prefix="/api/auth", tags=["Authentication"])
 
 
 @router.post("/login", response_model=LoginResponse)
-async def login(credentials: LoginRequest, db: Session = Depends(get_db)):
+def login(credentials: LoginRequest, db: Session = Depends(get_db)):
     """User login endpoint - Generic (legacy, not recommended)"""
     return auth_controller.login_user(credentials, db)
 
 
 @router.post("/superadmin/login", response_model=LoginResponse)
-async def login_superadmin(credentials: LoginRequest, db: Session = Depends(get_db)):
+def login_superadmin(credentials: LoginRequest, db: Session = Depends(get_db)):
     """Superadmin portal login"""
     return auth_controller.login_user_by_role(credentials, db, expected_role="superadmin")
 
 
 @router.post("/employer/login", response_model=LoginResponse)
-async def login_employer(credentials: LoginRequest, db: Session = Depends(get_db)):
+def login_employer(credentials: LoginRequest, db: Session = Depends(get_db)):
     """Employer portal login"""
     return auth_controller.login_user_by_role(credentials, db, expected_role="employer")
 
 
 @router.post("/coordinator/login", response_model=LoginResponse)
-async def login_coordinator(credentials: LoginRequest, db: Session = Depends(get_db)):
+def login_coordinator(credentials: LoginRequest, db: Session = Depends(get_db)):
     """OJT Coordinator portal login"""
     return auth_controller.login_user_by_role(credentials, db, expected_role="ojt_coordinator")
 
 
 @router.post("/head/login", response_model=LoginResponse)
-async def login_head(credentials: LoginRequest, db: Session = Depends(get_db)):
+def login_head(credentials: LoginRequest, db: Session = Depends(get_db)):
     """OJT Head portal login"""
     return auth_controller.login_user_by_role(credentials, db, expected_role="ojt_head")
 
 
 @router.post("/student/login", response_model=LoginResponse)
-async def login_student(credentials: LoginRequest, db: Session = Depends(get_db)):
+def login_student(credentials: LoginRequest, db: Session = Depends(get_db)):
     """Student portal login"""
     return auth_controller.login_user_by_role(credentials, db, expected_role="student")
 
 
 @router.post("/supervisor/login", response_model=LoginResponse)
-async def login_supervisor(credentials: LoginRequest, db: Session = Depends(get_db)):
+def login_supervisor(credentials: LoginRequest, db: Session = Depends(get_db)):
     """Supervisor portal login"""
     return auth_controller.login_user_by_role(credentials, db, expected_role="trainee_supervisor")
 
 
 @router.post("/jp-officer/login", response_model=LoginResponse)
-async def login_jp_officer(credentials: LoginRequest, db: Session = Depends(get_db)):
+def login_jp_officer(credentials: LoginRequest, db: Session = Depends(get_db)):
     """Job Placement Officer portal login"""
     return auth_controller.login_user_by_role(credentials, db, expected_role="job_placement_officer")
 
@@ -64,7 +65,7 @@ async def logout(authorization: str = Header(None), token_data: dict = Depends(v
 
 
 @router.post("/superadmin", response_model=Response, status_code=status.HTTP_201_CREATED)
-async def create_superadmin(admin: SuperAdminCreate, db: Session = Depends(get_db)):
+def create_superadmin(admin: SuperAdminCreate, db: Session = Depends(get_db)):
     """Create superadmin endpoint"""
     return auth_controller.create_superadmin(admin, db)
 
@@ -110,7 +111,7 @@ async def check_auth(token_data: dict = Depends(optional_verify_token)):
 
 
 @router.get("/profile")
-async def get_user_profile(token_data: dict = Depends(verify_token), db: Session = Depends(get_db)):
+def get_user_profile(token_data: dict = Depends(verify_token), db: Session = Depends(get_db)):
     """
     Get current user's profile information including name.
     Works for all user types (superadmin, student, employer, etc.)
@@ -209,23 +210,23 @@ async def get_user_profile(token_data: dict = Depends(verify_token), db: Session
 
 
 @router.post("/forgot-password")
-async def forgot_password(request: ForgotPasswordRequest, db: Session = Depends(get_db)):
+async def forgot_password(request: ForgotPasswordRequest, db: AsyncSession = Depends(get_async_db)):
     """Request password reset - sends reset link to email"""
-    return auth_controller.forgot_password(request.email_address, db)
+    return await db.run_sync(lambda db: auth_controller.forgot_password(request.email_address, db))
 
 
 @router.post("/reset-password")
-async def reset_password(request: ResetPasswordRequest, db: Session = Depends(get_db)):
+def reset_password(request: ResetPasswordRequest, db: Session = Depends(get_db)):
     """Reset password using token from email"""
     return auth_controller.reset_password(request.token, request.new_password, db)
 
 
 @router.post("/change-password")
-async def change_password(
+def change_password(
     request: ChangePasswordRequest,
     token_data: dict = Depends(verify_token),
     db: Session = Depends(get_db)
 ):
     """Change password for authenticated user"""
     user_id = token_data.get("user_id")
-    return auth_controller.change_password(user_id, request.current_password, request.new_password, db)
+    return auth_controller.change_password(user_id, request.current_password, request.new_password, db)
\ No newline at end of file
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, BackgroundTasks, Query
 from sqlalchemy.orm import Session
 from typing import Optional
 from database import get_db
@@ -227,163 +227,111 @@ def get_class_students(
     db: Session = Depends(get_db)
 ):
     """Get all students in a specific class"""
-    from models import Class, Student, ClassEnrollment, RequirementSubmission, Internship, Employer, InternshipApplication, DailyTimeLog
-    from sqlalchemy import func
-    from datetime import time as dt_time
-    import json
+    from models import Class, Student, ClassEnrollment, Internship, Employer, InternshipApplication, DailyTimeLog
+    from sqlalchemy import func, select
+    from collections import defaultdict
+    from utils.work_schedule import parse_work_schedule
     
     # Get the class
     class_obj = db.query(Class).filter(Class.class_id == class_id).first()
     if not class_obj:
         raise HTTPException(status_code=404, detail="Class not found")
     
-    # Get all students enrolled in this class through the junction table
-    students = db.query(Student).join(
-        ClassEnrollment, 
-        Student.student_id == ClassEnrollment.student_id
+    # Total pre-OJT requirements (hardcoded count based on frontend list)
+    total_pre_ojt_requirements = 15
+    
+    # Latest accepted application of each student
+    accepted_application_id = select(func.max(InternshipApplication.application_id)).where(
+        InternshipApplication.student_id == Student.student_id,
+        InternshipApplication.status == "accepted"
+    ).correlate(Student).scalar_subquery()
+    
+    # One query for the roster: enrolled students, their requirement progress
+    # counters and their placement (company and work schedule)
+    rows = db.query(
+        Student.student_id,
+        Student.sr_code,
+        Student.first_name,
+        Student.last_name,
+        Student.email,
+        Student.contact_number,
+        Student.status,
+        Student.required_hours,
+        Student.final_grade,
+        ClassEnrollment.pre_ojt_submitted,
+        ClassEnrollment.post_ojt_validated,
+        InternshipApplication.ojt_start_date,
+        Employer.company_name,
+        Employer.work_schedule
+    ).join(
+        ClassEnrollment, Student.student_id == ClassEnrollment.student_id
+    ).outerjoin(
+        InternshipApplication, InternshipApplication.application_id == accepted_application_id
+    ).outerjoin(
+        Internship, Internship.internship_id == InternshipApplication.internship_id
+    ).outerjoin(
+        Employer, Employer.employer_id == Internship.employer_id
     ).filter(
         ClassEnrollment.class_id == class_id,
         ClassEnrollment.status == "active"
     ).all()
     
-    # Total pre-OJT requirements (hardcoded count based on frontend list)
-    total_pre_ojt_requirements = 15
+    # Completed time logs of the whole class in one query
+    logs_by_student = defaultdict(list)
+    if rows:
+        time_logs = db.query(
+            DailyTimeLog.student_id,
+            DailyTimeLog.time_in,
+            DailyTimeLog.time_out,
+            DailyTimeLog.total_hours
+        ).filter(
+            DailyTimeLog.student_id.in_([row.student_id for row in rows]),
+            DailyTimeLog.status == "complete"
+        ).all()
+        for log in time_logs:
+            logs_by_student[log.student_id].append(log)
     
     students_data = []
-    for s in students:
-        # Debug: Check all requirement submissions for this student
-        all_submissions = db.query(RequirementSubmission).filter(
-            RequirementSubmission.student_id == s.student_id
-        ).all()
-        
-        print(f"\n=== Student: {s.first_name} {s.last_name} (ID: {s.student_id}) ===")
-        print(f"Total submissions in DB: {len(all_submissions)}")
-        for sub in all_submissions:
-            print(f"  - Req ID: {sub.requirement_id}, Status: {sub.status}, Returned: {sub.returned}, Validated: {sub.validated}")
-        
-        # Get company name if student has accepted internship application
-        company_name = None
-        accepted_application = db.query(InternshipApplication).filter(
-            InternshipApplication.student_id == s.student_id,
-            InternshipApplication.status == "accepted"
-        ).first()
-        
-        if accepted_application:
-            internship = db.query(Internship).filter(
-                Internship.internship_id == accepted_application.internship_id
-            ).first()
-            
-            if internship:
-                employer = db.query(Employer).filter(
-                    Employer.employer_id == internship.employer_id
-                ).first()
-                company_name = employer.company_name if employer else None
-        
-        # Count submitted pre-OJT requirements that haven't been returned (requirement_id 1-15)
-        # Status can be "submitted" or "approved"
-        accomplished_requirements = db.query(func.count(RequirementSubmission.id)).filter(
-            RequirementSubmission.student_id == s.student_id,
-            RequirementSubmission.requirement_id <= 15,  # Pre-OJT requirements
-            RequirementSubmission.returned == False
-        ).scalar() or 0
-        
-        print(f"Student {s.first_name} {s.last_name}: {accomplished_requirements} requirements counted")
+    for row in rows:
+        accomplished_requirements = row.pre_ojt_submitted or 0
         
         # Determine OJT status
         ojt_status = "Not Started"
-        if accomplished_requirements == total_pre_ojt_requirements:
-            # All pre-OJT requirements completed
-            if accepted_application and accepted_application.ojt_start_date:
-                ojt_status = "Ongoing"  # Or "Completed" based on hours
-            else:
-                ojt_status = "Not Started"
-        
-        # Calculate total OJT hours from daily time logs (only valid logs)
-        time_logs = db.query(DailyTimeLog).filter(
-            DailyTimeLog.student_id == s.student_id,
-            DailyTimeLog.status == "complete"
-        ).all()
+        if accomplished_requirements == total_pre_ojt_requirements and row.ojt_start_date:
+            ojt_status = "Ongoing"
         
+        # Sum only logs that fall within the employer's work schedule
+        work_schedule = parse_work_schedule(row.work_schedule)
         total_ojt_hours = 0
         invalid_logs_count = 0
-        
-        # Get employer work schedule for validation
-        work_schedule = None
-        if accepted_application:
-            internship = db.query(Internship).filter(
-                Internship.internship_id == accepted_application.internship_id
-            ).first()
-            if internship:
-                employer = db.query(Employer).filter(
-                    Employer.employer_id == internship.employer_id
-                ).first()
-                if employer and employer.work_schedule:
-                    try:
-                        work_schedule = json.loads(employer.work_schedule)
-                    except json.JSONDecodeError:
-                        work_schedule = None
-        
-        # Validate each log and sum only valid hours
-        for log in time_logs:
-            is_invalid = False
-            
-            if work_schedule and log.time_in:
-                log_day = log.time_in.strftime('%A')
-                day_schedule = work_schedule.get(log_day)
-                
-                if day_schedule is None:
-                    is_invalid = True  # Non-working day
-                elif day_schedule.get('start') and day_schedule.get('end') and log.time_out:
-                    try:
-                        start_parts = day_schedule['start'].split(':')
-                        end_parts = day_schedule['end'].split(':')
-                        work_start = dt_time(int(start_parts[0]), int(start_parts[1]))
-                        work_end = dt_time(int(end_parts[0]), int(end_parts[1]))
-                        
-                        time_in_time = log.time_in.time()
-                        time_out_time = log.time_out.time()
-                        
-                        # Flag invalid if completely outside working hours or same time
-                        if time_out_time < work_start or time_in_time > work_end or time_in_time == time_out_time:
-                            is_invalid = True
-                    except (KeyError, ValueError, IndexError):
-                        pass
-            
-            if not is_invalid:
-                total_ojt_hours += float(log.total_hours) if log.total_hours else 0
-            else:
+        for log in logs_by_student[row.student_id]:
+            if work_schedule and work_schedule.log_warning(log.time_in, log.time_out):
                 invalid_logs_count += 1
+            else:
+                total_ojt_hours += float(log.total_hours) if log.total_hours else 0
         
         # Check if OJT is completed (all hours done)
-        student_required_hours = s.required_hours or 486
+        student_required_hours = row.required_hours or 486
         if total_ojt_hours >= student_required_hours and ojt_status == "Ongoing":
             ojt_status = "Completed"
         
-        # Count post-OJT requirements (requirement_id 16-19) that are validated
-        post_ojt_completed = db.query(func.count(RequirementSubmission.id)).filter(
-            RequirementSubmission.student_id == s.student_id,
-            RequirementSubmission.requirement_id >= 16,  # Post-OJT requirements
-            RequirementSubmission.requirement_id <= 19,
-            RequirementSubmission.validated == True
-        ).scalar() or 0
-        
         students_data.append({
-            "student_id": s.student_id,
-            "sr_code": s.sr_code,
-            "name": f"{s.first_name} {s.last_name}",
-            "email": s.email,
-            "contact_number": s.contact_number,
-            "status": s.status,
-            "company": company_name,
+            "student_id": row.student_id,
+            "sr_code": row.sr_code,
+            "name": f"{row.first_name} {row.last_name}",
+            "email": row.email,
+            "contact_number": row.contact_number,
+            "status": row.status,
+            "company": row.company_name,
             "accomplished": accomplished_requirements,
             "total": total_pre_ojt_requirements,
             "ojtStatus": ojt_status,
             "hoursCompleted": total_ojt_hours,
             "hoursRequired": student_required_hours,
             "invalidLogsCount": invalid_logs_count,
-            "postCompleted": post_ojt_completed,
+            "postCompleted": row.post_ojt_validated or 0,
             "postTotal": 4,  # Default post-OJT requirements
-            "finalGrade": s.final_grade,  # Include final grade
+            "finalGrade": row.final_grade,  # Include final grade
             "selectedGrade": "",  # For frontend binding
             "gradeSaving": False  # For frontend state
         })
@@ -395,6 +343,141 @@ def get_class_students(
     }
 
 
+@router.get("/{class_id}/recommendations", response_model=dict)
+def get_class_recommendations(
+    class_id: int,
+    top_k: int = Query(5, ge=1, le=50, description="Recommendations per student"),
+    posting_type: Optional[str] = Query(None, description="Filter by 'internship' or 'job_placement'"),
+    current_user: dict = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Placement recommendations for a whole class in one pass
+    
+    Scores every active student of the class against every open internship as
+    one students × internships matrix and returns each student's top-k plus,
+    per internship, how many students have it in their top-k.
+    """
+    from models import Class, Student, ClassEnrollment, Internship, Employer
+    from sqlalchemy.orm import joinedload, selectinload
+    from ml_models.enhanced_matcher import get_matcher
+    import numpy as np
+    
+    if current_user['role'] not in ['ojt_coordinator', 'ojt_head', 'superadmin']:
+        raise HTTPException(status_code=403, detail="Not authorized")
+    
+    class_obj = db.query(Class).options(
+        joinedload(Class.program).joinedload(Program.department)
+    ).filter(Class.class_id == class_id).first()
+    if not class_obj:
+        raise HTTPException(status_code=404, detail="Class not found")
+    
+    if current_user['role'] == 'ojt_coordinator':
+        coordinator = db.query(OJTCoordinator).filter(
+            OJTCoordinator.user_id == current_user['user_id']
+        ).first()
+        if not coordinator or coordinator.ojt_coordinator_id != class_obj.ojt_coordinator_id:
+            raise HTTPException(status_code=403, detail="Not authorized to view this class")
+    
+    students = db.query(Student).options(selectinload(Student.skills)).join(
+        ClassEnrollment,
+        Student.student_id == ClassEnrollment.student_id
+    ).filter(
+        ClassEnrollment.class_id == class_id,
+        ClassEnrollment.status == "active"
+    ).order_by(Student.last_name, Student.first_name).all()
+    
+    query = db.query(Internship).options(
+        selectinload(Internship.skills),
+        joinedload(Internship.employer).joinedload(Employer.industry)
+    ).filter(Internship.status.in_(['approved', 'open']))
+    if posting_type:
+        query = query.filter(Internship.posting_type == posting_type)
+    internships = query.all()
+    
+    # Program and department come from the class, like the student portal does
+    program_text = class_obj.program.program_name if class_obj.program else ""
+    department_text = class_obj.program.department.department_name if (class_obj.program and class_obj.program.department) else ""
+    
+    matcher = get_matcher()
+    student_data_list = [
+        {
+            'student_id': s.student_id,
+            'skills': [skill.skill_name for skill in s.skills],
+            'program': program_text or s.program or "",
+            'major': s.major or "",
+            'department': department_text or s.department or "",
+            'about': s.about or ""
+        }
+        for s in students
+    ]
+    internship_data_list = [matcher._internship_to_data(i) for i in internships]
+    
+    scores = matcher.score_matrix(student_data_list, internship_data_list)
+    
+    # Per-student top-k (row-wise argpartition, then order the k)
+    k = min(top_k, len(internships))
+    if k > 0 and len(students) > 0:
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        top_scores = np.take_along_axis(scores, top, axis=1)
+        order = np.argsort(-top_scores, axis=1, kind='stable')
+        top = np.take_along_axis(top, order, axis=1)
+        demand = np.bincount(top.ravel(), minlength=len(internships))
+    else:
+        top = np.zeros((len(students), 0), dtype=int)
+        demand = np.zeros(len(internships), dtype=int)
+    
+    students_data = []
+    for row, s in enumerate(students):
+        recommendations = []
+        for col in top[row]:
+            score = round(float(scores[row, col]), 4)
+            internship_data = internship_data_list[col]
+            recommendations.append({
+                'internship_id': internship_data['internship_id'],
+                'internship_title': internship_data['title'],
+                'company_name': internship_data['company_name'],
+                'industry': internship_data['industry'],
+                'posting_type': internship_data['posting_type'],
+                'match_score': score,
+                'match_label': "Recommended" if score >= 0.40 else "Not Recommended",
+                'is_recommended': score >= 0.40
+            })
+        students_data.append({
+            'student_id': s.student_id,
+            'sr_code': s.sr_code,
+            'first_name': s.first_name,
+            'last_name': s.last_name,
+            'recommendations': recommendations
+        })
+    
+    recommended_counts = (scores >= 0.40).sum(axis=0) if len(students) else np.zeros(len(internships), dtype=int)
+    internship_demand = sorted(
+        [
+            {
+                'internship_id': internship_data['internship_id'],
+                'internship_title': internship_data['title'],
+                'company_name': internship_data['company_name'],
+                'top_k_count': int(demand[col]),
+                'recommended_count': int(recommended_counts[col])
+            }
+            for col, internship_data in enumerate(internship_data_list)
+            if demand[col] > 0
+        ],
+        key=lambda x: (-x['top_k_count'], -x['recommended_count'])
+    )
+    
+    return {
+        "status": "success",
+        "class_id": class_id,
+        "top_k": top_k,
+        "total_students": len(students),
+        "total_internships": len(internships),
+        "students": students_data,
+        "internship_demand": internship_demand
+    }
+
+
 @router.get("/programs", response_model=list)
 def get_department_programs(
     current_user: dict = Depends(get_current_user),
@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
-from database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from database import get_db, get_async_db
 from controllers import dashboard_controller
 from middleware.auth import verify_token
 from typing import Optional
@@ -17,11 +18,11 @@ async def get_dashboard_statistics(
     school_year: Optional[str] = Query(None),
     company_id: Optional[int] = Query(None),
     location: Optional[str] = Query(None),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     token_data: dict = Depends(verify_token)
 ):
     """Get dashboard statistics with optional filters"""
-    return dashboard_controller.get_dashboard_statistics(
+    return await db.run_sync(lambda db: dashboard_controller.get_dashboard_statistics(
         db=db,
         campus_id=campus_id,
         program_id=program_id,
@@ -30,13 +31,13 @@ async def get_dashboard_statistics(
         school_year=school_year,
         company_id=company_id,
         location=location
-    )
+    ))
 
 
 @router.get("/filter-options")
 async def get_filter_options(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     token_data: dict = Depends(verify_token)
 ):
     """Get all available filter options for dashboard"""
-    return dashboard_controller.get_filter_options(db)
+    return await db.run_sync(lambda db: dashboard_controller.get_filter_options(db))
@@ -1,7 +1,8 @@
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from database import get_db
+from database import get_async_db
 from middleware.auth import verify_token
 from models import Campus, Department, Industry, Skill
 
@@ -10,11 +11,13 @@ router = APIRouter(prefix="/api/dropdown", tags=["Dropdowns"])
 
 @router.get("/campuses")
 async def get_active_campuses(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: dict = Depends(verify_token)
 ):
     """Get all active campuses for dropdown"""
-    campuses = db.query(Campus).filter(Campus.status == "active").order_by(Campus.campus_name.asc()).all()
+    campuses = (await db.execute(
+        select(Campus.campus_id, Campus.campus_name).filter(Campus.status == "active").order_by(Campus.campus_name.asc())
+    )).all()
     
     data = [
         {
@@ -29,11 +32,13 @@ async def get_active_campuses(
 
 @router.get("/departments")
 async def get_active_departments(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: dict = Depends(verify_token)
 ):
     """Get all active departments for dropdown"""
-    departments = db.query(Department).filter(Department.status == "active").order_by(Department.department_name.asc()).all()
+    departments = (await db.execute(
+        select(Department.department_id, Department.department_name).filter(Department.status == "active").order_by(Department.department_name.asc())
+    )).all()
     
     data = [
         {
@@ -48,11 +53,13 @@ async def get_active_departments(
 
 @router.get("/industries")
 async def get_active_industries(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: dict = Depends(verify_token)
 ):
     """Get all active industries for dropdown"""
-    industries = db.query(Industry).filter(Industry.status == "active").order_by(Industry.industry_name.asc()).all()
+    industries = (await db.execute(
+        select(Industry.industry_id, Industry.industry_name).filter(Industry.status == "active").order_by(Industry.industry_name.asc())
+    )).all()
     
     data = [
         {
@@ -67,11 +74,13 @@ async def get_active_industries(
 
 @router.get("/skills")
 async def get_active_skills(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: dict = Depends(verify_token)
 ):
     """Get all active skills for dropdown"""
-    skills = db.query(Skill).filter(Skill.status == "active").order_by(Skill.skill_name.asc()).all()
+    skills = (await db.execute(
+        select(Skill.skill_id, Skill.skill_name).filter(Skill.status == "active").order_by(Skill.skill_name.asc())
+    )).all()
     
     data = [
         {
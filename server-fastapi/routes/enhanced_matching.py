@@ -12,14 +12,16 @@ Version: 2.0.0
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, desc
-from database import get_db
+from database import get_db, SessionLocal
 from middleware.auth import get_current_user
 from models import Student, Internship, Employer, Industry, StudentInternshipMatch, InternshipApplication
 from pydantic import BaseModel, Field
 from typing import Optional, List, Dict
 from datetime import datetime
+import json
 import sys
 import os
 
@@ -67,6 +69,7 @@ def get_top_internships(
     posting_type: Optional[str] = Query(None, description="Filter by 'internship' or 'job_placement'"),
     min_score: float = Query(0.30, ge=0.0, le=1.0, description="Minimum match score threshold"),
     refresh: bool = Query(False, description="Force recalculation of matches"),
+    collapse_duplicates: bool = Query(False, description="Show one posting per group of near-duplicates"),
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
@@ -83,6 +86,7 @@ def get_top_internships(
     - posting_type: Filter by 'internship' or 'job_placement'
     - min_score: Minimum match score (0.0-1.0, default 0.30)
     - refresh: Force recalculation instead of using cached matches
+    - collapse_duplicates: Hide near-duplicate postings behind the best-scoring copy
     """
     # Verify student exists
     student = db.query(Student).filter(Student.student_id == student_id).first()
@@ -104,7 +108,8 @@ def get_top_internships(
             limit=limit,
             posting_type=posting_type,
             min_score=min_score,
-            store_matches=True
+            store_matches=True,
+            collapse_duplicates=collapse_duplicates
         )
         
         return {
@@ -120,6 +125,86 @@ def get_top_internships(
         )
 
 
+@router.get("/{student_id}/top-internships/stream")
+def stream_top_internships(
+    student_id: int,
+    limit: int = Query(10, ge=1, le=50, description="Number of recommendations in the final frame"),
+    posting_type: Optional[str] = Query(None, description="Filter by 'internship' or 'job_placement'"),
+    min_score: float = Query(0.30, ge=0.0, le=1.0, description="Minimum match score threshold"),
+    batch_size: int = Query(20, ge=1, le=200, description="Internships scored per streamed frame"),
+    format: str = Query("ndjson", pattern="^(ndjson|sse)$", description="'ndjson' or 'sse' (server-sent events)"),
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    Stream top internship recommendations as they are scored
+    
+    Emits one 'batch' frame per scored batch (that batch's matches above
+    min_score, best first) and a final 'final' frame with the ordered top-N
+    across all batches. The final top-N is stored like /top-internships.
+    
+    Frames are newline-delimited JSON by default, or server-sent events
+    (event: batch|final|error) with format=sse.
+    """
+    # Verify student exists
+    student = db.query(Student).filter(Student.student_id == student_id).first()
+    if not student:
+        raise HTTPException(status_code=404, detail="Student not found")
+    
+    # Authorization check: students can only view their own recommendations
+    if current_user.get('role') == 'student' and current_user.get('user_id') != student.user_id:
+        raise HTTPException(status_code=403, detail="Not authorized to view this student's recommendations")
+    
+    def encode_frame(frame: Dict) -> str:
+        if format == "sse":
+            return f"event: {frame['type']}\ndata: {json.dumps(frame, default=str)}\n\n"
+        return json.dumps(frame, default=str) + "\n"
+    
+    def frames():
+        # The request-scoped session is closed once the handler returns, so
+        # the stream uses its own session for its whole lifetime
+        stream_db = SessionLocal()
+        try:
+            matcher = get_matcher()
+            all_matches = []
+            for matches, scored, total in matcher.iter_match_batches(
+                stream_db, student_id,
+                posting_type=posting_type,
+                min_score=min_score,
+                batch_size=batch_size
+            ):
+                all_matches.extend(matches)
+                yield encode_frame({
+                    'type': 'batch',
+                    'scored': scored,
+                    'total': total,
+                    'matches': matches
+                })
+            
+            all_matches.sort(key=lambda x: x['match_score'], reverse=True)
+            top_matches = all_matches[:limit]
+            if top_matches:
+                matcher._store_matches(stream_db, student_id, top_matches)
+            
+            yield encode_frame({
+                'type': 'final',
+                'student_id': student_id,
+                'total_matches': len(top_matches),
+                'matches': top_matches
+            })
+        except Exception as e:
+            yield encode_frame({'type': 'error', 'detail': f"Failed to calculate matches: {str(e)}"})
+        finally:
+            stream_db.close()
+    
+    media_type = "text/event-stream" if format == "sse" else "application/x-ndjson"
+    return StreamingResponse(
+        frames(),
+        media_type=media_type,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.get("/{student_id}/match-score/{internship_id}", response_model=MatchScoreResponse)
 def get_match_score(
     student_id: int,
@@ -426,6 +511,63 @@ def get_matching_analytics(
         )
 
 
+@router.get("/matching/encoder-stats")
+def get_encoder_stats(
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    Get sentence-model micro-batching statistics
+    
+    Only accessible to superadmin, OJT head, and coordinators
+    
+    Returns:
+    - Batcher configuration (max batch size, max wait)
+    - Current queue depth
+    - Batch-size and queue-time histograms
+    """
+    if current_user.get('role') not in ['superadmin', 'ojt_head', 'ojt_coordinator']:
+        raise HTTPException(status_code=403, detail="Not authorized")
+    
+    matcher = get_matcher()
+    if matcher.encode_batcher is None:
+        return {'enabled': False}
+    
+    return {'enabled': True, **matcher.encode_batcher.stats()}
+
+
+@router.get("/{student_id}/cascade-recall")
+def get_cascade_recall(
+    student_id: int,
+    k: int = Query(10, ge=1, le=50, description="Cut-off for recall@k"),
+    pool_size: Optional[int] = Query(None, ge=1, description="Override the cascade candidate pool size"),
+    posting_type: Optional[str] = Query(None, description="Filter by 'internship' or 'job_placement'"),
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    Compare the cascade ranking against the full ranking for one student
+    
+    Only accessible to superadmin, OJT head, and coordinators
+    
+    Returns recall@k of the cascade's top-k versus the full top-k and the
+    time each ranking took. Matches are not stored.
+    """
+    if current_user.get('role') not in ['superadmin', 'ojt_head', 'ojt_coordinator']:
+        raise HTTPException(status_code=403, detail="Not authorized")
+    
+    try:
+        matcher = get_matcher()
+        return matcher.evaluate_cascade_recall(db, student_id, k=k, posting_type=posting_type, pool_size=pool_size)
+    
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to evaluate cascade: {str(e)}"
+        )
+
+
 @router.get("/{student_id}/recommendations/explain/{internship_id}")
 def explain_recommendation(
     student_id: int,
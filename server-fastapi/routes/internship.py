@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, Query, status, UploadFile, File, Form
+from fastapi import APIRouter, Depends, HTTPException, Query, status, UploadFile, File, Form
 from config import get_upload_path, get_upload_url
 from sqlalchemy.orm import Session
 from database import get_db
@@ -21,7 +21,9 @@ from pathlib import Path
 
 # Import enhanced matcher
 sys.path.append(os.path.join(os.path.dirname(__file__), '../ml_models'))
-from ml_models.enhanced_matcher import get_matcher
+from ml_models.match_service import score_internships
+from ml_models.near_duplicates import get_duplicate_index, duplicate_report, posting_text
+from utils.loader_options import INTERNSHIP_LISTING, APPLICATION_LISTING, APPLICATION_WITH_POSTING
 
 router = APIRouter(prefix="/api/internships", tags=["Internships"])
 
@@ -40,62 +42,10 @@ def get_available_internships(
 	"""Get all available internships for students with job matching"""
 	# Get student info if authenticated
 	student = None
-	student_skills = set()
-	student_program = ""
-	
-	print(f"\n{'='*50}")
-	print(f"INTERNSHIP MATCHING REQUEST")
-	print(f"{'='*50}")
-	print(f"Current User: {current_user}")
-	
 	if current_user:
-		try:
-			user_id = current_user.get("user_id")
-			print(f"Looking for student with user_id: {user_id}")
-			student = db.query(Student).filter(Student.user_id == user_id).first()
-			
-			if student:
-				print(f"✓ Student found: {student.first_name} {student.last_name}")
-				
-				# Get program and department from enrolled class (not from student profile)
-				active_enrollment = db.query(ClassEnrollment).filter(
-					ClassEnrollment.student_id == student.student_id,
-					ClassEnrollment.status == "active"
-				).first()
-				
-				program_name = ""
-				department_name = ""
-				
-				if active_enrollment:
-					class_info = db.query(Class).filter(Class.class_id == active_enrollment.class_id).first()
-					if class_info and class_info.program:
-						program_name = class_info.program.program_name or ""
-						if class_info.program.department:
-							department_name = class_info.program.department.department_name or ""
-						print(f"✓ Enrolled Class: {class_info.class_section}")
-						print(f"✓ Program from Class: {program_name}")
-						print(f"✓ Department from Class: {department_name}")
-				else:
-					# Fallback to student profile if no active enrollment
-					program_name = student.program or ""
-					department_name = student.department or ""
-					print(f"⚠ No active enrollment - using profile data")
-					print(f"  Program from Profile: {program_name}")
-					print(f"  Department from Profile: {department_name}")
-				
-				student_skills = {skill.skill_name.lower() for skill in student.skills} if student.skills else set()
-				student_program = program_name.lower()
-				
-				print(f"Student Skills in DB: {[skill.skill_name for skill in student.skills] if student.skills else []}")
-				print(f"Student Major: {student.major}")
-			else:
-				print(f"✗ No student record found for user_id: {user_id}")
-		except Exception as e:
-			print(f"✗ Error retrieving student: {str(e)}")
-			import traceback
-			traceback.print_exc()
-	else:
-		print(f"✗ No authenticated user (current_user is None)")
+		student = db.query(Student).filter(Student.user_id == current_user.get("user_id")).first()
+		if not student:
+			print(f"No student record found for user_id: {current_user.get('user_id')} - recommendations disabled")
 	
 	# Query for open internships with employer info
 	query = db.query(Internship).filter(Internship.status == "open")
@@ -126,128 +76,16 @@ def get_available_internships(
 	total_records = query.count()
 	offset = (pageNo - 1) * pageSize
 
-	internships = query.order_by(Internship.created_at.desc()).offset(offset).limit(pageSize).all()
+	# Load the page and score it with the Enhanced Matching System in one batch
+	scored = score_internships(
+		db, student,
+		query.order_by(Internship.created_at.desc()).offset(offset).limit(pageSize)
+	)
 
 	# Format response with employer and skills
 	result_data = []
-	
-	print(f"\n{'='*60}")
-	print(f"JOB MATCHING ALGORITHM")
-	print(f"{'='*60}")
-	
-	# Prepare for cosine similarity if student is authenticated
-	student_profile_text = ""
-	if student:
-		# Get program and department from enrolled class
-		active_enrollment = db.query(ClassEnrollment).filter(
-			ClassEnrollment.student_id == student.student_id,
-			ClassEnrollment.status == "active"
-		).first()
-		
-		program_text = ""
-		department_text = ""
-		
-		if active_enrollment:
-			class_info = db.query(Class).filter(Class.class_id == active_enrollment.class_id).first()
-			if class_info and class_info.program:
-				program_text = class_info.program.program_name or ""
-				if class_info.program.department:
-					department_text = class_info.program.department.department_name or ""
-		else:
-			# Fallback to student profile
-			program_text = student.program or ""
-			department_text = student.department or ""
-		
-		# Build student profile text from skills, program, major, department
-		skills_text = " ".join([skill.skill_name for skill in student.skills]) if student.skills else ""
-		major_text = student.major or ""
-		about_text = student.about or ""
-		student_profile_text = f"{skills_text} {program_text} {major_text} {department_text} {about_text}".strip()
-		print(f"Student Profile Text: {student_profile_text}")
-		print(f"Student Skills: {[skill.skill_name for skill in student.skills] if student.skills else []}")
-		print(f"Student Program: {program_text}")
-		print(f"Student Major: {major_text}")
-		print(f"Student Department: {department_text}")
-		print(f"Student About: {about_text[:100]}..." if about_text and len(about_text) > 100 else f"Student About: {about_text}")
-	else:
-		print(f"No student found - recommendations disabled")
-	
-	# Calculate match scores using Enhanced Matching System v2.0
-	match_scores = {}
-	if student:
-		try:
-			# Get enhanced matcher
-			matcher = get_matcher()
-			
-			print(f"\n🎯 Using Enhanced Matching System v2.0")
-			print(f"Calculating match scores for {len(internships)} internships...")
-			
-			# Prepare student data
-			student_data = {
-				'student_id': student.student_id,
-				'skills': [skill.skill_name for skill in student.skills] if student.skills else [],
-				'program': program_text,
-				'major': student.major or "",
-				'department': department_text,
-				'about': student.about or ""
-			}
-			
-			# Calculate match scores for each internship
-			for internship in internships:
-				internship_data = {
-					'internship_id': internship.internship_id,
-					'employer_id': internship.employer_id,
-					'industry_id': internship.employer.industry_id if internship.employer else None,
-					'skills': [skill.skill_name for skill in internship.skills] if internship.skills else [],
-					'title': internship.title or "",
-					'description': internship.full_description or "",
-					'posting_type': internship.posting_type or "internship",
-					'industry': internship.employer.industry.industry_name if (internship.employer and internship.employer.industry) else "",
-					'company_name': internship.employer.company_name if internship.employer else "",
-					'address': internship.employer.address if internship.employer else ""
-				}
-				
-				# Calculate match score
-				result = matcher.calculate_match_score(db, student_data, internship_data)
-				match_scores[internship.internship_id] = result
-				
-				print(f"\n--- Internship: {internship.title} ---")
-				print(f"Company: {internship_data['company_name']}")
-				print(f"Match Score: {result['match_score']:.4f} ({result['match_score'] * 100:.2f}%)")
-				print(f"Match Label: {result['match_label']}")
-				print(f"Recommended: {'YES' if result['is_recommended'] else 'NO'}")
-				print(f"Components: Skills={result['components']['skill_score']:.2f}, Program={result['components']['program_score']:.2f}, Semantic={result['components']['semantic_score']:.2f}, Historical={result['components']['historical_score']:.2f}")
-			
-			# Store matches in database for historical tracking
-			matches_to_store = [
-				{
-					'internship_id': internship.internship_id,
-					'match_score': match_scores[internship.internship_id]['match_score'],
-					'match_label': match_scores[internship.internship_id]['match_label'],
-					'is_recommended': match_scores[internship.internship_id]['is_recommended'],
-					'components': match_scores[internship.internship_id]['components'],
-					'skill_metrics': match_scores[internship.internship_id]['skill_metrics']
-				}
-				for internship in internships if internship.internship_id in match_scores
-			]
-			matcher._store_matches(db, student.student_id, matches_to_store)
-			
-			print(f"\n✓ Enhanced Matching Complete - {len(match_scores)} matches calculated and stored")
-			
-		except Exception as e:
-			print(f"\n✗ Error in enhanced matching: {str(e)}")
-			import traceback
-			traceback.print_exc()
-	else:
-		print(f"\nNo student found - recommendations disabled")
-	
-	for idx, internship in enumerate(internships):
-		# Get match score for this internship
-		match_result = match_scores.get(internship.internship_id)
-		match_score = match_result['match_score'] if match_result else 0.0
-		is_recommended = match_result['is_recommended'] if match_result else False
-		match_label = match_result['match_label'] if match_result else "No Match"
-		match_components = match_result['components'] if match_result else {}
+	for internship, internship_data, match in scored:
+		employer = internship.employer
 		
 		internship_dict = {
 			"internship_id": internship.internship_id,
@@ -259,17 +97,17 @@ def get_available_internships(
 			"status": internship.status,
 			"created_at": internship.created_at.isoformat() if internship.created_at else None,
 			"updated_at": internship.updated_at.isoformat() if internship.updated_at else None,
-			"company_name": internship.employer.company_name if internship.employer else None,
-			"industry_id": internship.employer.industry_id if internship.employer else None,
-			"industry_name": internship.employer.industry.industry_name if (internship.employer and internship.employer.industry) else None,
-			"address": internship.employer.address if internship.employer else None,
-			"moa_file": internship.employer.moa_file.replace("\\", "/") if (internship.employer and internship.employer.moa_file) else None,  # Include MOA file
+			"company_name": employer.company_name if employer else None,
+			"industry_id": employer.industry_id if employer else None,
+			"industry_name": employer.industry.industry_name if (employer and employer.industry) else None,
+			"address": employer.address if employer else None,
+			"moa_file": employer.moa_file.replace("\\", "/") if (employer and employer.moa_file) else None,  # Include MOA file
 			"duration_months": 6,  # Default value
-			"skills": [skill.skill_name for skill in internship.skills] if internship.skills else [],
-			"isRecommended": is_recommended,  # Use enhanced matching recommendation
-			"matchScore": match_score,  # Include match score (0.0-1.0)
-			"matchLabel": match_label,  # Include match label (Excellent/Strong/Good/Fair/Weak Match)
-			"matchComponents": match_components  # Include component scores for detailed view
+			"skills": internship_data['skills'],
+			"isRecommended": match.is_recommended if match else False,  # Use enhanced matching recommendation
+			"matchScore": match.match_score if match else 0.0,  # Include match score (0.0-1.0)
+			"matchLabel": match.match_label if match else "No Match",  # Include match label
+			"matchComponents": match.components if match else {}  # Include component scores for detailed view
 		}
 		result_data.append(internship_dict)
 
@@ -285,6 +123,93 @@ def get_available_internships(
 	}
 
 
+@router.get("/search")
+def search_internships(
+	q: str = Query(..., min_length=1, description="Free-text query"),
+	limit: int = Query(20, ge=1, le=100),
+	industry: str = Query(None, description="Comma-separated industry IDs"),
+	company: str = Query(None, description="Comma-separated employer IDs"),
+	posting_type: str = Query(None, description="Filter by 'internship' or 'job_placement'"),
+	hybrid: bool = Query(False, description="Rerank with keyword overlap"),
+	db: Session = Depends(get_db),
+	current_user: dict = Depends(get_current_user)
+):
+	"""Semantic search over open internships"""
+	from ml_models.internship_search import get_search_index
+	from ml_models.match_service import with_match_loading
+
+	industry_ids = [int(i) for i in industry.split(",") if i.strip().isdigit()] if industry else None
+	company_ids = [int(i) for i in company.split(",") if i.strip().isdigit()] if company else None
+
+	index = get_search_index()
+	index.refresh(db)
+	hits = index.search(
+		q,
+		limit=limit,
+		industry_ids=industry_ids,
+		employer_ids=company_ids,
+		posting_type=posting_type,
+		hybrid=hybrid
+	)
+
+	internships = {
+		i.internship_id: i
+		for i in with_match_loading(db.query(Internship)).filter(
+			Internship.internship_id.in_([hit['internship_id'] for hit in hits])
+		).all()
+	} if hits else {}
+
+	result_data = []
+	for hit in hits:
+		internship = internships.get(hit['internship_id'])
+		if not internship:
+			continue
+		employer = internship.employer
+		result_data.append({
+			"internship_id": internship.internship_id,
+			"employer_id": internship.employer_id,
+			"title": internship.title,
+			"description": internship.full_description,
+			"full_description": internship.full_description,
+			"posting_type": internship.posting_type,
+			"status": internship.status,
+			"created_at": internship.created_at.isoformat() if internship.created_at else None,
+			"company_name": employer.company_name if employer else None,
+			"industry_id": employer.industry_id if employer else None,
+			"industry_name": employer.industry.industry_name if (employer and employer.industry) else None,
+			"address": employer.address if employer else None,
+			"skills": [skill.skill_name for skill in internship.skills],
+			"searchScore": hit['score'],
+			"semanticScore": hit['semantic_score'],
+			"keywordScore": hit['keyword_score']
+		})
+
+	return {
+		"status": "success",
+		"query": q,
+		"hybrid": hybrid,
+		"data": result_data
+	}
+
+
+@router.get("/duplicates")
+def get_duplicate_internships(
+	db: Session = Depends(get_db),
+	current_user: dict = Depends(get_current_user)
+):
+	"""Report groups of near-duplicate postings across all internships"""
+	if current_user.get("role") not in ["ojt_head", "ojt_coordinator", "superadmin"]:
+		raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
+	
+	report = duplicate_report(db)
+	return {
+		"status": "success",
+		"total_groups": len(report),
+		"total_duplicates": sum(group['size'] - 1 for group in report),
+		"data": report
+	}
+
+
 # Define specific routes BEFORE parameterized routes
 @router.get("/skills", response_model=list[SkillResponse])
 def get_all_skills(
@@ -314,10 +239,32 @@ def create_internship_route(
 		return {"status": "error", "detail": "Employer profile not found"}, 404
 	
 	internship = create_internship(employer.employer_id, data, db)
+	
+	# Flag near-duplicates among the employer's postings (LSH lookup, not a
+	# full scan), then hash only the new posting into the index
+	possible_duplicates = []
+	try:
+		duplicate_index = get_duplicate_index()
+		if not duplicate_index.synced:
+			duplicate_index.sync(db)  # First use in this process
+		possible_duplicates = duplicate_index.find_duplicates(
+			internship.title, internship.full_description, internship.employer_id,
+			exclude=internship.internship_id
+		)
+		duplicate_index.add(
+			internship.internship_id,
+			posting_text(internship.title, internship.full_description),
+			internship.updated_at,
+			internship.employer_id
+		)
+	except Exception as e:
+		print(f"Warning: Near-duplicate check failed: {e}")
+	
 	return {
 		"status": "success",
 		"message": "Internship created successfully",
-		"data": internship
+		"data": internship,
+		"possible_duplicates": possible_duplicates
 	}
 
 
@@ -347,7 +294,7 @@ def get_internships_route(
 		total_records = query.count()
 		offset = (pageNo - 1) * pageSize
 		
-		internships = query.order_by(Internship.created_at.desc()).offset(offset).limit(pageSize).all()
+		internships = query.options(*INTERNSHIP_LISTING).order_by(Internship.created_at.desc()).offset(offset).limit(pageSize).all()
 		
 		# Format response with employer info
 		result_data = []
@@ -422,7 +369,7 @@ def get_my_applications(
 				}
 			}
 		
-		applications = db.query(InternshipApplication).filter(
+		applications = db.query(InternshipApplication).options(*APPLICATION_WITH_POSTING).filter(
 			InternshipApplication.student_id == student.student_id
 		).order_by(InternshipApplication.applied_at.desc()).all()
 		
@@ -567,15 +514,24 @@ def get_internship_applications(
 		
 		offset = (pageNo - 1) * pageSize
 		
-		applications = query.order_by(InternshipApplication.applied_at.desc()).offset(offset).limit(pageSize).all()
+		applications = query.options(*APPLICATION_LISTING).order_by(InternshipApplication.applied_at.desc()).offset(offset).limit(pageSize).all()
+		
+		# Class of each applicant's active enrollment, in one query
+		student_ids = {app.student_id for app in applications}
+		classes_by_student = dict(
+			db.query(ClassEnrollment.student_id, Class).join(
+				Class, ClassEnrollment.class_id == Class.class_id
+			).filter(
+				ClassEnrollment.student_id.in_(student_ids),
+				ClassEnrollment.status == "active"
+			).order_by(ClassEnrollment.enrollment_date).all()
+		) if student_ids else {}
 		
 		result_data = []
 		for app in applications:
 			student = app.student
 			internship = app.internship
-			
-			# Get student's class information
-			student_class = db.query(Class).filter(Class.class_id == student.class_id).first() if student and student.class_id else None
+			student_class = classes_by_student.get(app.student_id)
 			
 			result_data.append({
 				"application_id": app.application_id,
@@ -583,11 +539,11 @@ def get_internship_applications(
 				"student_name": f"{student.first_name} {student.last_name}" if student else None,
 				"student_email": student.email if student else None,
 				"student_contact": student.contact_number if student else None,
-				"student_gender": student.gender if student else None,
+				"student_gender": student.sex if student else None,
 				"student_birthdate": student.birthdate.isoformat() if student and student.birthdate else None,
 				"student_program": student.program if student else None,
 				"student_major": student.major if student else None,
-				"student_school_year": student_class.schoolyear if student_class else None,
+				"student_school_year": student_class.school_year if student_class else None,
 				"student_semester": student_class.semester if student_class else None,
 				"student_section": student_class.section if student_class else None,
 				"student_required_hours": student.required_hours if student else None,
@@ -938,14 +894,14 @@ async def apply_to_internship(
 
 
 @router.get("/employer/ongoing-ojts")
-async def get_employer_ongoing_ojts(
+def get_employer_ongoing_ojts(
 	db: Session = Depends(get_db),
 	current_user: dict = Depends(get_current_user)
 ):
 	"""Get all ongoing OJTs for the current employer"""
 	from models import RequirementSubmission, StudentSupervisorAssignment, TraineeSupervisor, DailyTimeLog
-	from datetime import time as dt_time
-	import json
+	from sqlalchemy import func, case, or_, true
+	from utils.work_schedule import parse_work_schedule
 	
 	# Verify user is an employer
 	employer = db.query(Employer).filter(Employer.user_id == current_user['user_id']).first()
@@ -954,9 +910,18 @@ async def get_employer_ongoing_ojts(
 	
 	# Query all accepted applications for this employer's internships
 	ongoing_ojts = db.query(
-		InternshipApplication,
-		Student,
-		Internship
+		InternshipApplication.application_id,
+		InternshipApplication.ojt_start_date,
+		InternshipApplication.reviewed_at,
+		Student.student_id,
+		Student.first_name,
+		Student.last_name,
+		Student.sr_code,
+		Student.email,
+		Student.contact_number,
+		Student.required_hours,
+		Internship.internship_id,
+		Internship.title
 	).join(
 		Student, InternshipApplication.student_id == Student.student_id
 	).join(
@@ -966,115 +931,106 @@ async def get_employer_ongoing_ojts(
 		InternshipApplication.status == 'accepted'
 	).all()
 	
-	result = []
-	for application, student, internship in ongoing_ojts:
-		# Check if requirements are validated
-		submissions = db.query(RequirementSubmission).filter(
-			RequirementSubmission.student_id == student.student_id
+	if not ongoing_ojts:
+		return {"total": 0, "ongoing_ojts": []}
+	
+	student_ids = {row.student_id for row in ongoing_ojts}
+	application_ids = [row.application_id for row in ongoing_ojts]
+	
+	# Requirement validation rollup per student: validated when at least one
+	# submission is validated and none is still waiting ('submitted')
+	validated = func.coalesce(RequirementSubmission.validated, False)
+	requirement_rollups = {
+		row.student_id: row
+		for row in db.query(
+			RequirementSubmission.student_id,
+			func.count(RequirementSubmission.id).label("total"),
+			func.sum(case((validated, 1), else_=0)).label("validated_count"),
+			func.bool_or(validated).label("has_validated"),
+			func.bool_and(or_(validated, RequirementSubmission.status != 'submitted')).label("none_pending")
+		).filter(
+			RequirementSubmission.student_id.in_(student_ids)
+		).group_by(RequirementSubmission.student_id).all()
+	}
+	
+	# Latest active supervisor assignment per application
+	latest_assignment = db.query(
+		func.max(StudentSupervisorAssignment.assignment_id)
+	).filter(
+		StudentSupervisorAssignment.internship_application_id.in_(application_ids),
+		StudentSupervisorAssignment.status == "active"
+	).group_by(
+		StudentSupervisorAssignment.student_id,
+		StudentSupervisorAssignment.internship_application_id
+	)
+	supervisors = {
+		(row.student_id, row.internship_application_id): row
+		for row in db.query(
+			StudentSupervisorAssignment.student_id,
+			StudentSupervisorAssignment.internship_application_id,
+			TraineeSupervisor.supervisor_id,
+			TraineeSupervisor.first_name,
+			TraineeSupervisor.last_name
+		).join(
+			TraineeSupervisor, TraineeSupervisor.supervisor_id == StudentSupervisorAssignment.supervisor_id
+		).filter(
+			StudentSupervisorAssignment.assignment_id.in_(latest_assignment)
 		).all()
-		
-		all_validated = False
-		validated_count = 0
-		total_submissions = len(submissions)
-		
-		if submissions:
-			validated_count = sum(1 for sub in submissions if sub.validated)
-			all_validated = all(sub.validated for sub in submissions if sub.status == 'submitted' or sub.validated)
-			has_validated = any(sub.validated for sub in submissions)
-			all_validated = all_validated and has_validated
+	}
+	
+	# OJT hours per student (only logs within the work schedule count)
+	work_schedule = parse_work_schedule(employer.work_schedule)
+	is_valid = work_schedule.valid_log_clause(DailyTimeLog.time_in, DailyTimeLog.time_out) if work_schedule else true()
+	hours = {
+		row.student_id: row
+		for row in db.query(
+			DailyTimeLog.student_id,
+			func.sum(case((is_valid, func.coalesce(DailyTimeLog.total_hours, 0)), else_=0)).label("valid_hours"),
+			func.sum(case((is_valid, 0), else_=1)).label("invalid_count")
+		).filter(
+			DailyTimeLog.student_id.in_(student_ids),
+			DailyTimeLog.status == "complete"
+		).group_by(DailyTimeLog.student_id).all()
+	}
+	
+	today = philippine_utcnow().date()
+	result = []
+	for row in ongoing_ojts:
+		rollup = requirement_rollups.get(row.student_id)
+		all_validated = bool(rollup and rollup.has_validated and (rollup.none_pending is None or rollup.none_pending))
 		
 		# Determine OJT status
-		ojt_status = "Not Started"
-		if application.ojt_start_date:
-			if philippine_utcnow().date() >= application.ojt_start_date.date():
+		if row.ojt_start_date:
+			if today >= row.ojt_start_date.date():
 				ojt_status = "Ongoing" if all_validated else "Pending Requirements"
 			else:
 				ojt_status = "Scheduled"
 		else:
 			ojt_status = "Accepted - No Start Date Set"
 		
-		# Get assigned supervisor
-		assignment = db.query(StudentSupervisorAssignment).filter(
-			StudentSupervisorAssignment.student_id == student.student_id,
-			StudentSupervisorAssignment.internship_application_id == application.application_id,
-			StudentSupervisorAssignment.status == "active"
-		).first()
-		
-		supervisor_name = None
-		supervisor_id = None
-		if assignment:
-			supervisor = db.query(TraineeSupervisor).filter(
-				TraineeSupervisor.supervisor_id == assignment.supervisor_id
-			).first()
-			if supervisor:
-				supervisor_name = f"{supervisor.first_name} {supervisor.last_name}"
-				supervisor_id = supervisor.supervisor_id
-		
-		# Calculate OJT hours (only valid logs)
-		time_logs = db.query(DailyTimeLog).filter(
-			DailyTimeLog.student_id == student.student_id,
-			DailyTimeLog.status == "complete"
-		).all()
-		
-		total_ojt_hours = 0
-		invalid_logs_count = 0
-		work_schedule = None
-		
-		if employer and employer.work_schedule:
-			try:
-				work_schedule = json.loads(employer.work_schedule)
-			except json.JSONDecodeError:
-				work_schedule = None
-		
-		for log in time_logs:
-			is_invalid = False
-			
-			if work_schedule and log.time_in:
-				log_day = log.time_in.strftime('%A')
-				day_schedule = work_schedule.get(log_day)
-				
-				if day_schedule is None:
-					is_invalid = True
-				elif day_schedule.get('start') and day_schedule.get('end') and log.time_out:
-					try:
-						start_parts = day_schedule['start'].split(':')
-						end_parts = day_schedule['end'].split(':')
-						work_start = dt_time(int(start_parts[0]), int(start_parts[1]))
-						work_end = dt_time(int(end_parts[0]), int(end_parts[1]))
-						
-						time_in_time = log.time_in.time()
-						time_out_time = log.time_out.time()
-						
-						if time_out_time < work_start or time_in_time > work_end or time_in_time == time_out_time:
-							is_invalid = True
-					except (KeyError, ValueError, IndexError):
-						pass
-			
-			if not is_invalid:
-				total_ojt_hours += float(log.total_hours) if log.total_hours else 0
-			else:
-				invalid_logs_count += 1
+		supervisor = supervisors.get((row.student_id, row.application_id))
+		student_hours = hours.get(row.student_id)
 		
 		result.append({
-			"student_id": student.student_id,
-			"student_name": f"{student.first_name} {student.last_name}",
-			"sr_code": student.sr_code,
-			"email": student.email,
-			"contact_number": student.contact_number,
-			"position": internship.title,
-			"internship_id": internship.internship_id,
-			"ojt_start_date": application.ojt_start_date.isoformat() if application.ojt_start_date else None,
-			"accepted_date": application.reviewed_at.isoformat() if application.reviewed_at else None,
+			"student_id": row.student_id,
+			"student_name": f"{row.first_name} {row.last_name}",
+			"sr_code": row.sr_code,
+			"email": row.email,
+			"contact_number": row.contact_number,
+			"position": row.title,
+			"internship_id": row.internship_id,
+			"ojt_start_date": row.ojt_start_date.isoformat() if row.ojt_start_date else None,
+			"accepted_date": row.reviewed_at.isoformat() if row.reviewed_at else None,
 			"requirements_validated": all_validated,
-			"requirements_validated_count": validated_count,
-			"requirements_total": total_submissions,
+			"requirements_validated_count": int(rollup.validated_count or 0) if rollup else 0,
+			"requirements_total": rollup.total if rollup else 0,
 			"ojt_status": ojt_status,
-			"application_id": application.application_id,
-			"assigned_supervisor_id": supervisor_id,
-			"supervisor_name": supervisor_name,
-			"hours_completed": total_ojt_hours,
-			"hours_required": student.required_hours or 486,
-			"invalid_logs_count": invalid_logs_count
+			"application_id": row.application_id,
+			"assigned_supervisor_id": supervisor.supervisor_id if supervisor else None,
+			"supervisor_name": f"{supervisor.first_name} {supervisor.last_name}" if supervisor else None,
+			"hours_completed": float(student_hours.valid_hours or 0) if student_hours else 0,
+			"hours_required": row.required_hours or 486,
+			"invalid_logs_count": int(student_hours.invalid_count or 0) if student_hours else 0
 		})
 	
 	return {
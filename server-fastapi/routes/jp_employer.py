@@ -2,15 +2,19 @@ from fastapi import APIRouter, Depends, HTTPException, Form, UploadFile, File, s
 from sqlalchemy.orm import Session
 from database import get_db
 from middleware.auth import verify_token
-from models import User, Employer, Industry
-from sqlalchemy import or_, func
-from typing import Optional
+from models import User, Employer, Industry, Internship, Alumni
+from sqlalchemy import or_, and_, func, case, extract, literal, null, select, true, tuple_, union_all
+from typing import Dict, Optional, Tuple
+from config import JP_DASHBOARD_CACHE_SECONDS
 from pydantic import EmailStr
 import bcrypt
 import secrets
 import string
 import os
+import threading
+import time
 from utils.datetime_helper import utcnow
+from utils.loader_options import INTERNSHIP_LISTING
 from datetime import datetime
 import smtplib
 from email.mime.text import MIMEText
@@ -33,123 +37,149 @@ def verify_jp_officer(token_data: dict = Depends(verify_token)):
 # DASHBOARD ENDPOINTS
 # ============================================================================
 
+# Dashboard statistics per industry_id filter: (expires_at, response)
+_dashboard_cache: Dict[Optional[int], Tuple[float, dict]] = {}
+_dashboard_cache_lock = threading.Lock()
+
+
+def _dashboard_statistics_query(industry_id: Optional[int]):
+    """
+    Every dashboard figure in one statement
+
+    Job placement postings and eligible employers are stacked into one CTE
+    and grouped once with GROUPING SETS: a total per kind, plus breakdowns by
+    status, industry, month and company. Summary counts restricted to the
+    industry filter use FILTER clauses, so unfiltered breakdowns and filtered
+    totals come from the same scan. The "dimension" column names the
+    breakdown a row belongs to.
+    """
+    postings = select(
+        literal("posting").label("kind"),
+        Internship.status,
+        extract("month", Internship.created_at).label("month"),
+        Employer.company_name,
+        Employer.industry_id,
+        Industry.industry_name
+    ).select_from(Internship).outerjoin(
+        Employer, Internship.employer_id == Employer.employer_id
+    ).outerjoin(
+        Industry, Employer.industry_id == Industry.industry_id
+    ).where(Internship.posting_type == "job_placement")
+
+    employers = select(
+        literal("employer"),
+        null(),
+        null(),
+        null(),
+        Employer.industry_id,
+        Industry.industry_name
+    ).select_from(Employer).outerjoin(
+        Industry, Employer.industry_id == Industry.industry_id
+    ).where(Employer.eligibility.in_(["job_placement", "both"]))
+
+    facts = union_all(postings, employers).cte("dashboard_facts")
+    in_industry = facts.c.industry_id == industry_id if industry_id else true()
+
+    dimension = case(
+        (func.grouping(facts.c.status) == 0, "status"),
+        (func.grouping(facts.c.industry_name) == 0, "industry"),
+        (func.grouping(facts.c.month) == 0, "month"),
+        (func.grouping(facts.c.company_name) == 0, "company"),
+        else_="total"
+    )
+    return select(
+        facts.c.kind,
+        dimension.label("dimension"),
+        facts.c.status,
+        facts.c.industry_name,
+        facts.c.month,
+        facts.c.company_name,
+        func.count().label("count"),
+        func.count().filter(in_industry).label("filtered_count"),
+        func.count().filter(and_(in_industry, facts.c.status == "open")).label("open_count"),
+        func.count().filter(and_(in_industry, facts.c.status == "pending")).label("pending_count"),
+        select(func.count()).select_from(Alumni).scalar_subquery().label("alumni_count")
+    ).group_by(func.grouping_sets(
+        tuple_(facts.c.kind),
+        tuple_(facts.c.kind, facts.c.status),
+        tuple_(facts.c.kind, facts.c.industry_name),
+        tuple_(facts.c.kind, facts.c.month),
+        tuple_(facts.c.kind, facts.c.company_name)
+    ))
+
+
 @router.get("/dashboard/statistics", tags=["Job Placement - Dashboard"])
-async def get_dashboard_statistics(
+def get_dashboard_statistics(
     industry_id: Optional[int] = None,
     db: Session = Depends(get_db),
     token_data: dict = Depends(verify_jp_officer)
 ):
-    """Get dashboard statistics for Job Placement Portal"""
+    """
+    Get dashboard statistics for Job Placement Portal
+
+    Results are cached per industry_id for JP_DASHBOARD_CACHE_SECONDS in
+    this worker, so they can trail new postings by that long.
+    """
+    now = time.monotonic()
+    with _dashboard_cache_lock:
+        cached = _dashboard_cache.get(industry_id)
+    if cached and cached[0] > now:
+        return cached[1]
+
     try:
-        from models import Internship, Employer, Industry, Alumni
-        from sqlalchemy import func, extract
-        
         print("📊 Fetching Job Placement Dashboard statistics")
         
-        # Base queries
-        employer_query = db.query(Employer).filter(
-            Employer.eligibility.in_(['job_placement', 'both'])
-        )
-        job_posting_query = db.query(Internship).filter(
-            Internship.posting_type == 'job_placement'
-        )
+        rows = db.execute(_dashboard_statistics_query(industry_id)).all()
         
-        # Apply industry filter if provided
-        if industry_id:
-            employer_query = employer_query.filter(Employer.industry_id == industry_id)
-            job_posting_query = job_posting_query.join(Employer).filter(
-                Employer.industry_id == industry_id
-            )
-        
-        # Summary statistics
-        total_employers = employer_query.count()
-        total_job_postings = job_posting_query.count()
-        active_job_postings = job_posting_query.filter(Internship.status == 'open').count()
-        pending_job_postings = job_posting_query.filter(Internship.status == 'pending').count()
-        
-        # Total alumni (if Alumni table exists)
-        total_alumni = db.query(Alumni).count() if Alumni else 0
-        
-        # Total applications (if applications exist)
-        total_applications = 0  # Placeholder - implement when application tracking is added
-        
-        # Employers by industry
-        employers_by_industry = db.query(
-            Industry.industry_name,
-            func.count(Employer.employer_id).label('count')
-        ).join(Employer, Employer.industry_id == Industry.industry_id)\
-         .filter(Employer.eligibility.in_(['job_placement', 'both']))\
-         .group_by(Industry.industry_name)\
-         .all()
-        
-        # Job postings by status
-        job_postings_by_status = db.query(
-            Internship.status,
-            func.count(Internship.internship_id).label('count')
-        ).filter(Internship.posting_type == 'job_placement')\
-         .group_by(Internship.status)\
-         .all()
-        
-        # Job postings by industry
-        job_postings_by_industry = db.query(
-            Industry.industry_name,
-            func.count(Internship.internship_id).label('count')
-        ).join(Employer, Internship.employer_id == Employer.employer_id)\
-         .join(Industry, Employer.industry_id == Industry.industry_id)\
-         .filter(Internship.posting_type == 'job_placement')\
-         .group_by(Industry.industry_name)\
-         .all()
-        
-        # Monthly job postings (last 12 months)
-        monthly_job_postings = db.query(
-            extract('month', Internship.created_at).label('month'),
-            func.count(Internship.internship_id).label('count')
-        ).filter(Internship.posting_type == 'job_placement')\
-         .group_by(extract('month', Internship.created_at))\
-         .all()
+        summary = {
+            "total_alumni": 0,
+            "total_employers": 0,
+            "total_job_postings": 0,
+            "active_job_postings": 0,
+            "pending_job_postings": 0,
+            "total_applications": 0  # Placeholder - implement when application tracking is added
+        }
+        employers_by_industry = []
+        job_postings_by_status = []
+        job_postings_by_industry = []
+        monthly_job_postings = []
+        postings_by_employer = []
+        
+        for row in rows:
+            if row.dimension == "total":
+                summary["total_alumni"] = row.alumni_count
+                if row.kind == "employer":
+                    summary["total_employers"] = row.filtered_count
+                else:
+                    summary["total_job_postings"] = row.filtered_count
+                    summary["active_job_postings"] = row.open_count
+                    summary["pending_job_postings"] = row.pending_count
+            elif row.dimension == "industry":
+                if row.industry_name is None:
+                    continue  # Employer without an industry
+                breakdown = employers_by_industry if row.kind == "employer" else job_postings_by_industry
+                breakdown.append({"industry_name": row.industry_name, "count": row.count})
+            elif row.kind != "posting":
+                continue  # Status/month/company groups only apply to postings
+            elif row.dimension == "status":
+                job_postings_by_status.append({"status": row.status, "count": row.count})
+            elif row.dimension == "month" and row.month is not None:
+                monthly_job_postings.append({"month": int(row.month), "count": row.count})
+            elif row.dimension == "company" and row.company_name is not None:
+                postings_by_employer.append({"company_name": row.company_name, "count": row.count})
         
         # Top employers by job postings
-        top_employers = db.query(
-            Employer.company_name,
-            func.count(Internship.internship_id).label('count')
-        ).join(Internship, Internship.employer_id == Employer.employer_id)\
-         .filter(Internship.posting_type == 'job_placement')\
-         .group_by(Employer.company_name)\
-         .order_by(func.count(Internship.internship_id).desc())\
-         .limit(5)\
-         .all()
+        top_employers = sorted(postings_by_employer, key=lambda item: item["count"], reverse=True)[:5]
         
-        return {
+        response = {
             "status": "success",
             "data": {
-                "summary": {
-                    "total_alumni": total_alumni,
-                    "total_employers": total_employers,
-                    "total_job_postings": total_job_postings,
-                    "active_job_postings": active_job_postings,
-                    "pending_job_postings": pending_job_postings,
-                    "total_applications": total_applications
-                },
-                "employers_by_industry": [
-                    {"industry_name": row.industry_name, "count": row.count}
-                    for row in employers_by_industry
-                ],
-                "job_postings_by_status": [
-                    {"status": row.status, "count": row.count}
-                    for row in job_postings_by_status
-                ],
-                "job_postings_by_industry": [
-                    {"industry_name": row.industry_name, "count": row.count}
-                    for row in job_postings_by_industry
-                ],
-                "monthly_job_postings": [
-                    {"month": int(row.month), "count": row.count}
-                    for row in monthly_job_postings
-                ],
-                "top_employers": [
-                    {"company_name": row.company_name, "count": row.count}
-                    for row in top_employers
-                ]
+                "summary": summary,
+                "employers_by_industry": employers_by_industry,
+                "job_postings_by_status": job_postings_by_status,
+                "job_postings_by_industry": job_postings_by_industry,
+                "monthly_job_postings": monthly_job_postings,
+                "top_employers": top_employers
             }
         }
     except Exception as e:
@@ -159,13 +189,17 @@ async def get_dashboard_statistics(
             detail=f"Failed to fetch dashboard statistics: {str(e)}"
         )
 
+    with _dashboard_cache_lock:
+        _dashboard_cache[industry_id] = (now + JP_DASHBOARD_CACHE_SECONDS, response)
+    return response
+
 
 # ============================================================================
 # JOB POSTINGS ENDPOINTS
 # ============================================================================
 
 @router.get("/job-postings", tags=["Job Placement - Job Postings"])
-async def get_all_job_postings(
+def get_all_job_postings(
     page_no: int = 1,
     page_size: int = 10,
     keyword: str = "",
@@ -202,7 +236,7 @@ async def get_all_job_postings(
         
         # Apply pagination
         offset = (page_no - 1) * page_size
-        job_postings = query.order_by(Internship.created_at.desc()).offset(offset).limit(page_size).all()
+        job_postings = query.options(*INTERNSHIP_LISTING).order_by(Internship.created_at.desc()).offset(offset).limit(page_size).all()
         
         # Format response
         result_data = []
@@ -249,7 +283,7 @@ async def get_all_job_postings(
 
 
 @router.get("/job-postings/{posting_id}", tags=["Job Placement - Job Postings"])
-async def get_job_posting_by_id(
+def get_job_posting_by_id(
     posting_id: int,
     db: Session = Depends(get_db),
     token_data: dict = Depends(verify_jp_officer)
@@ -299,7 +333,7 @@ async def get_job_posting_by_id(
 
 
 @router.put("/job-postings/{posting_id}/status", tags=["Job Placement - Job Postings"])
-async def update_job_posting_status(
+def update_job_posting_status(
     posting_id: int,
     status_data: dict,
     db: Session = Depends(get_db),
@@ -371,7 +405,7 @@ async def update_job_posting_status(
 # ============================================================================
 
 @router.get("/search", tags=["Job Placement - Employers"])
-async def search_all_employers(
+def search_all_employers(
     page_no: int = 1,
     page_size: int = 10,
     keyword: str = "",
@@ -457,7 +491,7 @@ async def search_all_employers(
 
 
 @router.get("")
-async def get_all_employers(
+def get_all_employers(
     page_no: int = 1,
     page_size: int = 10,
     keyword: str = "",
@@ -551,7 +585,7 @@ async def get_all_employers(
 
 
 @router.post("", status_code=status.HTTP_201_CREATED)
-async def create_employer(
+def create_employer(
     email_address: EmailStr = Form(...),
     company_name: str = Form(...),
     representative_name: str = Form(...),
@@ -612,7 +646,7 @@ async def create_employer(
             file_path = os.path.join(upload_dir, filename)
             
             with open(file_path, "wb") as f:
-                content = await moa_pdf.read()
+                content = moa_pdf.file.read()
                 f.write(content)
             
             moa_file_path = file_path
@@ -686,7 +720,7 @@ ILEAP Job Placement Team"""
 
 
 @router.get("/{employer_id}")
-async def get_employer_by_id(
+def get_employer_by_id(
     employer_id: int,
     db: Session = Depends(get_db),
     token_data: dict = Depends(verify_jp_officer)
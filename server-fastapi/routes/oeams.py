@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import case, func, true, tuple_
 from sqlalchemy.orm import Session
 from database import get_db
 from middleware.auth import get_current_user
@@ -8,6 +9,7 @@ from typing import Optional
 from pydantic import BaseModel
 import json
 from utils.datetime_helper import now as philippine_now, utcnow as philippine_utcnow, format_datetime_for_api
+from utils.work_schedule import parse_work_schedule
 
 router = APIRouter(prefix="/api/oeams", tags=["OEAMS - OJT Evaluation and Management System"])
 
@@ -390,10 +392,21 @@ def get_today_log(
 
 @router.get("/logs")
 def get_all_logs(
+    start_date: Optional[date] = Query(None, description="Only logs on or after this date"),
+    end_date: Optional[date] = Query(None, description="Only logs on or before this date"),
+    limit: Optional[int] = Query(None, ge=1, le=500, description="Page size (omit to return every log)"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
     current_user: dict = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """Get all time logs and accomplishments for the student"""
+    """
+    Get time logs and accomplishments for the student, newest first
+
+    Each log carries running_hours / running_days: valid hours and days from
+    the start of the OJT up to and including that log. total_hours /
+    total_days cover the requested date range. Pages are keyset-paginated on
+    (log_date, log_id); pass next_cursor back as cursor.
+    """
     if current_user['role'] != 'student':
         raise HTTPException(status_code=403, detail="Only students can view logs")
     
@@ -402,92 +415,123 @@ def get_all_logs(
     if not student:
         raise HTTPException(status_code=404, detail="Student not found")
     
-    # Get employer info for work schedule validation
-    application = db.query(InternshipApplication).filter(
+    cursor_key = None
+    if cursor:
+        try:
+            cursor_date, cursor_id = cursor.split("_")
+            cursor_key = (date.fromisoformat(cursor_date), int(cursor_id))
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+    
+    # Work schedule of the accepted placement's employer
+    raw_schedule = db.query(Employer.work_schedule).join(
+        Internship, Internship.employer_id == Employer.employer_id
+    ).join(
+        InternshipApplication, InternshipApplication.internship_id == Internship.internship_id
+    ).filter(
         InternshipApplication.student_id == student.student_id,
         InternshipApplication.status == 'accepted'
-    ).first()
-    
-    employer = None
-    work_schedule = None
-    if application:
-        internship = db.query(Internship).filter(
-            Internship.internship_id == application.internship_id
-        ).first()
-        if internship:
-            employer = db.query(Employer).filter(
-                Employer.employer_id == internship.employer_id
-            ).first()
-            if employer and employer.work_schedule:
-                try:
-                    work_schedule = json.loads(employer.work_schedule)
-                except json.JSONDecodeError:
-                    work_schedule = None
-    
-    # Get all time logs
-    time_logs = db.query(DailyTimeLog).filter(
+    ).order_by(InternshipApplication.application_id).limit(1).scalar()
+    work_schedule = parse_work_schedule(raw_schedule)
+    
+    # Only logs without validation warnings count towards hours and days
+    is_valid = work_schedule.valid_log_clause(DailyTimeLog.time_in, DailyTimeLog.time_out) if work_schedule else true()
+    valid_hours = case((is_valid, func.coalesce(DailyTimeLog.total_hours, 0)), else_=0)
+    valid_day = case((is_valid, 1), else_=0)
+    chronological = (DailyTimeLog.log_date, DailyTimeLog.log_id)
+    
+    # First accomplishment entry of each of the student's logs
+    first_accomplishment = db.query(
+        DailyAccomplishment.log_id,
+        func.min(DailyAccomplishment.accomplishment_id).label("accomplishment_id")
+    ).join(
+        DailyTimeLog, DailyTimeLog.log_id == DailyAccomplishment.log_id
+    ).filter(
+        DailyTimeLog.student_id == student.student_id
+    ).group_by(DailyAccomplishment.log_id).subquery()
+    
+    # All of the student's logs with running totals (from the start of the OJT)
+    history = db.query(
+        DailyTimeLog.log_id,
+        DailyTimeLog.log_date,
+        DailyTimeLog.time_in,
+        DailyTimeLog.time_out,
+        DailyTimeLog.total_hours,
+        DailyTimeLog.status,
+        DailyAccomplishment.tasks,
+        DailyAccomplishment.accomplishments,
+        is_valid.label("is_valid"),
+        func.sum(valid_hours).over(order_by=chronological).label("running_hours"),
+        func.sum(valid_day).over(order_by=chronological).label("running_days")
+    ).outerjoin(
+        first_accomplishment, first_accomplishment.c.log_id == DailyTimeLog.log_id
+    ).outerjoin(
+        DailyAccomplishment, DailyAccomplishment.accomplishment_id == first_accomplishment.c.accomplishment_id
+    ).filter(
         DailyTimeLog.student_id == student.student_id
-    ).order_by(DailyTimeLog.log_date.desc()).all()
+    ).subquery()
+    
+    # Logs in the date range with the range totals
+    in_range = db.query(
+        history,
+        func.sum(case((history.c.is_valid, func.coalesce(history.c.total_hours, 0)), else_=0)).over().label("range_hours"),
+        func.sum(case((history.c.is_valid, 1), else_=0)).over().label("range_days")
+    )
+    if start_date:
+        in_range = in_range.filter(history.c.log_date >= start_date)
+    if end_date:
+        in_range = in_range.filter(history.c.log_date <= end_date)
+    in_range = in_range.subquery()
+    
+    # Page (newest first), one row more than requested to detect a next page
+    page_query = db.query(in_range)
+    if cursor_key:
+        page_query = page_query.filter(tuple_(in_range.c.log_date, in_range.c.log_id) < cursor_key)
+    page_query = page_query.order_by(in_range.c.log_date.desc(), in_range.c.log_id.desc())
+    if limit:
+        page_query = page_query.limit(limit + 1)
+    rows = page_query.all()
+    
+    has_more = bool(limit) and len(rows) > limit
+    rows = rows[:limit] if limit else rows
     
     logs_data = []
-    total_hours_sum = 0
-    
-    for time_log in time_logs:
-        accomplishment = db.query(DailyAccomplishment).filter(
-            DailyAccomplishment.log_id == time_log.log_id
-        ).first()
-        
-        log_hours = float(time_log.total_hours) if time_log.total_hours else 0
-        
-        # Validate log against work schedule
+    for row in rows:
         validation_warning = None
-        if work_schedule and time_log.time_in:
-            log_day = time_log.time_in.strftime('%A')
-            day_schedule = work_schedule.get(log_day)
-            
-            if day_schedule is None:
-                validation_warning = f"{log_day} is not a working day"
-            elif day_schedule.get('start') and day_schedule.get('end') and time_log.time_out:
-                try:
-                    start_parts = day_schedule['start'].split(':')
-                    end_parts = day_schedule['end'].split(':')
-                    work_start = dt_time(int(start_parts[0]), int(start_parts[1]))
-                    work_end = dt_time(int(end_parts[0]), int(end_parts[1]))
-                    
-                    time_in_time = time_log.time_in.time()
-                    time_out_time = time_log.time_out.time()
-                    
-                    # Only flag if BOTH time-in and time-out are outside working hours
-                    if time_out_time < work_start:
-                        validation_warning = f"Time-out before work hours (starts at {day_schedule['start']})"
-                    elif time_in_time > work_end:
-                        validation_warning = f"Time-in after work hours (ends at {day_schedule['end']})"
-                    elif time_in_time == time_out_time:
-                        validation_warning = f"Time-in and time-out are the same"
-                except (KeyError, ValueError, IndexError):
-                    pass
-        
-        # Only count hours from logs without validation warnings (valid logs only)
-        if validation_warning is None:
-            total_hours_sum += log_hours
+        if work_schedule and not row.is_valid:
+            validation_warning = work_schedule.log_warning(row.time_in, row.time_out)
         
         logs_data.append({
-            "log_id": time_log.log_id,
-            "log_date": time_log.log_date.isoformat(),
-            "time_in": format_datetime_for_api(time_log.time_in),
-            "time_out": format_datetime_for_api(time_log.time_out),
-            "total_hours": log_hours,
-            "status": time_log.status,
-            "tasks": accomplishment.tasks if accomplishment else None,
-            "accomplishments": accomplishment.accomplishments if accomplishment else None,
-            "validation_warning": validation_warning
+            "log_id": row.log_id,
+            "log_date": row.log_date.isoformat(),
+            "time_in": format_datetime_for_api(row.time_in),
+            "time_out": format_datetime_for_api(row.time_out),
+            "total_hours": float(row.total_hours) if row.total_hours else 0,
+            "status": row.status,
+            "tasks": row.tasks,
+            "accomplishments": row.accomplishments,
+            "validation_warning": validation_warning,
+            "running_hours": round(float(row.running_hours or 0), 2),
+            "running_days": int(row.running_days or 0)
         })
     
+    # Range totals are on every row; an empty page (past the end) still needs them
+    if rows:
+        total_hours, total_days = float(rows[0].range_hours or 0), int(rows[0].range_days or 0)
+    else:
+        range_hours, range_days = db.query(
+            func.max(in_range.c.range_hours),
+            func.max(in_range.c.range_days)
+        ).one()
+        total_hours, total_days = float(range_hours or 0), int(range_days or 0)
+    
     return {
         "status": "success",
         "data": {
             "logs": logs_data,
-            "total_hours": round(total_hours_sum, 2),
-            "total_days": len([log for log in logs_data if log.get("validation_warning") is None])
+            "total_hours": round(total_hours, 2),
+            "total_days": total_days,
+            "next_cursor": f"{rows[-1].log_date.isoformat()}_{rows[-1].log_id}" if has_more else None,
+            "has_more": has_more
         }
     }
@@ -5,10 +5,12 @@ Only accessible by users with 'ojt_head' role
 """
 from fastapi import APIRouter, Depends, status, Query, Form, File, UploadFile
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
-from database import get_db
+from database import get_db, get_async_db
 from middleware.auth import verify_token
 from config import get_upload_path, get_upload_url
+from utils.loader_options import INTERNSHIP_LISTING
 from controllers import (
     dashboard_controller,
     employer_controller,
@@ -44,11 +46,11 @@ async def get_dashboard_statistics(
     school_year: Optional[str] = None,
     company_id: Optional[int] = None,
     location: Optional[str] = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     token_data: dict = Depends(verify_ojt_head_role)
 ):
     """Get dashboard statistics for OJT Head"""
-    return dashboard_controller.get_dashboard_statistics(
+    return await db.run_sync(lambda db: dashboard_controller.get_dashboard_statistics(
         db=db,
         campus_id=campus_id,
         program_id=program_id,
@@ -57,16 +59,16 @@ async def get_dashboard_statistics(
         school_year=school_year,
         company_id=company_id,
         location=location
-    )
+    ))
 
 
 @router.get("/dashboard/filter-options")
 async def get_dashboard_filter_options(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     token_data: dict = Depends(verify_ojt_head_role)
 ):
     """Get filter options for dashboard"""
-    return dashboard_controller.get_filter_options(db)
+    return await db.run_sync(lambda db: dashboard_controller.get_filter_options(db))
 
 
 # ============================================================================
@@ -81,7 +83,7 @@ async def get_all_employers(
     industry_id: Optional[int] = None,
     eligibility: Optional[str] = None,
     status_filter: Optional[str] = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     token_data: dict = Depends(verify_ojt_head_role)
 ):
     """Get all employers with pagination and filters - OJT Head sees only internship and both"""
@@ -90,7 +92,7 @@ async def get_all_employers(
     if not eligibility:
         eligibility = "internship,both"
     
-    return employer_controller.get_all_employers(
+    return await db.run_sync(lambda db: employer_controller.get_all_employers(
         db=db,
         page=page,
         per_page=per_page,
@@ -98,21 +100,21 @@ async def get_all_employers(
         industry_id=industry_id,
         eligibility=eligibility,
         status_filter=status_filter
-    )
+    ))
 
 
 @router.get("/employers/{employer_id}")
 async def get_employer_by_id(
     employer_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     token_data: dict = Depends(verify_ojt_head_role)
 ):
     """Get employer by ID"""
-    return employer_controller.get_employer_by_id(employer_id, db)
+    return await db.run_sync(lambda db: employer_controller.get_employer_by_id(employer_id, db))
 
 
 @router.post("/employers/register")
-async def register_employer(
+def register_employer(
     employer_data: dict,
     db: Session = Depends(get_db),
     token_data: dict = Depends(verify_ojt_head_role)
@@ -124,7 +126,7 @@ async def register_employer(
 
 
 @router.post("/employers")
-async def create_employer_simple(
+def create_employer_simple(
     email_address: str = Form(...),
     company_name: str = Form(...),
     representative_name: str = Form(...),
@@ -152,7 +154,7 @@ async def create_employer_simple(
         os.makedirs(uploads_dir, exist_ok=True)
         filename = f"{uuid4()}.pdf"
         saved_path = os.path.join(uploads_dir, filename)
-        content = await moa_pdf.read()
+        content = moa_pdf.file.read()
         with open(saved_path, "wb") as f:
             f.write(content)
     
@@ -173,21 +175,21 @@ async def create_employer_simple(
 async def update_employer(
     employer_id: int,
     employer_data: dict,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     token_data: dict = Depends(verify_ojt_head_role)
 ):
     """Update employer"""
-    return employer_controller.update_employer(employer_id, employer_data, db)
+    return await db.run_sync(lambda db: employer_controller.update_employer(employer_id, employer_data, db))
 
 
 @router.post("/employers/{employer_id}/send-new-password")
 async def send_employer_new_password(
     employer_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     token_data: dict = Depends(verify_ojt_head_role)
 ):
     """Send new password to employer"""
-    return employer_controller.send_new_password(employer_id, db)
+    return await db.run_sync(lambda db: employer_controller.send_new_password(employer_id, db))
 
 
 # ============================================================================
@@ -195,7 +197,7 @@ async def send_employer_new_password(
 # ============================================================================
 
 @router.get("/internships")
-async def get_all_internships(
+def get_all_internships(
     page: int = Query(1, ge=1, alias="pageNo"),
     per_page: int = Query(10, ge=1, le=100, alias="pageSize"),
     keyword: Optional[str] = None,
@@ -225,7 +227,7 @@ async def get_all_internships(
     total_records = query.count()
     offset = (page - 1) * per_page
     
-    internships = query.order_by(Internship.created_at.desc()).offset(offset).limit(per_page).all()
+    internships = query.options(*INTERNSHIP_LISTING).order_by(Internship.created_at.desc()).offset(offset).limit(per_page).all()
     
     # Format response with employer info
     result_data = []
@@ -266,7 +268,7 @@ async def get_all_internships(
 
 
 @router.get("/internships/{internship_id}")
-async def get_internship_by_id(
+def get_internship_by_id(
     internship_id: int,
     db: Session = Depends(get_db),
     token_data: dict = Depends(verify_ojt_head_role)
@@ -286,7 +288,7 @@ async def get_internship_by_id(
 
 
 @router.put("/internships/{internship_id}/status")
-async def update_internship_status(
+def update_internship_status(
     internship_id: int,
     status_data: dict,
     db: Session = Depends(get_db),
@@ -355,12 +357,12 @@ async def get_all_ojt_coordinators(
     keyword: str = "",
     campus_id: Optional[int] = None,
     department_id: Optional[int] = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     token_data: dict = Depends(verify_ojt_head_role)
 ):
     """Get all OJT coordinators"""
     user_id = token_data.get("user_id")
-    return ojt_coordinator_controller.get_all_ojt_coordinators(
+    return await db.run_sync(lambda db: ojt_coordinator_controller.get_all_ojt_coordinators(
         db=db,
         user_id=user_id,
         page_no=pageNo,
@@ -368,26 +370,26 @@ async def get_all_ojt_coordinators(
         keyword=keyword,
         campus_id=campus_id,
         department_id=department_id
-    )
+    ))
 
 
 @router.get("/ojt-coordinators/{user_id}")
 async def get_ojt_coordinator_by_id(
     user_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     token_data: dict = Depends(verify_ojt_head_role)
 ):
     """Get OJT coordinator by ID"""
     ojt_head_user_id = token_data.get("user_id")
-    return ojt_coordinator_controller.get_ojt_coordinator_by_id(
+    return await db.run_sync(lambda db: ojt_coordinator_controller.get_ojt_coordinator_by_id(
         user_id=user_id,
         ojt_head_user_id=ojt_head_user_id,
         db=db
-    )
+    ))
 
 
 @router.post("/ojt-coordinators/register")
-async def register_ojt_coordinator(
+def register_ojt_coordinator(
     coordinator_data: dict,
     db: Session = Depends(get_db),
     token_data: dict = Depends(verify_ojt_head_role)
@@ -407,23 +409,23 @@ async def register_ojt_coordinator(
 async def update_ojt_coordinator(
     user_id: int,
     coordinator_data: dict,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     token_data: dict = Depends(verify_ojt_head_role)
 ):
     """Update OJT coordinator"""
     from schemas.ojt_coordinator import OJTCoordinatorUpdate
     ojt_head_user_id = token_data.get("user_id")
     coordinator_update = OJTCoordinatorUpdate(**coordinator_data)
-    return ojt_coordinator_controller.update_ojt_coordinator(
+    return await db.run_sync(lambda db: ojt_coordinator_controller.update_ojt_coordinator(
         user_id=user_id,
         coordinator_update=coordinator_update,
         ojt_head_user_id=ojt_head_user_id,
         db=db
-    )
+    ))
 
 
 @router.post("/ojt-coordinators/{user_id}/send-new-password")
-async def send_coordinator_new_password(
+def send_coordinator_new_password(
     user_id: int,
     db: Session = Depends(get_db),
     token_data: dict = Depends(verify_ojt_head_role)
@@ -442,7 +444,7 @@ async def send_coordinator_new_password(
 # ============================================================================
 
 @router.get("/requirement-templates")
-async def get_requirement_templates(
+def get_requirement_templates(
     type: Optional[str] = None,
     db: Session = Depends(get_db),
     token_data: dict = Depends(verify_ojt_head_role)
@@ -480,7 +482,7 @@ async def get_requirement_templates(
 
 
 @router.post("/requirement-templates")
-async def create_requirement_template(
+def create_requirement_template(
     title: str = Form(...),
     description: Optional[str] = Form(None),
     type: str = Form("pre"),
@@ -521,7 +523,7 @@ async def create_requirement_template(
         
         # Save file
         with open(file_path, "wb") as buffer:
-            content = await template_file.read()
+            content = template_file.file.read()
             buffer.write(content)
         
         # Generate URL
@@ -556,7 +558,7 @@ async def create_requirement_template(
 
 
 @router.put("/requirement-templates/{template_id}")
-async def update_requirement_template(
+def update_requirement_template(
     template_id: int,
     title: Optional[str] = Form(None),
     description: Optional[str] = Form(None),
@@ -603,7 +605,7 @@ async def update_requirement_template(
         
         # Save file
         with open(file_path, "wb") as buffer:
-            content = await template_file.read()
+            content = template_file.file.read()
             buffer.write(content)
         
         # Update URL
@@ -641,7 +643,7 @@ async def update_requirement_template(
 
 
 @router.delete("/requirement-templates/{template_id}")
-async def delete_requirement_template(
+def delete_requirement_template(
     template_id: int,
     db: Session = Depends(get_db),
     token_data: dict = Depends(verify_ojt_head_role)
@@ -672,9 +674,9 @@ async def delete_requirement_template(
 
 @router.get("/me/campuses")
 async def get_my_campuses(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     token_data: dict = Depends(verify_ojt_head_role)
 ):
     """Get all campuses assigned to the logged-in OJT Head"""
     user_id = token_data.get("user_id")
-    return ojt_head_controller.get_my_campuses(user_id, db)
+    return await db.run_sync(lambda db: ojt_head_controller.get_my_campuses(user_id, db))
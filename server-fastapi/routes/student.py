@@ -1,6 +1,7 @@
-from fastapi import APIRouter, Depends, File, UploadFile, Form
+from fastapi import APIRouter, Depends, File, UploadFile, Form, Query
 from sqlalchemy.orm import Session
-from database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from database import get_db, get_async_db
 from middleware.auth import verify_token
 from controllers import student_controller
 from schemas.student import StudentProfileUpdate, StudentProfileResponse
@@ -18,14 +19,14 @@ class AddSkillRequest(BaseModel):
 @router.get("/profile", response_model=StudentProfileResponse)
 async def get_student_profile(
     token_data: dict = Depends(verify_token),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get current student's profile"""
-    return student_controller.get_student_profile(token_data["user_id"], db)
+    return await db.run_sync(lambda db: student_controller.get_student_profile(token_data["user_id"], db))
 
 
 @router.put("/profile")
-async def update_student_profile(
+def update_student_profile(
     profile_data: Optional[str] = Form(None),
     profile_picture: Optional[UploadFile] = File(None),
     token_data: dict = Depends(verify_token),
@@ -49,7 +50,7 @@ async def update_student_profile(
 
 
 @router.post("/profile/picture")
-async def upload_profile_picture(
+def upload_profile_picture(
     file: UploadFile = File(...),
     token_data: dict = Depends(verify_token),
     db: Session = Depends(get_db)
@@ -59,42 +60,42 @@ async def upload_profile_picture(
 
 
 @router.get("/skills")
-async def get_all_skills(db: Session = Depends(get_db)):
+async def get_all_skills(db: AsyncSession = Depends(get_async_db)):
     """Get all available skills"""
-    return student_controller.get_all_skills(db)
+    return await db.run_sync(lambda db: student_controller.get_all_skills(db))
 
 
 @router.post("/skills")
 async def add_student_skill(
     request: AddSkillRequest,
     token_data: dict = Depends(verify_token),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Add skill to student profile"""
-    return student_controller.add_student_skill(token_data["user_id"], request.skill_name, db)
+    return await db.run_sync(lambda db: student_controller.add_student_skill(token_data["user_id"], request.skill_name, db))
 
 
 @router.delete("/skills/{skill_id}")
 async def remove_student_skill(
     skill_id: int,
     token_data: dict = Depends(verify_token),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Remove skill from student profile"""
-    return student_controller.remove_student_skill(token_data["user_id"], skill_id, db)
+    return await db.run_sync(lambda db: student_controller.remove_student_skill(token_data["user_id"], skill_id, db))
 
 
 @router.get("/class-info")
 async def get_student_class_info(
     token_data: dict = Depends(verify_token),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get student's class information including program, department, coordinator, and dean"""
-    return student_controller.get_student_class_info(token_data["user_id"], db)
+    return await db.run_sync(lambda db: student_controller.get_student_class_info(token_data["user_id"], db))
 
 
 @router.get("/hiring-status")
-async def get_hiring_status(
+def get_hiring_status(
     token_data: dict = Depends(verify_token),
     db: Session = Depends(get_db)
 ):
@@ -224,68 +225,120 @@ async def get_hiring_status(
 
 
 @router.get("/ongoing-ojts")
-async def get_all_ongoing_ojts(
+def get_all_ongoing_ojts(
+    campus_id: Optional[int] = Query(None, description="Only students enrolled in a class of this campus"),
+    program_id: Optional[int] = Query(None, description="Only students enrolled in a class of this program"),
+    limit: Optional[int] = Query(None, ge=1, le=500, description="Page size (omit to return every record)"),
+    cursor: Optional[int] = Query(None, description="next_cursor from the previous page"),
     token_data: dict = Depends(verify_token),
     db: Session = Depends(get_db)
 ):
-    """Get all ongoing OJT records (for OJT Coordinator/Head view)"""
+    """
+    Get all ongoing OJT records (for OJT Coordinator/Head view)
+
+    Newest applications first, keyset-paginated on application_id.
+    """
     from datetime import datetime
+    from sqlalchemy import func, or_
+    from models import Student, InternshipApplication, RequirementSubmission, Internship, Employer, ClassEnrollment, Class, Program, Department
+    
+    # Requirements are validated when at least one submission is validated and
+    # no submission is still waiting ('submitted' and not validated)
+    validated = func.coalesce(RequirementSubmission.validated, False)
+    requirement_rollup = db.query(
+        RequirementSubmission.student_id,
+        func.bool_or(validated).label("has_validated"),
+        func.bool_and(or_(validated, RequirementSubmission.status != 'submitted')).label("none_pending")
+    ).group_by(RequirementSubmission.student_id).subquery()
     
-    # Query all accepted applications with start dates
-    ongoing_ojts = db.query(
-        InternshipApplication,
-        Student,
-        Internship,
-        Employer
+    requirements_validated = func.coalesce(
+        requirement_rollup.c.has_validated & func.coalesce(requirement_rollup.c.none_pending, True),
+        False
+    )
+    
+    # Accepted applications with start dates, with the requirement rollup joined in
+    query = db.query(
+        InternshipApplication.application_id,
+        InternshipApplication.ojt_start_date,
+        Student.student_id,
+        Student.first_name,
+        Student.last_name,
+        Student.sr_code,
+        Student.email,
+        Internship.internship_id,
+        Internship.title,
+        Employer.company_name,
+        requirements_validated.label("requirements_validated")
     ).join(
         Student, InternshipApplication.student_id == Student.student_id
     ).join(
         Internship, InternshipApplication.internship_id == Internship.internship_id
     ).join(
         Employer, Internship.employer_id == Employer.employer_id
+    ).outerjoin(
+        requirement_rollup, requirement_rollup.c.student_id == Student.student_id
     ).filter(
         InternshipApplication.status == 'accepted',
         InternshipApplication.ojt_start_date.isnot(None)
-    ).all()
+    )
+    
+    if campus_id or program_id:
+        enrollment = db.query(ClassEnrollment.enrollment_id).join(
+            Class, Class.class_id == ClassEnrollment.class_id
+        ).filter(
+            ClassEnrollment.student_id == Student.student_id,
+            ClassEnrollment.status == "active"
+        )
+        if program_id:
+            enrollment = enrollment.filter(Class.program_id == program_id)
+        if campus_id:
+            enrollment = enrollment.join(
+                Program, Program.program_id == Class.program_id
+            ).join(
+                Department, Department.department_id == Program.department_id
+            ).filter(Department.campus_id == campus_id)
+        query = query.filter(enrollment.exists())
+    
+    total = query.count() if limit else None
     
+    if cursor:
+        query = query.filter(InternshipApplication.application_id < cursor)
+    query = query.order_by(InternshipApplication.application_id.desc())
+    if limit:
+        query = query.limit(limit + 1)
+    rows = query.all()
+    
+    has_more = bool(limit) and len(rows) > limit
+    rows = rows[:limit] if limit else rows
+    
+    today = datetime.utcnow().date()
     result = []
-    for application, student, internship, employer in ongoing_ojts:
-        # Check if requirements are validated
-        submissions = db.query(RequirementSubmission).filter(
-            RequirementSubmission.student_id == student.student_id
-        ).all()
-        
-        all_validated = False
-        if submissions:
-            all_validated = all(sub.validated for sub in submissions if sub.status == 'submitted' or sub.validated)
-            has_validated = any(sub.validated for sub in submissions)
-            all_validated = all_validated and has_validated
-        
+    for row in rows:
         # Determine OJT status
-        ojt_status = "Not Started"
-        if application.ojt_start_date:
-            if datetime.utcnow().date() >= application.ojt_start_date.date():
-                ojt_status = "Ongoing" if all_validated else "Waiting for Requirements Validation"
-            else:
-                ojt_status = "Scheduled"
+        if today >= row.ojt_start_date.date():
+            ojt_status = "Ongoing" if row.requirements_validated else "Waiting for Requirements Validation"
+        else:
+            ojt_status = "Scheduled"
         
         result.append({
-            "student_id": student.student_id,
-            "student_name": f"{student.first_name} {student.last_name}",
-            "sr_code": student.sr_code,
-            "email": student.email,
-            "company_name": employer.company_name,
-            "position": internship.title,
-            "ojt_start_date": application.ojt_start_date.isoformat() if application.ojt_start_date else None,
-            "requirements_validated": all_validated,
+            "student_id": row.student_id,
+            "student_name": f"{row.first_name} {row.last_name}",
+            "sr_code": row.sr_code,
+            "email": row.email,
+            "company_name": row.company_name,
+            "position": row.title,
+            "ojt_start_date": row.ojt_start_date.isoformat(),
+            "requirements_validated": bool(row.requirements_validated),
             "ojt_status": ojt_status,
-            "application_id": application.application_id,
-            "internship_id": internship.internship_id
+            "application_id": row.application_id,
+            "internship_id": row.internship_id
         })
     
     return {
-        "total": len(result),
-        "ongoing_ojts": result
+        "total": total if total is not None else len(result),
+        "ongoing_ojts": result,
+        "next_cursor": rows[-1].application_id if has_more else None,
+        "has_more": has_more
     }
 
 
@@ -294,7 +347,7 @@ class GradeSubmission(BaseModel):
 
 
 @router.post("/{student_id}/grade")
-async def submit_student_grade(
+def submit_student_grade(
     student_id: int,
     grade_data: GradeSubmission,
     token_data: dict = Depends(verify_token),
@@ -330,7 +383,7 @@ async def submit_student_grade(
 
 
 @router.get("/personal-history-statement-data")
-async def get_personal_history_statement_data(
+def get_personal_history_statement_data(
     token_data: dict = Depends(verify_token),
     db: Session = Depends(get_db)
 ):
@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
-from database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from database import get_db, get_async_db
 from middleware.auth import verify_token
 from controllers import (
     campus_controller,
@@ -33,11 +34,11 @@ def verify_superadmin(token_data: dict = Depends(verify_token)):
 # ============= CAMPUSES =============
 @router.get("/campuses/main/list")
 async def get_main_campuses(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     token_data: dict = Depends(verify_superadmin)
 ):
     """Get all main campuses for superadmin"""
-    return campus_controller.get_main_campuses(db)
+    return await db.run_sync(lambda db: campus_controller.get_main_campuses(db))
 
 
 @router.get("/campuses")
@@ -45,62 +46,62 @@ async def get_all_campuses(
     pageNo: int = 1,
     pageSize: int = 10,
     keyword: str = "",
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     token_data: dict = Depends(verify_superadmin)
 ):
     """Get all campuses for superadmin"""
-    return campus_controller.get_all_campuses(pageNo, pageSize, keyword, db)
+    return await db.run_sync(lambda db: campus_controller.get_all_campuses(pageNo, pageSize, keyword, db))
 
 
 @router.get("/campuses/{campus_id}")
 async def get_campus_by_id(
     campus_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     token_data: dict = Depends(verify_superadmin)
 ):
     """Get a single campus by ID (superadmin only)"""
-    return campus_controller.get_campus_by_id(campus_id, db)
+    return await db.run_sync(lambda db: campus_controller.get_campus_by_id(campus_id, db))
 
 
 @router.post("/campuses", status_code=status.HTTP_201_CREATED)
 async def create_campus(
     campus: CampusCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     token_data: dict = Depends(verify_superadmin)
 ):
     """Create a new campus (superadmin only)"""
-    return campus_controller.add_campus(campus, db)
+    return await db.run_sync(lambda db: campus_controller.add_campus(campus, db))
 
 
 @router.put("/campuses/{campus_id}")
 async def update_campus(
     campus_id: int,
     campus: CampusUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     token_data: dict = Depends(verify_superadmin)
 ):
     """Update a campus (superadmin only)"""
-    return campus_controller.update_campus(campus_id, campus, db)
+    return await db.run_sync(lambda db: campus_controller.update_campus(campus_id, campus, db))
 
 
 @router.delete("/campuses/{campus_id}")
 async def delete_campus(
     campus_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     token_data: dict = Depends(verify_superadmin)
 ):
     """Delete a campus (superadmin only)"""
-    return campus_controller.remove_campus(campus_id, db)
+    return await db.run_sync(lambda db: campus_controller.remove_campus(campus_id, db))
 
 
 @router.put("/campuses/{campus_id}/toggle-status")
 async def toggle_campus_status(
     campus_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     token_data: dict = Depends(verify_superadmin)
 ):
     """Toggle campus status (superadmin only)"""
-    return campus_controller.toggle_campus_status(campus_id, db)
+    return await db.run_sync(lambda db: campus_controller.toggle_campus_status(campus_id, db))
 
 
 # ============= DEPARTMENTS =============
@@ -110,52 +111,52 @@ async def get_all_departments(
     pageSize: int = 10,
     keyword: str = "",
     campus_id: Optional[int] = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     token_data: dict = Depends(verify_superadmin)
 ):
     """Get all departments for superadmin with campus filtering"""
-    return department_controller.get_all_departments(pageNo, pageSize, keyword, campus_id, db)
+    return await db.run_sync(lambda db: department_controller.get_all_departments(pageNo, pageSize, keyword, campus_id, db))
 
 
 @router.post("/departments", status_code=status.HTTP_201_CREATED)
 async def create_department(
     department: DepartmentCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     token_data: dict = Depends(verify_superadmin)
 ):
     """Create a new department (superadmin only)"""
-    return department_controller.add_department(department, db)
+    return await db.run_sync(lambda db: department_controller.add_department(department, db))
 
 
 @router.put("/departments/{department_id}")
 async def update_department(
     department_id: int,
     department: DepartmentUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     token_data: dict = Depends(verify_superadmin)
 ):
     """Update a department (superadmin only)"""
-    return department_controller.update_department(department_id, department, db)
+    return await db.run_sync(lambda db: department_controller.update_department(department_id, department, db))
 
 
 @router.delete("/departments/{department_id}")
 async def delete_department(
     department_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     token_data: dict = Depends(verify_superadmin)
 ):
     """Delete a department (superadmin only)"""
-    return department_controller.remove_department(department_id, db)
+    return await db.run_sync(lambda db: department_controller.remove_department(department_id, db))
 
 
 @router.put("/departments/{department_id}/toggle-status")
 async def toggle_department_status(
     department_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     token_data: dict = Depends(verify_superadmin)
 ):
     """Toggle department status (superadmin only)"""
-    return department_controller.toggle_department_status(department_id, db)
+    return await db.run_sync(lambda db: department_controller.toggle_department_status(department_id, db))
 
 
 # ============= PROGRAMS =============
@@ -165,52 +166,52 @@ async def get_all_programs(
     pageSize: int = 10,
     keyword: str = "",
     department_id: Optional[int] = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     token_data: dict = Depends(verify_superadmin)
 ):
     """Get all programs for superadmin with department filtering"""
-    return program_controller.get_all_programs(pageNo, pageSize, keyword, department_id, db)
+    return await db.run_sync(lambda db: program_controller.get_all_programs(pageNo, pageSize, keyword, department_id, db))
 
 
 @router.post("/programs", status_code=status.HTTP_201_CREATED)
 async def create_program(
     program: ProgramCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     token_data: dict = Depends(verify_superadmin)
 ):
     """Create a new program (superadmin only)"""
-    return program_controller.add_program(program, db)
+    return await db.run_sync(lambda db: program_controller.add_program(program, db))
 
 
 @router.put("/programs/{program_id}")
 async def update_program(
     program_id: int,
     program: ProgramUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     token_data: dict = Depends(verify_superadmin)
 ):
     """Update a program (superadmin only)"""
-    return program_controller.update_program(program_id, program, db)
+    return await db.run_sync(lambda db: program_controller.update_program(program_id, program, db))
 
 
 @router.delete("/programs/{program_id}")
 async def delete_program(
     program_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     token_data: dict = Depends(verify_superadmin)
 ):
     """Delete a program (superadmin only)"""
-    return program_controller.remove_program(program_id, db)
+    return await db.run_sync(lambda db: program_controller.remove_program(program_id, db))
 
 
 @router.put("/programs/{program_id}/toggle-status")
 async def toggle_program_status(
     program_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     token_data: dict = Depends(verify_superadmin)
 ):
     """Toggle program status (superadmin only)"""
-    return program_controller.toggle_program_status(program_id, db)
+    return await db.run_sync(lambda db: program_controller.toggle_program_status(program_id, db))
 
 
 # ============= EMPLOYERS =============
@@ -220,15 +221,15 @@ async def get_all_employers(
     pageSize: int = 10,
     keyword: str = "",
     industry_id: Optional[int] = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     token_data: dict = Depends(verify_superadmin)
 ):
     """Get all employers for superadmin"""
-    return employer_controller.get_all_employers(db=db, page=pageNo, per_page=pageSize, keyword=keyword, industry_id=industry_id)
+    return await db.run_sync(lambda db: employer_controller.get_all_employers(db=db, page=pageNo, per_page=pageSize, keyword=keyword, industry_id=industry_id))
 
 
 @router.post("/employers", status_code=status.HTTP_201_CREATED)
-async def create_employer(
+def create_employer(
     employer: EmployerCreate,
     db: Session = Depends(get_db),
     token_data: dict = Depends(verify_superadmin)
@@ -241,21 +242,21 @@ async def create_employer(
 async def update_employer(
     employer_id: int,
     employer: EmployerUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     token_data: dict = Depends(verify_superadmin)
 ):
     """Update an employer (superadmin only)"""
-    return employer_controller.update_employer(employer_id, employer, db)
+    return await db.run_sync(lambda db: employer_controller.update_employer(employer_id, employer, db))
 
 
 @router.delete("/employers/{employer_id}")
 async def delete_employer(
     employer_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     token_data: dict = Depends(verify_superadmin)
 ):
     """Delete an employer (superadmin only)"""
-    return employer_controller.remove_employer(employer_id, db)
+    return await db.run_sync(lambda db: employer_controller.remove_employer(employer_id, db))
 
 
 # ============= INDUSTRIES =============
@@ -264,42 +265,42 @@ async def get_all_industries(
     pageNo: int = 1,
     pageSize: int = 10,
     keyword: str = "",
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     token_data: dict = Depends(verify_superadmin)
 ):
     """Get all industries for superadmin"""
-    return industry_controller.get_all_industries(db, pageNo, pageSize, keyword)
+    return await db.run_sync(lambda db: industry_controller.get_all_industries(db, pageNo, pageSize, keyword))
 
 
 @router.post("/industries", status_code=status.HTTP_201_CREATED)
 async def create_industry(
     industry: IndustryCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     token_data: dict = Depends(verify_superadmin)
 ):
     """Create a new industry (superadmin only)"""
-    return industry_controller.create_industry(industry, db)
+    return await db.run_sync(lambda db: industry_controller.create_industry(industry, db))
 
 
 @router.put("/industries/{industry_id}")
 async def update_industry(
     industry_id: int,
     industry: IndustryUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     token_data: dict = Depends(verify_superadmin)
 ):
     """Update an industry (superadmin only)"""
-    return industry_controller.update_industry(industry_id, industry, db)
+    return await db.run_sync(lambda db: industry_controller.update_industry(industry_id, industry, db))
 
 
 @router.delete("/industries/{industry_id}")
 async def delete_industry(
     industry_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     token_data: dict = Depends(verify_superadmin)
 ):
     """Delete an industry (superadmin only)"""
-    return industry_controller.delete_industry(industry_id, db)
+    return await db.run_sync(lambda db: industry_controller.delete_industry(industry_id, db))
 
 
 # ============= SECTIONS =============
@@ -309,25 +310,25 @@ async def get_all_sections(
     pageSize: int = 10,
     keyword: str = "",
     program_id: int = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     token_data: dict = Depends(verify_superadmin)
 ):
     """Get all sections with optional filters (superadmin)"""
     from controllers import section_controller
-    return section_controller.get_all_sections(pageNo, pageSize, keyword, program_id, db)
+    return await db.run_sync(lambda db: section_controller.get_all_sections(pageNo, pageSize, keyword, program_id, db))
 
 
 @router.post("/sections", status_code=status.HTTP_201_CREATED)
 async def create_section(
     section: dict,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     token_data: dict = Depends(verify_superadmin)
 ):
     """Create a new section (superadmin only)"""
     from controllers import section_controller
     from schemas.section import SectionCreate
     section_data = SectionCreate(**section)
-    return section_controller.add_section(section_data, db)
+    return await db.run_sync(lambda db: section_controller.add_section(section_data, db))
 
 
 @router.get("/majors/{major_id}/sections")
@@ -336,66 +337,66 @@ async def get_sections_by_major(
     pageNo: int = 1,
     pageSize: int = 10,
     keyword: str = "",
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     token_data: dict = Depends(verify_superadmin)
 ):
     """Get all sections for a major (superadmin)"""
     from controllers import section_controller
-    return section_controller.get_all_sections(pageNo, pageSize, keyword, None, major_id, db)
+    return await db.run_sync(lambda db: section_controller.get_all_sections(pageNo, pageSize, keyword, None, major_id, db))
 
 
 @router.post("/majors/{major_id}/sections", status_code=status.HTTP_201_CREATED)
 async def create_section_for_major(
     major_id: int,
     section: dict,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     token_data: dict = Depends(verify_superadmin)
 ):
     """Create a new section for a major (superadmin only)"""
     from controllers import section_controller
     from schemas.section import SectionCreate
     section_data = SectionCreate(**section, major_id=major_id)
-    return section_controller.add_section(section_data, db)
+    return await db.run_sync(lambda db: section_controller.add_section(section_data, db))
 
 
 @router.put("/sections/{section_id}")
 async def update_section(
     section_id: int,
     section: dict,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     token_data: dict = Depends(verify_superadmin)
 ):
     """Update a section (superadmin only)"""
     from controllers import section_controller
     from schemas.section import SectionUpdate
     section_data = SectionUpdate(**section)
-    return section_controller.update_section(section_id, section_data, db)
+    return await db.run_sync(lambda db: section_controller.update_section(section_id, section_data, db))
 
 
 @router.delete("/sections/{section_id}")
 async def delete_section(
     section_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     token_data: dict = Depends(verify_superadmin)
 ):
     """Delete a section (superadmin only)"""
     from controllers import section_controller
-    return section_controller.remove_section(section_id, db)
+    return await db.run_sync(lambda db: section_controller.remove_section(section_id, db))
 
 
 @router.put("/sections/{section_id}/toggle-status")
 async def toggle_section_status(
     section_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     token_data: dict = Depends(verify_superadmin)
 ):
     """Toggle section status (superadmin only)"""
     from controllers import section_controller
-    return section_controller.toggle_section_status(section_id, db)
+    return await db.run_sync(lambda db: section_controller.toggle_section_status(section_id, db))
 
 # OJT Coordinator endpoints
 @router.post("/ojt-coordinators/{user_id}/send-new-password")
-async def send_new_password_superadmin(
+def send_new_password_superadmin(
     user_id: int,
     db: Session = Depends(get_db),
     token_data: dict = Depends(verify_superadmin)
@@ -408,7 +409,7 @@ async def send_new_password_superadmin(
 
 # Student Trainee endpoints
 @router.get("/student-trainees")
-async def get_all_student_trainees(
+def get_all_student_trainees(
     pageNo: int = 1,
     pageSize: int = 10,
     keyword: str = "",
@@ -495,7 +496,7 @@ async def get_all_student_trainees(
     }
 
 @router.post("/student-trainees/{user_id}/send-new-password")
-async def send_new_password_student(
+def send_new_password_student(
     user_id: int,
     db: Session = Depends(get_db),
     token_data: dict = Depends(verify_superadmin)
@@ -578,7 +579,7 @@ ILEAP System"""
 
 # Alumni endpoints
 @router.get("/alumni")
-async def get_all_alumni(
+def get_all_alumni(
     pageNo: int = 1,
     pageSize: int = 10,
     keyword: str = "",
@@ -651,7 +652,7 @@ async def get_all_alumni(
 
 
 @router.post("/alumni")
-async def create_alumni(
+def create_alumni(
     alumni_data: dict,
     db: Session = Depends(get_db),
     token_data: dict = Depends(verify_superadmin)
@@ -690,7 +691,7 @@ async def create_alumni(
 
 
 @router.put("/alumni/{alumni_id}")
-async def update_alumni(
+def update_alumni(
     alumni_id: int,
     alumni_data: dict,
     db: Session = Depends(get_db),
@@ -732,7 +733,7 @@ async def update_alumni(
 
 
 @router.delete("/alumni/{alumni_id}")
-async def delete_alumni(
+def delete_alumni(
     alumni_id: int,
     db: Session = Depends(get_db),
     token_data: dict = Depends(verify_superadmin)
@@ -764,7 +765,7 @@ async def delete_alumni(
 
 # ============= JOB PLACEMENT OFFICERS =============
 @router.get("/jp-officers")
-async def get_all_jp_officers(
+def get_all_jp_officers(
     pageNo: int = 1,
     pageSize: int = 10,
     keyword: str = "",
@@ -847,7 +848,7 @@ async def get_all_jp_officers(
 
 
 @router.get("/jp-officers/{user_id}")
-async def get_jp_officer_by_id(
+def get_jp_officer_by_id(
     user_id: int,
     db: Session = Depends(get_db),
     token_data: dict = Depends(verify_superadmin)
@@ -903,7 +904,7 @@ async def get_jp_officer_by_id(
 
 
 @router.post("/jp-officers/register", status_code=status.HTTP_201_CREATED)
-async def register_jp_officer(
+def register_jp_officer(
     jpo_data: dict,
     db: Session = Depends(get_db),
     token_data: dict = Depends(verify_superadmin)
@@ -1022,7 +1023,7 @@ ILEAP System"""
 
 
 @router.patch("/jp-officers/{user_id}")
-async def update_jp_officer(
+def update_jp_officer(
     user_id: int,
     jpo_data: dict,
     db: Session = Depends(get_db),
@@ -1097,7 +1098,7 @@ async def update_jp_officer(
 
 
 @router.post("/jp-officers/{user_id}/send-new-password")
-async def send_new_password_jp_officer(
+def send_new_password_jp_officer(
     user_id: int,
     db: Session = Depends(get_db),
     token_data: dict = Depends(verify_superadmin)
@@ -1193,16 +1194,16 @@ async def get_all_ojt_heads(
     pageSize: int = 10,
     keyword: str = "",
     campus_id: Optional[int] = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     token_data: dict = Depends(verify_superadmin)
 ):
     """Get all OJT heads (superadmin only)"""
     from controllers import ojt_head_controller
-    return ojt_head_controller.get_all_ojt_heads(db, pageNo, pageSize, keyword, campus_id)
+    return await db.run_sync(lambda db: ojt_head_controller.get_all_ojt_heads(db, pageNo, pageSize, keyword, campus_id))
 
 
 @router.post("/ojt-heads/register", status_code=status.HTTP_201_CREATED)
-async def register_ojt_head(
+def register_ojt_head(
     ojt_head_data: dict,
     db: Session = Depends(get_db),
     token_data: dict = Depends(verify_superadmin)
@@ -1218,18 +1219,18 @@ async def register_ojt_head(
 async def update_ojt_head(
     user_id: int,
     ojt_head_data: dict,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     token_data: dict = Depends(verify_superadmin)
 ):
     """Update an OJT head (superadmin only)"""
     from controllers import ojt_head_controller
     from schemas.ojt_head import OJTHeadUpdate
     ojt_head = OJTHeadUpdate(**ojt_head_data)
-    return ojt_head_controller.update_ojt_head(user_id, ojt_head, db)
+    return await db.run_sync(lambda db: ojt_head_controller.update_ojt_head(user_id, ojt_head, db))
 
 
 @router.post("/ojt-heads/{user_id}/send-new-password")
-async def send_new_password_ojt_head(
+def send_new_password_ojt_head(
     user_id: int,
     db: Session = Depends(get_db),
     token_data: dict = Depends(verify_superadmin)
@@ -1246,17 +1247,17 @@ async def get_all_ojt_coordinators(
     pageSize: int = 10,
     keyword: str = "",
     campus_id: Optional[int] = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     token_data: dict = Depends(verify_superadmin)
 ):
     """Get all OJT coordinators (superadmin only)"""
     from controllers import ojt_coordinator_controller
     # Superadmin can see all coordinators across all campuses
-    return ojt_coordinator_controller.get_all_ojt_coordinators_for_superadmin(db, pageNo, pageSize, keyword, campus_id)
+    return await db.run_sync(lambda db: ojt_coordinator_controller.get_all_ojt_coordinators_for_superadmin(db, pageNo, pageSize, keyword, campus_id))
 
 
 @router.post("/ojt-coordinators/register", status_code=status.HTTP_201_CREATED)
-async def register_ojt_coordinator(
+def register_ojt_coordinator(
     coordinator_data: dict,
     db: Session = Depends(get_db),
     token_data: dict = Depends(verify_superadmin)
@@ -1387,11 +1388,11 @@ ILEAP System"""
 async def update_ojt_coordinator(
     user_id: int,
     coordinator_data: dict,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     token_data: dict = Depends(verify_superadmin)
 ):
     """Update an OJT coordinator (superadmin only)"""
     from controllers import ojt_coordinator_controller
     from schemas.ojt_coordinator import OJTCoordinatorUpdate
     coordinator = OJTCoordinatorUpdate(**coordinator_data)
-    return ojt_coordinator_controller.update_ojt_coordinator_superadmin(user_id, coordinator, db)
+    return await db.run_sync(lambda db: ojt_coordinator_controller.update_ojt_coordinator_superadmin(user_id, coordinator, db))
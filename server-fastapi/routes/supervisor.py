@@ -4,7 +4,7 @@ from fastapi.responses import FileResponse
 from sqlalchemy.orm import Session
 from typing import Optional
 import os
-from datetime import datetime, date, time as datetime_time
+from datetime import datetime, date, timedelta, time as datetime_time
 from utils.datetime_helper import now as philippine_now, utcnow as philippine_utcnow, format_datetime_for_api
 
 from database import get_db
@@ -14,10 +14,11 @@ from controllers.supervisor_controller import (
 	update_supervisor,
 	delete_supervisor
 )
-from models import Employer, TraineeSupervisor, StudentSupervisorAssignment, Student, DailyTimeLog, DailyAccomplishment, InternshipApplication, ClassEnrollment, Program
+from models import Employer, TraineeSupervisor, StudentSupervisorAssignment, Student, DailyTimeLog, DailyAccomplishment, InternshipApplication, ClassEnrollment, Program, Class, Internship
 from schemas.supervisor import SupervisorCreate, SupervisorUpdate, SupervisorResponse
 from middleware.auth import get_current_user
 from sqlalchemy.orm import joinedload
+from sqlalchemy import and_, case, func, select
 
 
 router = APIRouter(prefix="/api/supervisors", tags=["Trainee Supervisors"])
@@ -251,6 +252,9 @@ def delete_supervisor_route(
 
 @router.get("/my-students")
 def get_assigned_students(
+	ojt_status: Optional[str] = Query(None, description="Filter by OJT status: 'Not Started', 'Accepted', 'Starting Soon' or 'In Progress'"),
+	page: int = Query(1, ge=1),
+	page_size: Optional[int] = Query(None, ge=1, le=100, description="Page size (omit to return every assigned student)"),
 	current_user: dict = Depends(get_current_user),
 	db: Session = Depends(get_db)
 ):
@@ -265,90 +269,89 @@ def get_assigned_students(
 	if not supervisor:
 		raise HTTPException(status_code=404, detail="Supervisor profile not found")
 	
-	# Get all active assignments
-	assignments = db.query(StudentSupervisorAssignment).filter(
+	# Program from the student's active class enrollment, used when student.program is empty
+	enrollment_program = select(Program.program_name).join(
+		Class, Class.program_id == Program.program_id
+	).join(
+		ClassEnrollment, ClassEnrollment.class_id == Class.class_id
+	).where(
+		ClassEnrollment.student_id == Student.student_id,
+		ClassEnrollment.status == "active"
+	).order_by(ClassEnrollment.enrollment_id).limit(1).correlate(Student).scalar_subquery()
+	
+	# OJT status from the application status and start date (a start date before
+	# tomorrow midnight means the OJT has started)
+	tomorrow = datetime.combine(philippine_now().date() + timedelta(days=1), datetime_time.min)
+	accepted = InternshipApplication.status == "accepted"
+	has_start_date = InternshipApplication.ojt_start_date.isnot(None)
+	ojt_status_column = case(
+		(and_(accepted, has_start_date, InternshipApplication.ojt_start_date < tomorrow), "In Progress"),
+		(and_(accepted, has_start_date), "Starting Soon"),
+		(accepted, "Accepted"),
+		else_="Not Started"
+	)
+	
+	# One query for the whole roster: assignment, student, placement and status
+	query = db.query(
+		StudentSupervisorAssignment.assignment_id,
+		StudentSupervisorAssignment.assigned_at,
+		StudentSupervisorAssignment.status,
+		Student.student_id,
+		Student.sr_code,
+		Student.first_name,
+		Student.last_name,
+		Student.email,
+		func.coalesce(func.nullif(Student.program, ""), enrollment_program).label("program"),
+		Internship.title.label("internship_title"),
+		ojt_status_column.label("ojt_status")
+	).join(
+		Student, Student.student_id == StudentSupervisorAssignment.student_id
+	).outerjoin(
+		InternshipApplication, InternshipApplication.application_id == StudentSupervisorAssignment.internship_application_id
+	).outerjoin(
+		Internship, Internship.internship_id == InternshipApplication.internship_id
+	).filter(
 		StudentSupervisorAssignment.supervisor_id == supervisor.supervisor_id,
 		StudentSupervisorAssignment.status == "active"
-	).all()
+	)
 	
-	students_data = []
-	for assignment in assignments:
-		# Get student details
-		student = db.query(Student).filter(
-			Student.student_id == assignment.student_id
-		).first()
-		
-		if not student:
-			continue
-		
-		# Get program name from student's class enrollment
-		program_name = student.program  # Try student's direct program field first
-		if not program_name:
-			# If student.program is null, get it from class enrollment
-			enrollment = db.query(ClassEnrollment).filter(
-				ClassEnrollment.student_id == student.student_id,
-				ClassEnrollment.status == "active"
-			).first()
-			
-			if enrollment and enrollment.class_enrolled:
-				program = db.query(Program).filter(
-					Program.program_id == enrollment.class_enrolled.program_id
-				).first()
-				if program:
-					program_name = program.program_name
-		
-		# Get application and internship details if available
-		internship_title = None
-		ojt_status = "Not Started"
-		
-		if assignment.internship_application_id:
-			application = db.query(InternshipApplication).filter(
-				InternshipApplication.application_id == assignment.internship_application_id
-			).first()
-			
-			if application:
-				# Determine OJT status based on application status and start date
-				if application.status == "accepted" and application.ojt_start_date:
-					# Handle both date and datetime objects
-					current_date = philippine_now().date()
-					ojt_start = application.ojt_start_date
-					# Convert to date if it's a datetime object
-					if hasattr(ojt_start, 'date'):
-						ojt_start = ojt_start.date()
-					
-					if ojt_start <= current_date:
-						ojt_status = "In Progress"
-					else:
-						ojt_status = "Starting Soon"
-				elif application.status == "accepted":
-					ojt_status = "Accepted"
-				
-				# Get internship title
-				if application.internship_id:
-					from models import Internship
-					internship = db.query(Internship).filter(
-						Internship.internship_id == application.internship_id
-					).first()
-					if internship:
-						internship_title = internship.title
-		
-		students_data.append({
-			"assignment_id": assignment.assignment_id,
-			"student_id": student.student_id,
-			"student_number": student.sr_code,
-			"first_name": student.first_name,
-			"last_name": student.last_name,
-			"email": student.email,
-			"program": program_name,
-			"internship_title": internship_title,
-			"ojt_status": ojt_status,
-			"assigned_at": assignment.assigned_at.isoformat() if assignment.assigned_at else None,
-			"status": assignment.status
-		})
+	if ojt_status:
+		query = query.filter(ojt_status_column == ojt_status)
+	
+	query = query.order_by(Student.last_name, Student.first_name, StudentSupervisorAssignment.assignment_id)
+	if page_size:
+		total = query.count()
+		rows = query.offset((page - 1) * page_size).limit(page_size).all()
+	else:
+		rows = query.all()
+		total = len(rows)
+	
+	students_data = [
+		{
+			"assignment_id": row.assignment_id,
+			"student_id": row.student_id,
+			"student_number": row.sr_code,
+			"first_name": row.first_name,
+			"last_name": row.last_name,
+			"email": row.email,
+			"program": row.program,
+			"internship_title": row.internship_title,
+			"ojt_status": row.ojt_status,
+			"assigned_at": row.assigned_at.isoformat() if row.assigned_at else None,
+			"status": row.status
+		}
+		for row in rows
+	]
 	
 	return {
 		"status": "success",
-		"data": students_data
+		"data": students_data,
+		"pagination": {
+			"total": total,
+			"page": page if page_size else 1,
+			"page_size": page_size or total,
+			"total_pages": (total + page_size - 1) // page_size if page_size else 1
+		}
 	}
 
 
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional, List
+from typing import Optional, List, Dict
 from datetime import datetime
 
 
@@ -62,3 +62,13 @@ class ApplicationResponse(BaseModel):
 
 	class Config:
 		from_attributes = True
+
+
+class MatchResult(BaseModel):
+	match_score: float
+	match_label: str
+	is_recommended: bool
+	components: Dict[str, float] = {}  # Weighted mode only
+	skill_metrics: Dict[str, float] = {}  # Weighted mode only
+	skill_match_count: int = 0
+	total_required_skills: int = 0
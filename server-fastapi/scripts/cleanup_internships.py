@@ -1,15 +1,38 @@
 """
 Cleanup script to remove all internships for employer_id = 1
 Run this before generating new internships
+
+Usage:
+    python scripts/cleanup_internships.py                    # wipe employer_id = 1
+    python scripts/cleanup_internships.py --duplicates       # report near-duplicates
+    python scripts/cleanup_internships.py --duplicates --apply   # keep the oldest of each group
+                                                             # (same employer; postings in use are skipped)
 """
 
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
 from database import SessionLocal
 
+# Link rows deleted along with a duplicate posting; any other table
+# referencing internships means the posting is in use
+DELETED_WITH_POSTING = {"internship_skills"}
+
+
+def _internship_references():
+    """(table, column) pairs with a foreign key to internships.internship_id"""
+    import models
+    
+    internship_id = models.Internship.__table__.c.internship_id
+    return [
+        (table.name, fk.parent.name)
+        for table in models.Base.metadata.sorted_tables
+        for fk in table.foreign_keys
+        if fk.column is internship_id
+    ]
+
 def cleanup_internships(employer_id: int = 1):
     """Remove all internships and related data for specified employer"""
     db = SessionLocal()
@@ -72,5 +95,86 @@ def cleanup_internships(employer_id: int = 1):
         db.close()
 
 
+def cleanup_duplicate_internships(apply: bool = False):
+    """
+    Remove near-duplicate postings, keeping the oldest posting of each group
+
+    Groups only contain postings of the same employer. Duplicates referenced
+    by any other table (applications, job applications, student matches) are
+    left in place (reported, not deleted).
+    """
+    from ml_models.near_duplicates import duplicate_report
+    
+    db = SessionLocal()
+    
+    try:
+        print("🔍 Looking for near-duplicate internships")
+        print("="*70)
+        
+        report = duplicate_report(db)
+        duplicates = []
+        for group in report:
+            postings = sorted(group['internships'], key=lambda p: (p['created_at'] or '', p['internship_id']))
+            keep, group_duplicates = postings[0], postings[1:]
+            print(f"• Keep #{keep['internship_id']} {keep['title']} ({keep['company_name']}) - "
+                  f"{len(group_duplicates)} duplicate(s): {[p['internship_id'] for p in group_duplicates]}")
+            duplicates.extend(p['internship_id'] for p in group_duplicates)
+        
+        print("="*70)
+        if not duplicates:
+            print("✅ No near-duplicates found")
+            return
+        
+        # Never delete postings that are referenced (applications, alumni job
+        # applications, student matches, ...): the foreign keys cascade
+        references = [(t, c) for t, c in _internship_references() if t not in DELETED_WITH_POSTING]
+        in_use = {row[0] for row in db.execute(
+            text("\nUNION\n".join(
+                f"SELECT {column} FROM {table} WHERE {column} IN :ids" for table, column in references
+            )).bindparams(bindparam("ids", expanding=True)),
+            {"ids": duplicates}
+        )}
+        to_delete = [i for i in duplicates if i not in in_use]
+        if in_use:
+            print(f"⚠️  Skipping {len(in_use)} duplicate(s) in use by {', '.join(t for t, _ in references)}: {sorted(in_use)}")
+        
+        if not to_delete:
+            print("✅ Nothing to delete")
+            return
+        if not apply:
+            print(f"Found {len(to_delete)} deletable duplicate postings in {len(report)} groups (dry run, pass --apply to delete)")
+            return
+        
+        params = {"ids": to_delete}
+        for table in ("internship_skills", "internships"):
+            result = db.execute(
+                text(f"DELETE FROM {table} WHERE internship_id IN :ids").bindparams(bindparam("ids", expanding=True)),
+                params
+            )
+            print(f"✓ Deleted {result.rowcount} rows from {table}")
+        
+        db.commit()
+        print(f"✅ Removed {len(to_delete)} duplicate postings")
+        
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Error: {str(e)}")
+        import traceback
+        traceback.print_exc()
+    finally:
+        db.close()
+
+
 if __name__ == "__main__":
-    cleanup_internships(employer_id=1)
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Remove internships by employer or near-duplicate postings")
+    parser.add_argument("--employer-id", type=int, default=1)
+    parser.add_argument("--duplicates", action="store_true", help="Work on near-duplicate postings instead")
+    parser.add_argument("--apply", action="store_true", help="Delete duplicates (default is a dry run)")
+    args = parser.parse_args()
+    
+    if args.duplicates:
+        cleanup_duplicate_internships(apply=args.apply)
+    else:
+        cleanup_internships(employer_id=args.employer_id)
@@ -0,0 +1,94 @@
+"""
+Test query budgets of the list endpoints
+
+Each request loads a full page (50 rows) and must stay within a fixed number
+of SQL statements however many rows come back, so a relationship that falls
+back to per-row lazy loading fails here with the repeated query listed.
+"""
+import jwt
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from database import SessionLocal
+from middleware.auth import SECRET_KEY, ALGORITHM
+from models import User, Student, Employer, Internship, InternshipApplication
+from routes import internship, ojt_head_portal, jp_employer
+from utils.query_counter import assert_max_queries
+
+app = FastAPI()
+app.include_router(internship.router)
+app.include_router(ojt_head_portal.router)
+app.include_router(jp_employer.router)
+client = TestClient(app)
+
+db = SessionLocal()
+
+
+def auth_headers(user_id, role):
+    token = jwt.encode({"user_id": user_id, "role": role, "email": "test"}, SECRET_KEY, algorithm=ALGORITHM)
+    return {"Authorization": f"Bearer {token}"}
+
+
+def first_user_id(role):
+    user = db.query(User).filter(User.role == role).first()
+    return user.user_id if user else 1
+
+
+def check(title, max_queries, url, headers):
+    print("\n" + "="*70)
+    print(f"TEST: {title} (limit {max_queries} queries)")
+    print("="*70)
+
+    with assert_max_queries(max_queries, label=url) as counter:
+        response = client.get(url, headers=headers)
+
+    assert response.status_code == 200, response.text
+    rows = response.json().get("data") or []
+    print(f"✓ {len(rows) if isinstance(rows, list) else 'n/a'} rows in {counter.count} queries")
+
+
+# A student and an employer that have applications
+student = db.query(Student).join(
+    InternshipApplication, InternshipApplication.student_id == Student.student_id
+).first()
+employer = db.query(Employer).join(
+    Internship, Internship.employer_id == Employer.employer_id
+).join(
+    InternshipApplication, InternshipApplication.internship_id == Internship.internship_id
+).first()
+db.close()
+
+ojt_head = auth_headers(first_user_id("ojt_head"), "ojt_head")
+
+# count + page (employer and industry joined) + skills
+check("Internships list (OJT head)", 3, "/api/internships?pageSize=50", ojt_head)
+check("OJT head portal internships", 3, "/api/ojt-head/internships?pageSize=50", ojt_head)
+
+# count + page + skills
+check(
+    "Job placement postings",
+    3,
+    "/api/jp-officers/employers/job-postings?page_size=50",
+    auth_headers(first_user_id("job_placement_officer"), "job_placement_officer")
+)
+
+# employer + count + page (student, internship) + student skills + classes
+if employer:
+    check(
+        "Employer applications",
+        5,
+        "/api/internships/applications?pageSize=50",
+        auth_headers(employer.user_id, "employer")
+    )
+else:
+    print("\n⚠️ No employer with applications - skipped applications test")
+
+# student + applications (internship and employer joined)
+if student:
+    check("Student's own applications", 2, "/api/internships/my-applications", auth_headers(student.user_id, "student"))
+else:
+    print("\n⚠️ No student with applications - skipped my-applications test")
+
+print("\n" + "="*70)
+print("✓ TEST COMPLETE")
+print("="*70)
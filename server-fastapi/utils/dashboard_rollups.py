@@ -0,0 +1,309 @@
+"""
+Pre-aggregated dashboard statistics
+
+The dashboard statistics read from two rollup tables instead of joining
+applications, students, enrollments, programs and employers per request:
+
+- dashboard_application_rollups: enrolled applications counted per
+  (campus, program, industry, company, semester, school year, created month)
+- dashboard_program_rollups: enrolled students and internships applied to,
+  per program
+
+refresh_dashboard_rollups() rebuilds only the school years with applications
+created or updated since the last refresh, plus the years applications moved
+out of or were deleted from through the ORM (recorded in
+dashboard_stale_school_years by models._mark_stale_school_years), and
+everything once a full refresh is due. Full refreshes pick up what the
+incremental pass cannot see: applications deleted or moved to another school
+year by raw SQL, enrollment moves and employer industry changes. Until then,
+those show up to DASHBOARD_ROLLUP_FULL_REFRESH_SECONDS late.
+
+Every web worker starts run_refresh_loop (main.py), but only the worker
+holding the refresher advisory lock refreshes; when it exits the lock is
+released and another worker takes over on its next tick. The row lock on
+dashboard_rollup_state additionally keeps a cron refresh from overlapping.
+To refresh from cron instead (DASHBOARD_ROLLUP_REFRESH_SECONDS=0):
+
+    python -m utils.dashboard_rollups [--full]
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+from typing import Iterable, Optional
+
+from sqlalchemy import Integer, cast, delete, extract, func, insert, or_, select, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from config import DASHBOARD_ROLLUP_FULL_REFRESH_SECONDS
+from models import (
+    Class, ClassEnrollment, DashboardApplicationRollup, DashboardProgramRollup,
+    DashboardRollupState, DashboardStaleSchoolYear, Department, Employer, Internship,
+    InternshipApplication, Program
+)
+
+
+# Application statuses counted as interns (all spellings in use)
+ENROLLED_STATUSES = [
+    "accepted", "hired", "ongoing", "on_hold", "on hold",
+    "Accepted", "Hired", "Ongoing", "On Hold", "On_Hold"
+]
+
+STATE_ID = 1
+
+# pg_try_advisory_lock key held by the one worker running the refresh loop
+REFRESHER_LOCK_KEY = 7_301_049
+
+# Changes are looked up from slightly before the last refresh, so a write
+# committed just after the previous refresh read the table is not missed
+REFRESH_OVERLAP = timedelta(minutes=1)
+
+APPLICATION_ROLLUP_COLUMNS = [
+    "campus_id", "program_id", "industry_id", "employer_id", "semester", "school_year",
+    "created_year", "created_month", "application_count", "started_count"
+]
+PROGRAM_ROLLUP_COLUMNS = ["program_id", "campus_id", "student_count", "opportunity_count"]
+
+
+def _school_year_filter(column, school_years: Iterable[Optional[str]]):
+    """column IN school_years, where a None entry matches NULL"""
+    school_years = set(school_years)
+    known = [year for year in school_years if year is not None]
+    conditions = [column.in_(known)] if known else []
+    if None in school_years:
+        conditions.append(column.is_(None))
+    return or_(*conditions)
+
+
+def _application_rollup_select(school_years: Optional[Iterable[Optional[str]]] = None):
+    """
+    Enrolled applications grouped by the rollup keys
+
+    Each application is attributed to the campus and program of its
+    student's latest enrollment.
+    """
+    latest_enrollment = select(
+        ClassEnrollment.student_id,
+        func.max(ClassEnrollment.enrollment_id).label("enrollment_id")
+    ).group_by(ClassEnrollment.student_id).subquery()
+
+    keys = (
+        Department.campus_id,
+        Class.program_id,
+        Employer.industry_id,
+        Employer.employer_id,
+        InternshipApplication.semester,
+        InternshipApplication.school_year,
+        cast(extract("year", InternshipApplication.created_at), Integer),
+        cast(extract("month", InternshipApplication.created_at), Integer)
+    )
+    query = select(
+        *keys,
+        func.count(InternshipApplication.application_id),
+        func.count(InternshipApplication.ojt_start_date)
+    ).select_from(InternshipApplication).join(
+        Internship, InternshipApplication.internship_id == Internship.internship_id
+    ).join(
+        Employer, Internship.employer_id == Employer.employer_id
+    ).outerjoin(
+        latest_enrollment, InternshipApplication.student_id == latest_enrollment.c.student_id
+    ).outerjoin(
+        ClassEnrollment, ClassEnrollment.enrollment_id == latest_enrollment.c.enrollment_id
+    ).outerjoin(
+        Class, ClassEnrollment.class_id == Class.class_id
+    ).outerjoin(
+        Program, Class.program_id == Program.program_id
+    ).outerjoin(
+        Department, Program.department_id == Department.department_id
+    ).where(
+        InternshipApplication.status.in_(ENROLLED_STATUSES)
+    ).group_by(*keys)
+
+    if school_years is not None:
+        query = query.where(_school_year_filter(InternshipApplication.school_year, school_years))
+    return query
+
+
+def _program_rollup_select():
+    """Distinct enrolled students and internships they applied to, per program"""
+    return select(
+        Program.program_id,
+        Department.campus_id,
+        func.count(func.distinct(ClassEnrollment.student_id)),
+        func.count(func.distinct(InternshipApplication.internship_id))
+    ).select_from(Program).outerjoin(
+        Department, Program.department_id == Department.department_id
+    ).outerjoin(
+        Class, Program.program_id == Class.program_id
+    ).outerjoin(
+        ClassEnrollment, Class.class_id == ClassEnrollment.class_id
+    ).outerjoin(
+        InternshipApplication, ClassEnrollment.student_id == InternshipApplication.student_id
+    ).group_by(Program.program_id, Department.campus_id)
+
+
+def refresh_dashboard_rollups(db: Session, full: bool = False) -> Optional[str]:
+    """
+    Bring the dashboard rollups up to date and commit
+
+    Args:
+        db: Session (committed on success)
+        full: Rebuild everything even if a full refresh is not due yet
+
+    Returns:
+        "full" or "incremental", or None if another process is refreshing
+    """
+    started_at = datetime.utcnow()
+
+    # Lock the state row; a concurrent refresh holds it, so skip
+    state = db.query(DashboardRollupState).filter(
+        DashboardRollupState.state_id == STATE_ID
+    ).with_for_update(skip_locked=True).first()
+    if state is None:
+        try:
+            state = DashboardRollupState(state_id=STATE_ID)
+            db.add(state)
+            db.flush()
+        except IntegrityError:
+            db.rollback()
+            return None
+
+    full = full or state.full_refreshed_at is None or state.refreshed_at is None or (
+        started_at - state.full_refreshed_at >= timedelta(seconds=DASHBOARD_ROLLUP_FULL_REFRESH_SECONDS)
+    )
+
+    # Years applications moved out of or were deleted from (models._mark_stale_school_years)
+    stale = db.query(DashboardStaleSchoolYear.stale_id, DashboardStaleSchoolYear.school_year).all()
+    if stale:
+        db.query(DashboardStaleSchoolYear).filter(
+            DashboardStaleSchoolYear.stale_id.in_([row.stale_id for row in stale])
+        ).delete(synchronize_session=False)
+
+    applications = DashboardApplicationRollup.__table__
+    if full:
+        db.execute(delete(applications))
+        db.execute(insert(applications).from_select(
+            APPLICATION_ROLLUP_COLUMNS, _application_rollup_select()
+        ))
+        state.full_refreshed_at = started_at
+    else:
+        changed = db.query(InternshipApplication.school_year).filter(
+            InternshipApplication.updated_at >= state.refreshed_at - REFRESH_OVERLAP
+        ).distinct().all()
+        school_years = {row.school_year for row in changed} | {row.school_year for row in stale}
+        if not school_years:
+            state.refreshed_at = started_at
+            db.commit()
+            return "incremental"
+
+        db.execute(delete(applications).where(
+            _school_year_filter(applications.c.school_year, school_years)
+        ))
+        db.execute(insert(applications).from_select(
+            APPLICATION_ROLLUP_COLUMNS, _application_rollup_select(school_years)
+        ))
+
+    # One row per program: cheap enough to rebuild on every change
+    programs = DashboardProgramRollup.__table__
+    db.execute(delete(programs))
+    db.execute(insert(programs).from_select(PROGRAM_ROLLUP_COLUMNS, _program_rollup_select()))
+
+    state.refreshed_at = started_at
+    db.commit()
+    return "full" if full else "incremental"
+
+
+def ensure_dashboard_rollups(db: Session) -> Optional[datetime]:
+    """
+    Build the rollups if they have never been built
+
+    Returns when they were last refreshed (None while another process is
+    building them for the first time).
+    """
+    state = db.get(DashboardRollupState, STATE_ID)
+    if state is None or state.full_refreshed_at is None:
+        refresh_dashboard_rollups(db, full=True)
+        state = db.get(DashboardRollupState, STATE_ID)
+    return state.refreshed_at if state else None
+
+
+def refresh_in_new_session(full: bool = False) -> Optional[str]:
+    """refresh_dashboard_rollups() in a session of its own"""
+    from database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        return refresh_dashboard_rollups(db, full=full)
+    finally:
+        db.close()
+
+
+def _acquire_refresher_lock() -> Optional[Connection]:
+    """
+    Connection holding the refresher lock, or None if another process holds it
+
+    The lock is session-level: it stays held (outside any transaction) for as
+    long as the connection is open.
+    """
+    from database import engine
+
+    conn = engine.connect()
+    if conn.dialect.name != "postgresql":
+        # Single-process development database
+        return conn
+    try:
+        acquired = conn.execute(text("SELECT pg_try_advisory_lock(:key)"), {"key": REFRESHER_LOCK_KEY}).scalar()
+        conn.commit()
+    except Exception:
+        conn.close()
+        raise
+    if not acquired:
+        conn.close()
+        return None
+    return conn
+
+
+def _still_connected(conn: Connection) -> bool:
+    """Whether the lock connection is still open (closing it if not)"""
+    try:
+        conn.execute(text("SELECT 1"))
+        conn.commit()
+        return True
+    except Exception:
+        conn.close()
+        return False
+
+
+async def run_refresh_loop(interval_seconds: float):
+    """
+    Refresh the rollups every interval_seconds until cancelled, while this
+    process holds the refresher lock (tried again on every tick until then)
+    """
+    lock_conn = None
+    try:
+        while True:
+            try:
+                if lock_conn is not None and not await asyncio.to_thread(_still_connected, lock_conn):
+                    # The lock went away with the connection; compete for it again
+                    lock_conn = None
+                if lock_conn is None:
+                    lock_conn = await asyncio.to_thread(_acquire_refresher_lock)
+                if lock_conn is not None:
+                    await asyncio.to_thread(refresh_in_new_session)
+            except Exception as e:
+                print(f"⚠️ Dashboard rollup refresh failed: {e}")
+            await asyncio.sleep(interval_seconds)
+    finally:
+        if lock_conn is not None:
+            lock_conn.close()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Refresh the dashboard rollup tables")
+    parser.add_argument("--full", action="store_true", help="Rebuild all school years")
+    args = parser.parse_args()
+    result = refresh_in_new_session(full=args.full)
+    print(f"✅ Dashboard rollups refreshed ({result})" if result else "Another process is refreshing the rollups")
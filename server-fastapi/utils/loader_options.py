@@ -0,0 +1,40 @@
+"""
+Relationship loader-option presets for list endpoints
+
+Each preset is a tuple of loader options for query.options(*PRESET). With a
+preset, a page of rows takes a fixed number of queries, not one lazy load
+per row and relationship:
+
+- many-to-one relationships (internship -> employer -> industry) are joined
+  into the main query
+- collections (skills) use selectinload, one extra IN query per collection.
+  Unlike a joined collection, this does not multiply rows, so LIMIT/OFFSET
+  still pages over the parent rows
+"""
+
+from sqlalchemy.orm import joinedload, selectinload
+
+from models import Employer, Internship, InternshipApplication, Student
+
+
+# Internship / job posting rows: company, industry and required skills
+INTERNSHIP_LISTING = (
+    joinedload(Internship.employer).joinedload(Employer.industry),
+    selectinload(Internship.skills),
+)
+
+# Students with their skills
+STUDENT_WITH_SKILLS = (
+    selectinload(Student.skills),
+)
+
+# Applications: the applicant (with skills) and the posting
+APPLICATION_LISTING = (
+    joinedload(InternshipApplication.student).selectinload(Student.skills),
+    joinedload(InternshipApplication.internship),
+)
+
+# Applications with the posting's company (student-side lists)
+APPLICATION_WITH_POSTING = (
+    joinedload(InternshipApplication.internship).joinedload(Internship.employer),
+)
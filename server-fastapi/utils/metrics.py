@@ -0,0 +1,45 @@
+"""
+Lightweight in-process metrics
+"""
+
+import threading
+from typing import Dict, Sequence
+
+
+class Histogram:
+    """Thread-safe fixed-bucket histogram (cumulative, Prometheus style)"""
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(buckets)
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        with self._lock:
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    self._counts[i] += 1
+                    break
+            else:
+                self._counts[-1] += 1
+            self._sum += value
+            self._count += 1
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            counts, total, count = list(self._counts), self._sum, self._count
+
+        cumulative, running = {}, 0
+        for bound, n in zip(self.buckets, counts):
+            running += n
+            cumulative[str(bound)] = running
+        cumulative['+Inf'] = count
+
+        return {
+            'buckets': cumulative,
+            'count': count,
+            'sum': round(total, 4),
+            'mean': round(total / count, 4) if count else 0.0
+        }
@@ -0,0 +1,67 @@
+"""
+SQL statement counting for N+1 checks
+
+Counts the statements an engine executes while a block runs, e.g. around a
+TestClient call:
+
+    with assert_max_queries(4):
+        client.get("/api/internships?pageSize=50", headers=headers)
+
+The assertion fails with the captured statements listed, so a regression
+to per-row lazy loading shows exactly which query repeats.
+"""
+
+import threading
+from contextlib import contextmanager
+from typing import List, Optional
+
+from sqlalchemy import event
+
+
+class QueryCounter:
+    """Context manager recording every statement executed on an engine"""
+
+    def __init__(self, engine=None):
+        if engine is None:
+            from database import engine
+        # Async engines are instrumented through their sync core
+        self.engine = getattr(engine, "sync_engine", engine)
+        self.statements: List[str] = []
+        self._lock = threading.Lock()
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        with self._lock:
+            self.statements.append(statement)
+
+    def __enter__(self) -> "QueryCounter":
+        event.listen(self.engine, "before_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, *exc_info):
+        event.remove(self.engine, "before_cursor_execute", self._record)
+        return False
+
+
+@contextmanager
+def assert_max_queries(max_queries: int, engine=None, label: Optional[str] = None):
+    """
+    Fail if the block executes more than max_queries statements
+
+    Args:
+        max_queries: Upper bound on statements
+        engine: Engine to watch (default: database.engine)
+        label: Name used in the failure message (e.g. the endpoint)
+    """
+    counter = QueryCounter(engine)
+    with counter:
+        yield counter
+
+    if counter.count > max_queries:
+        listing = "\n".join(f"  {i + 1}. {' '.join(s.split())[:200]}" for i, s in enumerate(counter.statements))
+        raise AssertionError(
+            f"{label or 'Block'} executed {counter.count} queries (limit {max_queries}):\n{listing}"
+        )
@@ -0,0 +1,138 @@
+"""
+Employer work schedule parsing and time log validation
+
+Employer.work_schedule is a JSON object keyed by weekday name, e.g.
+{"Monday": {"start": "08:00", "end": "17:00"}, "Saturday": null}. Days that
+are missing or null are non-working days.
+
+Schedules are parsed once per distinct JSON string (LRU cache), so roster
+and log endpoints can validate many logs without re-parsing per student.
+WorkSchedule.valid_log_clause() expresses the same check as SQL, for
+queries that aggregate valid hours in the database.
+"""
+
+import json
+from datetime import datetime, time
+from functools import lru_cache
+from typing import Dict, NamedTuple, Optional
+
+from sqlalchemy import and_, extract, not_, or_
+
+
+class DayHours(NamedTuple):
+    start: Optional[time]  # None when the day has no (valid) hours: any time is accepted
+    end: Optional[time]
+    start_text: Optional[str]
+    end_text: Optional[str]
+
+
+# Weekday names by SQL day-of-week number (extract('dow'): 0 = Sunday)
+WEEKDAY_NUMBERS = {
+    'Sunday': 0, 'Monday': 1, 'Tuesday': 2, 'Wednesday': 3,
+    'Thursday': 4, 'Friday': 5, 'Saturday': 6
+}
+
+
+def _parse_time(value: str) -> time:
+    parts = value.split(':')
+    return time(int(parts[0]), int(parts[1]))
+
+
+def _seconds_of_day(column):
+    return extract('hour', column) * 3600 + extract('minute', column) * 60 + extract('second', column)
+
+
+class WorkSchedule:
+    """Parsed work schedule"""
+
+    def __init__(self, days: Dict[str, DayHours]):
+        self.days = days
+
+    def log_warning(self, time_in: Optional[datetime], time_out: Optional[datetime]) -> Optional[str]:
+        """
+        Why a time log falls outside the schedule, or None if it is valid
+
+        A log is invalid on a non-working day, when it ends before work hours
+        start, starts after they end, or has the same time-in and time-out.
+        """
+        if not time_in:
+            return None
+
+        log_day = time_in.strftime('%A')
+        hours = self.days.get(log_day)
+        if hours is None:
+            return f"{log_day} is not a working day"
+        if hours.start is None or hours.end is None or not time_out:
+            return None
+
+        time_in_time = time_in.time()
+        time_out_time = time_out.time()
+        if time_out_time < hours.start:
+            return f"Time-out before work hours (starts at {hours.start_text})"
+        if time_in_time > hours.end:
+            return f"Time-in after work hours (ends at {hours.end_text})"
+        if time_in_time == time_out_time:
+            return "Time-in and time-out are the same"
+        return None
+
+    def valid_log_clause(self, time_in_column, time_out_column):
+        """SQL condition that is true for the logs log_warning() accepts"""
+        time_in_seconds = _seconds_of_day(time_in_column)
+        time_out_seconds = _seconds_of_day(time_out_column)
+        day_of_week = extract('dow', time_in_column)
+
+        valid_days = []
+        for day, number in WEEKDAY_NUMBERS.items():
+            hours = self.days.get(day)
+            if hours is None:
+                continue  # Non-working day: never valid
+            if hours.start is None or hours.end is None:
+                valid_days.append(day_of_week == number)
+                continue
+            start_seconds = hours.start.hour * 3600 + hours.start.minute * 60
+            end_seconds = hours.end.hour * 3600 + hours.end.minute * 60
+            valid_days.append(and_(
+                day_of_week == number,
+                or_(
+                    time_out_column.is_(None),
+                    not_(or_(
+                        time_out_seconds < start_seconds,
+                        time_in_seconds > end_seconds,
+                        time_in_seconds == time_out_seconds
+                    ))
+                )
+            ))
+        return or_(time_in_column.is_(None), *valid_days)
+
+
+@lru_cache(maxsize=1024)
+def parse_work_schedule(raw: Optional[str]) -> Optional[WorkSchedule]:
+    """
+    Parse an Employer.work_schedule JSON string
+
+    Returns None when there is nothing to validate against (no schedule,
+    invalid JSON or an empty object).
+    """
+    if not raw:
+        return None
+    try:
+        data = json.loads(raw)
+    except (json.JSONDecodeError, TypeError):
+        return None
+    if not data or not isinstance(data, dict):
+        return None
+
+    days = {}
+    for day, hours in data.items():
+        if hours is None:
+            continue  # Non-working day
+        start = end = None
+        start_text = end_text = None
+        if isinstance(hours, dict) and hours.get('start') and hours.get('end'):
+            start_text, end_text = hours['start'], hours['end']
+            try:
+                start, end = _parse_time(start_text), _parse_time(end_text)
+            except (ValueError, IndexError, AttributeError):
+                start = end = None
+        days[day] = DayHours(start, end, start_text, end_text)
+    return WorkSchedule(days)